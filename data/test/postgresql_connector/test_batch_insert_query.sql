@@ -0,0 +1,5 @@
+/*
+ * Test query to insert a batch of values into a table
+ */
+INSERT INTO test_table_batch (row_id, display_name)
+VALUES (%(row_id)s, %(display_name)s);
\ No newline at end of file
@@ -0,0 +1,6 @@
+/*
+ * Test query to select a batch of values in a table
+ */
+SELECT row_id, display_name
+FROM test_table_batch
+WHERE row_id = %(row_id)s;
\ No newline at end of file
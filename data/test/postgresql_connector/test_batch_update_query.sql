@@ -0,0 +1,6 @@
+/*
+ * Test query to update a batch of values in a table
+ */
+UPDATE test_table_batch
+SET display_name = %(display_name)s
+WHERE row_id = %(row_id)s;
\ No newline at end of file
@@ -0,0 +1,6 @@
+/*
+ * Test query to read a table in partitions
+ */
+SELECT row_id, created_at, display_name
+FROM test_table_partition
+WHERE display_name LIKE 'name_%';
\ No newline at end of file
@@ -0,0 +1,5 @@
+/*
+ * Test query to stream a generated series of rows
+ */
+SELECT g AS row_id, 'name_' || g AS display_name
+FROM generate_series(1, %(n_rows)s) AS g;
\ No newline at end of file
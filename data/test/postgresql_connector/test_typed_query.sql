@@ -0,0 +1,12 @@
+/*
+ * Test query to select columns of several types, with NULL values
+ */
+SELECT
+    g::int4 AS row_id,
+    CASE WHEN g %% 2 = 1 THEN g::int8 END AS odd_id,
+    g / 2.0::float8 AS score,
+    g %% 2 = 0 AS is_even,
+    timestamp '2024-01-01' + g * interval '1 day' AS created_at,
+    timestamptz '2024-01-01 00:00:00+00' + g * interval '1 hour' AS updated_at,
+    'name_' || g AS display_name
+FROM generate_series(1, %(n_rows)s) AS g;
\ No newline at end of file
@@ -4,19 +4,41 @@ interact with BigQuery datasets and tables.
 """
 
 # Import Standard Modules
+import io
 import logging
+import tempfile
+import time
+import uuid
+from collections import deque
 from pathlib import Path
-from typing import Union, List
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union, List
 import pandas as pd
-from google.cloud import bigquery
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery, bigquery_storage
+from google.cloud.bigquery.table import RowIterator
 
 # Import Package Modules
+from data_grimorium.bigquery_connector.bigquery_result_cache import BigQueryResultCache
 from data_grimorium.bigquery_connector.bigquery_types import (
+    BQBatchConfig,
     BQClientConfig,
+    BQDryRunResult,
+    BQJobResult,
+    BQMetadataCacheConfig,
     BQQueryParameter,
     BQQueryConfig,
+    BQResultCacheConfig,
+    BQStorageReadConfig,
+    BQStreamConfig,
+    BQTableMetadata,
+    BQUploadConfig,
+    BQWriteMode,
 )
-from data_grimorium.general_utils.general_utils import read_file_from_path
+from data_grimorium.general_utils.general_utils import read_file_from_path, write_parquet_chunks
+from data_grimorium.general_utils.general_utils_types import ParquetSpillConfig, ParquetSpillHandle
+from data_grimorium.general_utils.metadata_cache import MetadataCache
 
 # Setup logging
 logging.basicConfig(
@@ -35,24 +57,58 @@ class BigQueryConnector:
         _root_path (pathlib.Path): Root path of the project
         _client_config (BQClientConfig): Configurations for instance a BigQuery Client instance
         _client (bigquery.Client): BigQuery client object
+        _storage_read_config (BQStorageReadConfig): Configurations of the Storage Read API
+        _bqstorage_client (bigquery_storage.BigQueryReadClient): Storage Read API client (created on first use)
+        _result_cache_config (BQResultCacheConfig): Configurations of the local result cache
+        _result_cache (BigQueryResultCache): Local result cache (None if disabled)
+        _metadata_cache (MetadataCache): Cache of the table metadata
 
     Methods:
         execute_query_from_config: Execute a query from local path and with a certain set of parameter configurations.
+        dry_run_from_config: Estimate the bytes processed by a query from local path without running it.
+        execute_queries_from_config: Execute several queries from local paths as concurrent jobs.
+        stream_query_from_config: Execute a query from local path and yield its result in chunks.
+        invalidate_result_cache: Remove all the results of the local result cache.
         table_exists: Check if a table exists in a dataset
+        get_table_metadata: Retrieve the schema, size and modification time of a table.
+        invalidate_metadata_cache: Remove the cached table metadata.
+        upload_dataframe: Upload a DataFrame to a table through Parquet load jobs.
         wrap_dictionary_to_query_config: Converts a dictionary of Query Configurations into a ``BQQueryConfig`` object.
     """
 
-    def __init__(self, client_config: BQClientConfig, root_path: Path):
+    def __init__(
+        self,
+        client_config: BQClientConfig,
+        root_path: Path,
+        storage_read_config: Optional[BQStorageReadConfig] = None,
+        result_cache_config: Optional[BQResultCacheConfig] = None,
+        metadata_cache_config: Optional[BQMetadataCacheConfig] = None,
+    ):
         """
         Constructor of the class BigqueryConnector
 
         Args:
             client_config (BQClientConfig): Config for instance a BigQuery Client
             root_path (Path): Root path to the project
+            storage_read_config (Optional[BQStorageReadConfig]): Config for the Storage Read API
+            result_cache_config (Optional[BQResultCacheConfig]): Config for the local result cache
+                (disabled if None)
+            metadata_cache_config (Optional[BQMetadataCacheConfig]): Config for the metadata cache
         """
         # Initialise attributes
         self._client_config = client_config
         self._root_path = root_path
+        self._storage_read_config = storage_read_config or BQStorageReadConfig()
+        self._bqstorage_client = None
+        self._result_cache_config = result_cache_config
+        self._result_cache = (
+            BigQueryResultCache(root_path / result_cache_config.cache_dir, result_cache_config)
+            if result_cache_config is not None
+            else None
+        )
+        self._metadata_cache = MetadataCache(
+            (metadata_cache_config or BQMetadataCacheConfig()).ttl_seconds
+        )
 
         # Set the client
         self._set_client()
@@ -66,6 +122,38 @@ class BigQueryConnector:
         # Set the client
         self._client = bigquery.Client(project=self._client_config.project_id)
 
+    def _get_bqstorage_client(
+        self, result: RowIterator
+    ) -> Optional[bigquery_storage.BigQueryReadClient]:
+        """
+        Retrieve the Storage Read API client to download a query result, creating it on first use.
+        Small results are read through the REST endpoint, since opening the read
+        session would cost more than the download itself.
+
+        Args:
+            result (RowIterator): Result of a query job
+
+        Returns:
+            (Optional[bigquery_storage.BigQueryReadClient]): The client or None to use the REST endpoint
+        """
+        # Check if the result is worth a read session
+        if not self._storage_read_config.enabled or (
+            result.total_rows is not None
+            and result.total_rows <= self._storage_read_config.rest_max_rows
+        ):
+            logging.info(f"🐢 Read {result.total_rows} rows through the REST endpoint")
+            return None
+
+        if self._bqstorage_client is None:
+            logging.info("💼 Set the BigQuery Storage Read API client")
+
+            # Use the application default credentials, as the BigQuery client does
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient()
+
+        logging.info(f"🚀 Read {result.total_rows} rows through the Storage Read API")
+
+        return self._bqstorage_client
+
     @staticmethod
     def _build_query_parameters(
         query_parameters: List[BQQueryParameter],
@@ -104,24 +192,19 @@ class BigQueryConnector:
 
         return bigquery_query_parameters
 
-    def execute_query_from_config(self, query_config: BQQueryConfig) -> Union[pd.DataFrame, bool]:
+    def _read_query(
+        self, query_config: BQQueryConfig
+    ) -> Tuple[str, List[Union[bigquery.ArrayQueryParameter, bigquery.ScalarQueryParameter]]]:
         """
-        Execute a query from local path and with a certain set of parameter configurations.
-        The query can either read data or create a table on BigQuery.
+        Read a query from local path and build its parameters (if present).
 
         Args:
             query_config (BQQueryConfig): Query configurations (path and parameters)
 
         Returns:
-            result (Union[pd.DataFrame, bool]): The result of the query execution.
-
-                  - pd.DataFrame: When the query is executed successfully and returns data.
-
-                  - bool: `True` if the query executes successfully but does not return data
+            (Tuple[str, List[Union[ArrayQueryParameter, ScalarQueryParameter]]]):
+            The query and its BigQuery parameters
         """
-        # Initialise result to return
-        result = None
-
         # Retrieve query path
         query_path = Path(query_config.query_path)
 
@@ -130,36 +213,515 @@ class BigQueryConnector:
 
         # Check if there are parameters
         if query_config.query_parameters is None:
+            return query, []
+
+        return query, self._build_query_parameters(query_config.query_parameters)
+
+    def _submit_query(
+        self,
+        query: str,
+        parameters: List[Union[bigquery.ArrayQueryParameter, bigquery.ScalarQueryParameter]],
+        maximum_bytes_billed: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> bigquery.QueryJob:
+        """
+        Submit a query as a BigQuery job. The job runs asynchronously.
+        BigQuery fails the job before running it when it would bill more than
+        ``maximum_bytes_billed`` bytes.
+
+        Args:
+            query (str): Query to run
+            parameters (List[Union[ArrayQueryParameter, ScalarQueryParameter]]): Query parameters
+            maximum_bytes_billed (Optional[int]): Maximum number of bytes billed by the job
+            dry_run (bool): Flag to only validate the query and estimate the bytes processed
+
+        Returns:
+            (bigquery.QueryJob): The submitted job
+        """
+        # Check if a job configuration is needed
+        if not parameters and maximum_bytes_billed is None and not dry_run:
             # Execute the job in BigQuery
             job = self._client.query(query)
         else:
-            # Retrieve BigQuery query parameters
-            parameters = self._build_query_parameters(query_config.query_parameters)
+            job_config = bigquery.QueryJobConfig(query_parameters=parameters)
+            if maximum_bytes_billed is not None:
+                job_config.maximum_bytes_billed = maximum_bytes_billed
+            if dry_run:
+                # Skip the query cache in order to estimate the scanned bytes
+                job_config.dry_run = True
+                job_config.use_query_cache = False
 
-            # Execute the job BigQuery with parameters
-            job = self._client.query(
-                query=query,
-                job_config=bigquery.QueryJobConfig(query_parameters=parameters),
-            )
+            # Execute the job BigQuery with parameters and limits
+            job = self._client.query(query=query, job_config=job_config)
+
+        return job
+
+    def _get_cached_result(self, cache_key: str) -> Optional[pd.DataFrame]:
+        """
+        Retrieve a result from the local result cache. When ``check_source_tables`` is set,
+        the result is invalidated if any of its source tables was modified since it was cached.
 
-        # Extract the job result
-        result = job.result()
+        Args:
+            cache_key (str): Key of the result
+
+        Returns:
+            (Optional[pd.DataFrame]): The cached result or None if missing, expired or stale
+        """
+        cached = self._result_cache.get(cache_key)
+        if cached is None:
+            return None
+        table, source_tables = cached
+
+        # Compare the modification time of the source tables
+        if self._result_cache_config.check_source_tables:
+            for table_id, modified in source_tables.items():
+                metadata = self.get_table_metadata(table_id, refresh=True)
+                if metadata is None or str(metadata.modified) != modified:
+                    logging.info(f"♻️ Source table {table_id} modified, discard cached result")
+                    self._result_cache.invalidate(cache_key)
+                    return None
+
+        logging.info(f"✅ Retrieved {table.num_rows} rows from the result cache")
+
+        return table.to_pandas()
+
+    def _set_cached_result(
+        self, cache_key: str, data: pd.DataFrame, job: bigquery.QueryJob
+    ) -> None:
+        """
+        Store a result in the local result cache, with the modification time of its source tables.
+
+        Args:
+            cache_key (str): Key of the result
+            data (pd.DataFrame): Result of the query
+            job (bigquery.QueryJob): Job of the query
+        """
+        source_tables = {}
+        if self._result_cache_config.check_source_tables:
+            for reference in job.referenced_tables or []:
+                table_id = f"{reference.project}.{reference.dataset_id}.{reference.table_id}"
+                metadata = self.get_table_metadata(table_id)
+                if metadata is not None:
+                    source_tables[table_id] = str(metadata.modified)
+
+        self._result_cache.set(
+            cache_key, pa.Table.from_pandas(data, preserve_index=False), source_tables
+        )
+
+    def invalidate_result_cache(self) -> None:
+        """
+        Remove all the results of the local result cache.
+        """
+        if self._result_cache is not None:
+            logging.info("🧹 Invalidate the result cache")
+            self._result_cache.invalidate()
+
+    def _result_cache_key(
+        self,
+        query_config: BQQueryConfig,
+        query: str,
+        parameters: List[Union[bigquery.ArrayQueryParameter, bigquery.ScalarQueryParameter]],
+    ) -> Optional[str]:
+        """
+        Compute the key of a query in the local result cache.
+
+        Args:
+            query_config (BQQueryConfig): Query configurations (path and parameters)
+            query (str): Query to run
+            parameters (List[Union[ArrayQueryParameter, ScalarQueryParameter]]): Query parameters
+
+        Returns:
+            (Optional[str]): The key or None if the cache is disabled or the result
+            is written to ``local_path``
+        """
+        if self._result_cache is None or query_config.local_path:
+            return None
+
+        return self._result_cache.key(
+            query,
+            [parameter.to_api_repr() for parameter in parameters],
+            self._client_config.project_id,
+        )
+
+    def _collect_result(
+        self,
+        job: bigquery.QueryJob,
+        query_config: BQQueryConfig,
+        spill_config: ParquetSpillConfig,
+        cache_key: Optional[str] = None,
+    ) -> Union[pd.DataFrame, bool, ParquetSpillHandle]:
+        """
+        Wait for a query job and collect its result: the table creation status,
+        the data or the handle of the Parquet dataset written to ``local_path``.
+
+        Args:
+            job (bigquery.QueryJob): Job of the query
+            query_config (BQQueryConfig): Query configurations (path and parameters)
+            spill_config (ParquetSpillConfig): Row group size, partitioning and
+                compression of the Parquet dataset written to ``local_path``
+            cache_key (Optional[str]): Key of the data in the local result cache
+
+        Returns:
+            (Union[pd.DataFrame, bool, ParquetSpillHandle]): The result of the query execution
+        """
+        # Extract the job result, in pages of a row group when writing to Parquet
+        result = job.result(
+            page_size=spill_config.row_group_size if query_config.local_path else None
+        )
 
         # Switch between a read query and a table creation query
         if job.statement_type == "CREATE_TABLE_AS_SELECT":
             # Return table creation status
             result = job.done()
 
+            # The table may have been replaced
+            self.invalidate_metadata_cache()
+
             logging.info("✅ Table created")
 
+        elif query_config.local_path:
+            # Stream the pages into Parquet files
+            result = write_parquet_chunks(
+                result.to_arrow_iterable(
+                    bqstorage_client=self._get_bqstorage_client(result),
+                    max_stream_count=self._storage_read_config.max_stream_count,
+                ),
+                self._root_path / query_config.local_path,
+                spill_config,
+            )
+
+            logging.info(f"✅ Written {result.rows} rows to {result.path}")
+
         else:
-            # Convert data to a Pandas DataFrame
-            result = result.to_dataframe()
+            # Convert data to a Pandas DataFrame, through the Storage Read API for large results
+            result = result.to_dataframe(
+                bqstorage_client=self._get_bqstorage_client(result),
+                create_bqstorage_client=False,
+            )
+
+            # Cache the data of read queries only
+            if cache_key is not None and job.statement_type == "SELECT":
+                self._set_cached_result(cache_key, result, job)
 
             logging.info(f"✅ Retrieved {len(result)} rows")
 
         return result
 
+    def execute_query_from_config(
+        self, query_config: BQQueryConfig, spill_config: Optional[ParquetSpillConfig] = None
+    ) -> Union[pd.DataFrame, bool, ParquetSpillHandle]:
+        """
+        Execute a query from local path and with a certain set of parameter configurations.
+        The query can either read data or create a table on BigQuery.
+        When the query configuration has a ``local_path``, the read data is streamed page by page
+        into a Parquet dataset in that directory and a handle is returned instead of the data.
+
+        Args:
+            query_config (BQQueryConfig): Query configurations (path and parameters)
+            spill_config (Optional[ParquetSpillConfig]): Row group size, partitioning and
+                compression of the Parquet dataset written to ``local_path``
+
+        Returns:
+            result (Union[pd.DataFrame, bool, ParquetSpillHandle]): The result of the query execution.
+
+                  - pd.DataFrame: When the query is executed successfully and returns data.
+
+                  - bool: `True` if the query executes successfully but does not return data
+
+                  - ParquetSpillHandle: When the returned data is written to ``local_path``
+        """
+        spill_config = spill_config or ParquetSpillConfig()
+
+        # Read the query
+        query, parameters = self._read_query(query_config)
+
+        # Look up the result cache
+        cache_key = self._result_cache_key(query_config, query, parameters)
+        if cache_key is not None:
+            result = self._get_cached_result(cache_key)
+            if result is not None:
+                return result
+
+        # Submit the query job
+        job = self._submit_query(query, parameters, query_config.maximum_bytes_billed)
+
+        return self._collect_result(job, query_config, spill_config, cache_key)
+
+    def dry_run_from_config(self, query_config: BQQueryConfig) -> BQDryRunResult:
+        """
+        Validate a query from local path without running it, in order to estimate
+        the bytes it would process and retrieve the tables it references. Dry runs are free.
+
+        Args:
+            query_config (BQQueryConfig): Query configurations (path and parameters)
+
+        Returns:
+            (BQDryRunResult): Estimated bytes processed, referenced tables and statement type
+        """
+        # Read the query
+        query, parameters = self._read_query(query_config)
+
+        # Submit the dry run, which completes immediately
+        job = self._submit_query(query, parameters, dry_run=True)
+
+        dry_run_result = BQDryRunResult(
+            total_bytes_processed=job.total_bytes_processed or 0,
+            referenced_tables=[
+                f"{reference.project}.{reference.dataset_id}.{reference.table_id}"
+                for reference in job.referenced_tables or []
+            ],
+            statement_type=job.statement_type,
+        )
+
+        logging.info(
+            f"🔍 Query {query_config.query_path} would process "
+            f"{dry_run_result.total_bytes_processed} bytes "
+            f"from {len(dry_run_result.referenced_tables)} tables"
+        )
+
+        # Compare the estimate with the budget of the query
+        if (
+            query_config.maximum_bytes_billed is not None
+            and dry_run_result.total_bytes_processed > query_config.maximum_bytes_billed
+        ):
+            logging.warning(
+                f"⚠️ The estimate exceeds the budget of {query_config.maximum_bytes_billed} bytes"
+            )
+
+        return dry_run_result
+
+    def execute_queries_from_config(
+        self,
+        query_configs: Sequence[BQQueryConfig],
+        batch_config: Optional[BQBatchConfig] = None,
+        spill_config: Optional[ParquetSpillConfig] = None,
+    ) -> List[BQJobResult]:
+        """
+        Execute several queries from local paths as concurrent BigQuery jobs. Up to
+        ``max_concurrent_jobs`` jobs are submitted at once and polled together, and the result
+        of each job is collected as soon as it completes, while the next ones are submitted.
+        With the ``fail_fast`` policy the first failure cancels the running jobs and is raised,
+        with the ``collect`` policy the error is stored in the result of the query.
+
+        Args:
+            query_configs (Sequence[BQQueryConfig]): Query configurations (path and parameters)
+            batch_config (Optional[BQBatchConfig]): Concurrency, failure policy and poll interval
+            spill_config (Optional[ParquetSpillConfig]): Row group size, partitioning and
+                compression of the Parquet datasets written to ``local_path``
+
+        Returns:
+            (List[BQJobResult]): The result and timing of each query, in order
+        """
+        batch_config = batch_config or BQBatchConfig()
+        spill_config = spill_config or ParquetSpillConfig()
+
+        logging.info(
+            f"🚀 Execute {len(query_configs)} queries with up to "
+            f"{batch_config.max_concurrent_jobs} concurrent jobs"
+        )
+
+        results: List[Optional[BQJobResult]] = [None] * len(query_configs)
+        queue = deque(range(len(query_configs)))
+        running: Dict[int, Tuple[bigquery.QueryJob, float, Optional[str]]] = {}
+        start = time.perf_counter()
+
+        def record_failure(index: int, error: Exception, job_id: Optional[str] = None) -> None:
+            # Raise or collect the error depending on the failure policy
+            logging.error(f"❌ Query {query_configs[index].query_path} failed: {error}")
+            if batch_config.failure_policy == "fail_fast":
+                raise error
+            results[index] = BQJobResult(
+                query_path=query_configs[index].query_path, job_id=job_id, error=str(error)
+            )
+
+        try:
+            while queue or running:
+                # Submit the next jobs up to the concurrency bound
+                while queue and len(running) < batch_config.max_concurrent_jobs:
+                    index = queue.popleft()
+                    query_config = query_configs[index]
+                    try:
+                        query, parameters = self._read_query(query_config)
+
+                        # Look up the result cache
+                        cache_key = self._result_cache_key(query_config, query, parameters)
+                        cached = self._get_cached_result(cache_key) if cache_key else None
+                        if cached is not None:
+                            results[index] = BQJobResult(
+                                query_path=query_config.query_path, result=cached, cached=True
+                            )
+                            continue
+
+                        running[index] = (
+                            self._submit_query(
+                                query, parameters, query_config.maximum_bytes_billed
+                            ),
+                            time.perf_counter(),
+                            cache_key,
+                        )
+                    except Exception as e:
+                        record_failure(index, e)
+
+                # Poll the running jobs together
+                completed = [index for index, (job, _, _) in running.items() if job.done()]
+                if not completed:
+                    time.sleep(batch_config.poll_interval_seconds)
+                    continue
+
+                # Collect the results of the completed jobs
+                for index in completed:
+                    job, submitted_at, cache_key = running.pop(index)
+                    completed_at = time.perf_counter()
+                    try:
+                        result = self._collect_result(
+                            job, query_configs[index], spill_config, cache_key
+                        )
+                    except Exception as e:
+                        record_failure(index, e, job.job_id)
+                        continue
+
+                    results[index] = BQJobResult(
+                        query_path=query_configs[index].query_path,
+                        job_id=job.job_id,
+                        result=result,
+                        run_seconds=completed_at - submitted_at,
+                        fetch_seconds=time.perf_counter() - completed_at,
+                        bytes_processed=job.total_bytes_processed,
+                    )
+
+        except BaseException:
+            # Cancel the jobs still running
+            for job, _, _ in running.values():
+                logging.info(f"🛑 Cancel job {job.job_id}")
+                job.cancel()
+            raise
+
+        n_failed = sum(result.error is not None for result in results)
+        logging.info(
+            f"✅ Executed {len(results)} queries in {time.perf_counter() - start:.3f} seconds "
+            f"({n_failed} failed)"
+        )
+
+        return results
+
+    def stream_query_from_config(
+        self, query_config: BQQueryConfig, stream_config: Optional[BQStreamConfig] = None
+    ) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+        """
+        Execute a query from local path and yield its result in chunks, so that only
+        one chunk is held in memory at once. Through the REST endpoint a chunk is a page of
+        ``page_size`` rows, through the Storage Read API a record batch of the read streams.
+
+        Args:
+            query_config (BQQueryConfig): Query configurations (path and parameters)
+            stream_config (Optional[BQStreamConfig]): Page size and chunk format
+
+        Returns:
+            (Iterator[Union[pd.DataFrame, pa.RecordBatch]]): Chunks of the query result
+        """
+        stream_config = stream_config or BQStreamConfig()
+
+        logging.info(
+            f"🌊 Stream query from {query_config.query_path} "
+            f"in pages of {stream_config.page_size} rows"
+        )
+
+        # Submit the query job and wait for it
+        query, parameters = self._read_query(query_config)
+        result = self._submit_query(query, parameters, query_config.maximum_bytes_billed).result(
+            page_size=stream_config.page_size
+        )
+        bqstorage_client = self._get_bqstorage_client(result)
+
+        # Switch based on the chunk format
+        match stream_config.chunk_format:
+            case "pandas":
+                chunks = result.to_dataframe_iterable(
+                    bqstorage_client=bqstorage_client,
+                    max_stream_count=self._storage_read_config.max_stream_count,
+                )
+            case "arrow":
+                chunks = result.to_arrow_iterable(
+                    bqstorage_client=bqstorage_client,
+                    max_stream_count=self._storage_read_config.max_stream_count,
+                )
+            case _:
+                logging.error(f"🚨 Unknown chunk format: {stream_config.chunk_format}")
+                raise ValueError("Invalid chunk format")
+
+        n_chunks, n_rows = 0, 0
+        for chunk in chunks:
+            n_chunks, n_rows = n_chunks + 1, n_rows + len(chunk)
+            yield chunk
+
+        logging.info(f"✅ Query streamed {n_rows} rows in {n_chunks} chunks")
+
+    def _full_table_id(self, table_id: str) -> str:
+        """
+        Qualify a table ID with the project of the client, so that the metadata cache has
+        a single key per table whatever the form used by the caller.
+
+        Args:
+            table_id (str): Table ID (``dataset.table`` or ``project.dataset.table``)
+
+        Returns:
+            (str): The fully-qualified table ID (``project.dataset.table``)
+        """
+        reference = bigquery.TableReference.from_string(
+            table_id, default_project=self._client_config.project_id
+        )
+
+        return f"{reference.project}.{reference.dataset_id}.{reference.table_id}"
+
+    def get_table_metadata(self, table_id: str, refresh: bool = False) -> Optional[BQTableMetadata]:
+        """
+        Retrieve the schema, size and modification time of a table with a single
+        ``get_table`` lookup. The metadata is cached for ``ttl_seconds``.
+
+        Args:
+            table_id (str): Table ID (``dataset.table`` or ``project.dataset.table``)
+            refresh (bool): If True, bypass the cached metadata
+
+        Returns:
+            (Optional[BQTableMetadata]): The table metadata or None if the table does not exist
+        """
+        table_id = self._full_table_id(table_id)
+
+        # Look up the metadata cache first
+        if not refresh:
+            metadata = self._metadata_cache.get(("table", table_id))
+            if metadata is not None:
+                return metadata
+
+        try:
+            table = self._client.get_table(table_id)
+        except NotFound:
+            return None
+
+        metadata = BQTableMetadata(
+            table_id=f"{table.project}.{table.dataset_id}.{table.table_id}",
+            table_type=table.table_type,
+            columns={field.name: field.field_type for field in table.schema},
+            num_rows=table.num_rows,
+            num_bytes=table.num_bytes,
+            modified=table.modified,
+        )
+        self._metadata_cache.set(("table", table_id), metadata)
+
+        return metadata
+
+    def invalidate_metadata_cache(self, table_id: Optional[str] = None) -> None:
+        """
+        Remove the cached metadata of a table (of all the tables if None).
+
+        Args:
+            table_id (Optional[str]): Table ID (``dataset.table`` or ``project.dataset.table``)
+        """
+        if table_id is None:
+            self._metadata_cache.invalidate("table")
+        else:
+            self._metadata_cache.invalidate("table", self._full_table_id(table_id))
+
     def table_exists(self, table_name: str, dataset_name: str) -> bool:
         """
         Check if a table exists in a dataset.
@@ -171,16 +733,10 @@ class BigQueryConnector:
         Returns:
             (bool): Flag indicating if the table exists
         """
-        logging.info(f"🗂️ Retrieve list of tables in dataset: {dataset_name}")
-
-        # Retrieve the list of tables
-        tables = self._client.list_tables(dataset_name)
-
-        # Retrieve the list of table names
-        table_names = [table.table_id for table in tables]
+        logging.info(f"🗂️ Look up table {table_name} in dataset: {dataset_name}")
 
         # Check if the table exists
-        exists = table_name in table_names
+        exists = self.get_table_metadata(f"{dataset_name}.{table_name}") is not None
 
         if exists:
             logging.info(f"✅ Table {table_name} exists in dataset {dataset_name}")
@@ -189,6 +745,172 @@ class BigQueryConnector:
 
         return exists
 
+    @staticmethod
+    def _write_disposition(write_mode: BQWriteMode) -> str:
+        """
+        Map a write mode to the write disposition of a load or copy job.
+
+        Args:
+            write_mode (BQWriteMode): Write mode of the upload
+
+        Returns:
+            (str): The write disposition
+        """
+        # Switch based on the write mode
+        match write_mode:
+            case "append":
+                return bigquery.WriteDisposition.WRITE_APPEND
+            case "truncate":
+                return bigquery.WriteDisposition.WRITE_TRUNCATE
+            case "empty":
+                return bigquery.WriteDisposition.WRITE_EMPTY
+            case _:
+                logging.error(f"🚨 Unknown write mode: {write_mode}")
+                raise ValueError("Invalid write mode")
+
+    @staticmethod
+    def _build_load_job_config(
+        upload_config: BQUploadConfig, first_chunk: bool
+    ) -> bigquery.LoadJobConfig:
+        """
+        Build the configuration of a Parquet load job. Only the first chunk applies
+        the write mode, the following ones are appended to it. The schema mode only applies
+        to appending jobs, as a truncated or empty table takes the schema of the Parquet file.
+
+        Args:
+            upload_config (BQUploadConfig): Upload configurations
+            first_chunk (bool): Flag indicating if the job loads the first chunk
+
+        Returns:
+            (bigquery.LoadJobConfig): The load job configuration
+        """
+        job_config = bigquery.LoadJobConfig(source_format=bigquery.SourceFormat.PARQUET)
+
+        # Map lists to REPEATED columns instead of nested records
+        parquet_options = bigquery.ParquetOptions()
+        parquet_options.enable_list_inference = True
+        job_config.parquet_options = parquet_options
+
+        job_config.write_disposition = (
+            BigQueryConnector._write_disposition(upload_config.write_mode)
+            if first_chunk
+            else bigquery.WriteDisposition.WRITE_APPEND
+        )
+
+        # Switch based on the schema mode
+        match upload_config.schema_mode:
+            case "infer":
+                schema_update_options = None
+            case "allow_field_addition":
+                schema_update_options = [bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
+            case "allow_field_relaxation":
+                schema_update_options = [bigquery.SchemaUpdateOption.ALLOW_FIELD_RELAXATION]
+            case _:
+                logging.error(f"🚨 Unknown schema mode: {upload_config.schema_mode}")
+                raise ValueError("Invalid schema mode")
+
+        # BigQuery rejects the schema update options of a job that does not append
+        if (
+            schema_update_options
+            and job_config.write_disposition == bigquery.WriteDisposition.WRITE_APPEND
+        ):
+            job_config.schema_update_options = schema_update_options
+
+        return job_config
+
+    def upload_dataframe(
+        self,
+        data: pd.DataFrame,
+        table_name: str,
+        dataset_name: str,
+        upload_config: Optional[BQUploadConfig] = None,
+    ) -> int:
+        """
+        Upload a DataFrame to a table through Parquet load jobs, which are free of charge
+        unlike streaming inserts. Large DataFrames are split in chunks of ``chunk_rows`` rows,
+        each serialised (in memory or to a temporary file) and loaded by its own job.
+
+        With the ``truncate`` and ``empty`` write modes, the chunks are loaded in a staging table
+        of the same dataset, then copied to the table by a single (atomic) copy job, so a failed
+        upload leaves the table as it was. The chunks appended to a table are not atomic:
+        the chunks loaded before a failure stay in the table.
+
+        Args:
+            data (pd.DataFrame): Data to upload.
+            table_name (str): Name of the table.
+            dataset_name (str): Name of the dataset.
+            upload_config (Optional[BQUploadConfig]): Write mode, schema mode and chunking
+
+        Returns:
+            (int): Number of uploaded rows
+        """
+        upload_config = upload_config or BQUploadConfig()
+
+        # Check if the DataFrame is empty
+        if data.empty:
+            raise ValueError("🚨 The provided DataFrame is empty and cannot be uploaded.")
+
+        table_id = f"{dataset_name}.{table_name}"
+        logging.info(
+            f"🪁 Upload {len(data)} rows into the table {table_id} "
+            f"({upload_config.write_mode.value} mode)"
+        )
+
+        # Load the chunks replacing (or creating) the table in a staging table
+        staging = (
+            len(data) > upload_config.chunk_rows and upload_config.write_mode != BQWriteMode.APPEND
+        )
+        load_table_id = f"{table_id}_staging_{uuid.uuid4().hex}" if staging else table_id
+
+        start = time.perf_counter()
+        rows = 0
+        try:
+            for chunk_start in range(0, len(data), upload_config.chunk_rows):
+                chunk = data.iloc[chunk_start : chunk_start + upload_config.chunk_rows]
+
+                # Serialise the chunk to Parquet
+                with (
+                    tempfile.TemporaryFile() if upload_config.spill_to_disk else io.BytesIO()
+                ) as file:
+                    pq.write_table(
+                        pa.Table.from_pandas(chunk, preserve_index=False),
+                        file,
+                        compression=upload_config.compression,
+                    )
+
+                    # Submit the load job and wait for it
+                    job = self._client.load_table_from_file(
+                        file,
+                        load_table_id,
+                        rewind=True,
+                        job_config=self._build_load_job_config(upload_config, chunk_start == 0),
+                    )
+                    job.result()
+
+                rows += len(chunk)
+
+            # Replace (or create) the table with a single copy job
+            if staging:
+                job = self._client.copy_table(
+                    load_table_id,
+                    table_id,
+                    job_config=bigquery.CopyJobConfig(
+                        write_disposition=self._write_disposition(upload_config.write_mode)
+                    ),
+                )
+                job.result()
+        finally:
+            if staging:
+                self._client.delete_table(load_table_id, not_found_ok=True)
+
+        # The table may have been created or replaced
+        self.invalidate_metadata_cache(table_id)
+
+        elapsed = time.perf_counter() - start
+        logging.info(f"✅ Data uploaded to {table_id} ({rows / max(elapsed, 1e-9):.0f} rows/s)")
+
+        return rows
+
     @staticmethod
     def wrap_dictionary_to_query_config(query_config_dictionary: dict) -> BQQueryConfig:
         """
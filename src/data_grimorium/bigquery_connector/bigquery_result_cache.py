@@ -0,0 +1,176 @@
+"""
+The module includes a thread-safe local cache of BigQuery query results, stored as
+Arrow IPC files, in order to avoid running identical queries repeatedly.
+"""
+
+# Import Standard Modules
+import hashlib
+import json
+import logging
+import threading
+import time
+import pyarrow as pa
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import Package Modules
+from data_grimorium.bigquery_connector.bigquery_types import BQResultCacheConfig
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M",
+)
+
+
+class BigQueryResultCache:
+    """
+    The class implements a local cache of query results with time-to-live and
+    size-bounded least recently used eviction. Each result is an Arrow IPC file whose
+    schema metadata holds the creation time and the modification time of its source tables.
+    The modification time of the file tracks its last use.
+
+    Attributes:
+        _cache_dir (Path): Directory of the cached results
+        _cache_config (BQResultCacheConfig): Cache configurations
+        _lock (threading.Lock): Lock guarding the files
+    """
+
+    def __init__(self, cache_dir: Path, cache_config: BQResultCacheConfig):
+        """
+        Constructor of the class BigQueryResultCache
+
+        Args:
+            cache_dir (Path): Directory of the cached results
+            cache_config (BQResultCacheConfig): Cache configurations
+        """
+        # Initialise attributes
+        self._cache_dir = cache_dir
+        self._cache_config = cache_config
+        self._lock = threading.Lock()
+
+        # Initialise metrics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(query: str, query_parameters: List[Dict[str, Any]], project_id: str) -> str:
+        """
+        Compute the key of a query result.
+
+        Args:
+            query (str): Query text
+            query_parameters (List[Dict[str, Any]]): API representation of the query parameters
+            project_id (str): Project running the query
+
+        Returns:
+            (str): SHA-256 digest of the query, its parameters and the project
+        """
+        payload = json.dumps([query, query_parameters, project_id], sort_keys=True, default=str)
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """
+        Retrieve the file of a cached result.
+
+        Args:
+            key (str): Key of the result
+
+        Returns:
+            (Path): Arrow IPC file of the result
+        """
+        return self._cache_dir / f"{key}.arrow"
+
+    def get(self, key: str) -> Optional[Tuple[pa.Table, Dict[str, str]]]:
+        """
+        Retrieve a cached result, marking it as the most recently used.
+
+        Args:
+            key (str): Key of the result
+
+        Returns:
+            (Optional[Tuple[pa.Table, Dict[str, str]]]): The result with the modification time
+            of its source tables, or None if missing or expired
+        """
+        path = self._path(key)
+
+        with self._lock:
+            try:
+                with pa.memory_map(path.as_posix()) as source:
+                    table = pa.ipc.open_file(source).read_all()
+            except (FileNotFoundError, pa.ArrowInvalid):
+                self.misses += 1
+                return None
+
+            metadata = table.schema.metadata or {}
+            created_at = float(metadata.get(b"data_grimorium.created_at", 0))
+            if created_at + self._cache_config.ttl_seconds <= time.time():
+                path.unlink(missing_ok=True)
+                self.misses += 1
+                return None
+
+            # Mark the result as the most recently used
+            path.touch()
+            self.hits += 1
+
+        source_tables = json.loads(metadata.get(b"data_grimorium.source_tables", b"{}"))
+
+        return table.replace_schema_metadata(
+            {k: v for k, v in metadata.items() if not k.startswith(b"data_grimorium.")}
+        ), source_tables
+
+    def set(self, key: str, table: pa.Table, source_tables: Dict[str, str]) -> None:
+        """
+        Cache a result, then evict the least recently used results above ``max_size_bytes``.
+
+        Args:
+            key (str): Key of the result
+            table (pa.Table): Result to cache
+            source_tables (Dict[str, str]): Modification time of the source tables by table id
+        """
+        table = table.replace_schema_metadata(
+            (table.schema.metadata or {})
+            | {
+                b"data_grimorium.created_at": str(time.time()).encode(),
+                b"data_grimorium.source_tables": json.dumps(source_tables).encode(),
+            }
+        )
+
+        with self._lock:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first, so that readers never see a partial file
+            path = self._path(key)
+            temporary_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with pa.OSFile(temporary_path.as_posix(), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            temporary_path.replace(path)
+
+            # Evict the least recently used results, except the new one
+            files = sorted(
+                (file.stat().st_mtime, file.stat().st_size, file)
+                for file in self._cache_dir.glob("*.arrow")
+            )
+            size = sum(file_size for _, file_size, _ in files)
+            for _, file_size, file in files:
+                if size <= self._cache_config.max_size_bytes:
+                    break
+                if file != path:
+                    logging.info(f"🧹 Evict cached result {file.stem}")
+                    file.unlink(missing_ok=True)
+                    size -= file_size
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Remove a cached result (all the results if None).
+
+        Args:
+            key (Optional[str]): Key of the result to remove
+        """
+        with self._lock:
+            files = [self._path(key)] if key else self._cache_dir.glob("*.arrow")
+            for file in files:
+                file.unlink(missing_ok=True)
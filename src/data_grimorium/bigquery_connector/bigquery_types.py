@@ -3,8 +3,10 @@ The module includes Pydantic types for BigQuery Connector.
 """
 
 # Import Standard Modules
-from pydantic import BaseModel, Field
-from typing import Optional, Union, List
+import datetime
+from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Optional, Union, List
 
 
 class BQClientConfig(BaseModel):
@@ -18,6 +20,194 @@ class BQClientConfig(BaseModel):
     project_id: str = Field(..., description="Project ID on Google Cloud Platform")
 
 
+class BQStorageReadConfig(BaseModel):
+    """
+    BigQuery Storage Read API configuration, used to download query results
+    as Arrow record batches over parallel streams
+
+    Attributes:
+        enabled (Boolean): Flag to read the results through the Storage Read API
+        rest_max_rows (Integer): Maximum number of rows still read through the REST endpoint
+        max_stream_count (Integer): [Optional] Maximum number of parallel streams of the Arrow reads
+    """
+
+    enabled: bool = Field(True, description="Flag to read the results through the Storage Read API")
+    rest_max_rows: int = Field(
+        10_000, ge=0, description="Maximum number of rows still read through the REST endpoint"
+    )
+    max_stream_count: Optional[int] = Field(
+        None, gt=0, description="Maximum number of parallel streams of the Arrow reads"
+    )
+
+
+class BQMetadataCacheConfig(BaseModel):
+    """
+    BigQuery metadata cache configuration
+
+    Attributes:
+        ttl_seconds (Float): Seconds after which the cached table metadata expires (0 disables the cache)
+    """
+
+    ttl_seconds: float = Field(300, ge=0, description="Seconds after which the metadata expires")
+
+
+class BQTableMetadata(BaseModel):
+    """
+    Metadata of a BigQuery table
+
+    Attributes:
+        table_id (String): Fully qualified table ID (``project.dataset.table``)
+        table_type (String): [Optional] Type of the table (e.g., TABLE, VIEW)
+        columns (Dict[String, String]): Column types by column name
+        num_rows (Integer): [Optional] Number of rows
+        num_bytes (Integer): [Optional] Size of the table in bytes
+        modified (datetime.datetime): [Optional] Last modification time
+    """
+
+    table_id: str = Field(..., description="Fully qualified table ID")
+    table_type: Optional[str] = Field(None, description="Type of the table")
+    columns: Dict[str, str] = Field(..., description="Column types by column name")
+    num_rows: Optional[int] = Field(None, description="Number of rows")
+    num_bytes: Optional[int] = Field(None, description="Size of the table in bytes")
+    modified: Optional[datetime.datetime] = Field(None, description="Last modification time")
+
+
+class BQResultCacheConfig(BaseModel):
+    """
+    BigQuery local result cache configuration. Query results are stored as Arrow IPC files
+    keyed by the query text, the query parameters and the project
+
+    Attributes:
+        cache_dir (String): Directory of the cached results, relative to the project root path
+        ttl_seconds (Float): Seconds after which a cached result expires
+        max_size_bytes (Integer): Maximum size of the cache, the least recently used results are evicted
+        check_source_tables (Boolean): Flag to invalidate a result when its source tables were modified
+    """
+
+    cache_dir: str = Field(".cache/bigquery", description="Directory of the cached results")
+    ttl_seconds: float = Field(3600, ge=0, description="Seconds after which a result expires")
+    max_size_bytes: int = Field(1024**3, gt=0, description="Maximum size of the cache in bytes")
+    check_source_tables: bool = Field(
+        False, description="Flag to invalidate a result when its source tables were modified"
+    )
+
+
+class BQChunkFormat(str, Enum):
+    PANDAS = "pandas"
+    ARROW = "arrow"
+
+
+class BQStreamConfig(BaseModel):
+    """
+    BigQuery streaming configuration, used to read query results in chunks
+
+    Attributes:
+        page_size (Integer): Number of rows per page read through the REST endpoint
+        chunk_format (BQChunkFormat): Format of the chunks (pandas DataFrame or Arrow record batch)
+    """
+
+    page_size: int = Field(10_000, gt=0, description="Number of rows per page")
+    chunk_format: BQChunkFormat = Field(BQChunkFormat.PANDAS, description="Format of the chunks")
+
+
+class BQFailurePolicy(str, Enum):
+    FAIL_FAST = "fail_fast"
+    COLLECT = "collect"
+
+
+class BQBatchConfig(BaseModel):
+    """
+    BigQuery batch configuration, used to run several query jobs concurrently
+
+    Attributes:
+        max_concurrent_jobs (Integer): Maximum number of jobs running at once
+        failure_policy (BQFailurePolicy): Either cancel the batch at the first failure or collect the errors
+        poll_interval_seconds (Float): Seconds between two checks of the running jobs
+    """
+
+    max_concurrent_jobs: int = Field(10, gt=0, description="Maximum number of jobs running at once")
+    failure_policy: BQFailurePolicy = Field(
+        BQFailurePolicy.FAIL_FAST, description="Failure policy of the batch"
+    )
+    poll_interval_seconds: float = Field(
+        0.5, ge=0, description="Seconds between two checks of the running jobs"
+    )
+
+
+class BQJobResult(BaseModel):
+    """
+    Result of a query job run within a batch, with its timing
+
+    Attributes:
+        query_path (String): Query file path
+        job_id (String): [Optional] BigQuery job ID (None if the result was cached)
+        result (Any): [Optional] Data, table creation status or Parquet handle (None if failed)
+        error (String): [Optional] Error message of a failed job
+        cached (Boolean): Flag indicating if the result was read from the local result cache
+        run_seconds (Float): Seconds from the submission to the completion of the job
+        fetch_seconds (Float): Seconds spent collecting the result
+        bytes_processed (Integer): [Optional] Bytes processed by the job
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    query_path: str = Field(..., description="Query file path")
+    job_id: Optional[str] = Field(None, description="BigQuery job ID")
+    result: Any = Field(None, description="Data, table creation status or Parquet handle")
+    error: Optional[str] = Field(None, description="Error message of a failed job")
+    cached: bool = Field(False, description="Flag indicating if the result was cached")
+    run_seconds: float = Field(0.0, description="Seconds from the submission to the completion")
+    fetch_seconds: float = Field(0.0, description="Seconds spent collecting the result")
+    bytes_processed: Optional[int] = Field(None, description="Bytes processed by the job")
+
+
+class BQDryRunResult(BaseModel):
+    """
+    Result of a BigQuery dry run, estimating the cost of a query without running it
+
+    Attributes:
+        total_bytes_processed (Integer): Estimated bytes processed by the query
+        referenced_tables (List[String]): Tables referenced by the query (``project.dataset.table``)
+        statement_type (String): [Optional] Type of the statement (e.g., SELECT)
+    """
+
+    total_bytes_processed: int = Field(..., description="Estimated bytes processed by the query")
+    referenced_tables: List[str] = Field(..., description="Tables referenced by the query")
+    statement_type: Optional[str] = Field(None, description="Type of the statement")
+
+
+class BQWriteMode(str, Enum):
+    APPEND = "append"
+    TRUNCATE = "truncate"
+    EMPTY = "empty"
+
+
+class BQSchemaMode(str, Enum):
+    INFER = "infer"
+    ALLOW_FIELD_ADDITION = "allow_field_addition"
+    ALLOW_FIELD_RELAXATION = "allow_field_relaxation"
+
+
+class BQUploadConfig(BaseModel):
+    """
+    BigQuery upload configuration, used to load DataFrames through Parquet load jobs
+
+    Attributes:
+        write_mode (BQWriteMode): Either append to, truncate or require an empty destination table
+        schema_mode (BQSchemaMode): Either infer the schema from the Parquet file or also allow
+            the load to add (or relax) columns of an existing table
+        chunk_rows (Integer): Number of rows serialised and loaded by each load job
+        spill_to_disk (Boolean): Flag to serialise the chunks to temporary files instead of memory
+        compression (String): Parquet compression codec
+    """
+
+    write_mode: BQWriteMode = Field(BQWriteMode.APPEND, description="Write mode of the load")
+    schema_mode: BQSchemaMode = Field(BQSchemaMode.INFER, description="Schema mode of the load")
+    chunk_rows: int = Field(1_000_000, gt=0, description="Number of rows loaded by each job")
+    spill_to_disk: bool = Field(False, description="Flag to serialise chunks to temporary files")
+    compression: str = Field("snappy", description="Parquet compression codec")
+
+
 class BQQueryParameter(BaseModel):
     """
     BigQuery Query parameter object, including all required fields for defining the parameter
@@ -43,6 +233,8 @@ class BQQueryConfig(BaseModel):
         query_parameters (List[BQQueryParameter]): [Optional] List of BigQuery parameters or a single parameter
         local_path (String): [Optional] Local path where to save the data
         table_name (String): [Optional] Table name
+        maximum_bytes_billed (Integer): [Optional] Maximum bytes billed, the query fails before
+            running when it would bill more
     """
 
     query_path: str = Field(..., description="Query file path")
@@ -51,6 +243,9 @@ class BQQueryConfig(BaseModel):
     )
     local_path: Optional[str] = Field(None, description="Local path where to save the data")
     table_name: Optional[str] = Field(None, description="Table name")
+    maximum_bytes_billed: Optional[int] = Field(
+        None, gt=0, description="Maximum bytes billed, the query fails before running above it"
+    )
 
     def count_non_none_attributes(self) -> int:
         """
@@ -4,7 +4,7 @@ This module includes Pydantic types for the whole project
 
 # Import Standard Modules
 from enum import Enum
-from typing import Optional, Union
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -78,6 +78,29 @@ class EncodingTextConfig(BaseModel):
     )
 
 
+class MemoryBudgetConfig(BaseModel):
+    """
+    Configuration to reduce the memory footprint of prepared data
+
+    Attributes:
+        downcast_integers (Boolean): Flag to downcast integer columns to the narrowest dtype
+        downcast_floats (Boolean): Flag to downcast float columns to float32 when it keeps their values
+        float_tolerance (float): Relative error allowed when downcasting floats (0 for exact values)
+        category_threshold (float): Maximum ratio of unique values over rows to convert strings to category
+        drop_helper_columns (Boolean): Flag to drop temporary helper columns (e.g., the z-score)
+    """
+
+    downcast_integers: bool = Field(True, description="Flag to downcast integer columns")
+    downcast_floats: bool = Field(True, description="Flag to downcast float columns to float32")
+    float_tolerance: float = Field(
+        0.0, ge=0, description="Relative error allowed when downcasting floats (0 for exact values)"
+    )
+    category_threshold: float = Field(
+        0.5, description="Maximum ratio of unique values over rows to convert strings to category"
+    )
+    drop_helper_columns: bool = Field(True, description="Flag to drop temporary helper columns")
+
+
 class DateExtractionConfig(BaseModel):
     """
     Configuration to extract information from a date field
@@ -86,11 +109,35 @@ class DateExtractionConfig(BaseModel):
         column_name (str): Column name containing the date
         extract_year (Boolean): Flag to indicate to extract the year
         extract_month (Boolean): Flag to indicate to extract the month
+        date_format (Optional[str]): Explicit date format (e.g., ``%d/%m/%Y``) or ``ISO8601``
+        extract_day (Boolean): Flag to indicate to extract the day of the month
+        extract_weekday (Boolean): Flag to indicate to extract the day of the week
+        extract_quarter (Boolean): Flag to indicate to extract the quarter
+        extract_week (Boolean): Flag to indicate to extract the ISO week
+        extract_hour (Boolean): Flag to indicate to extract the hour
+        extract_epoch (Boolean): Flag to indicate to extract the seconds since the Unix epoch
+        cyclical_encoding (Boolean): Flag to indicate to add sin/cos encodings of the periodic parts
+        memory_budget (Optional[MemoryBudgetConfig]): Memory footprint reduction to apply
     """
 
     column_name: str = Field(..., description="Column name containing the date")
     extract_year: bool = Field(..., description="Flag to indicate to extract the year")
     extract_month: bool = Field(..., description="Flag to indicate to extract the month")
+    date_format: Optional[str] = Field(
+        None, description="Explicit date format or ISO8601 (inferred if not set)"
+    )
+    extract_day: bool = Field(False, description="Flag to indicate to extract the day")
+    extract_weekday: bool = Field(False, description="Flag to indicate to extract the weekday")
+    extract_quarter: bool = Field(False, description="Flag to indicate to extract the quarter")
+    extract_week: bool = Field(False, description="Flag to indicate to extract the ISO week")
+    extract_hour: bool = Field(False, description="Flag to indicate to extract the hour")
+    extract_epoch: bool = Field(False, description="Flag to indicate to extract the epoch")
+    cyclical_encoding: bool = Field(
+        False, description="Flag to indicate to add sin/cos encodings of the periodic parts"
+    )
+    memory_budget: Optional[MemoryBudgetConfig] = Field(
+        None, description="Memory footprint reduction to apply"
+    )
 
 
 class StandardisationMethod(str, Enum):
@@ -108,6 +155,11 @@ class NanStrategy(str, Enum):
     IMPUTE = "simple_imputer"
 
 
+class ImputationMethod(str, Enum):
+    MEAN = "mean"
+    MEDIAN = "median"
+
+
 class OutlierConfig(BaseModel):
     """
     Configuration for drop outlier transformation
@@ -130,6 +182,8 @@ class NumericalFeaturesConfig(BaseModel):
         standardisation (Optional[StandardisationMethod]): Standardisation method to apply
         drop_outliers (Optional[OutlierMethod]): Outlier removal method to use
         nan_values (Optional[NanStrategy]): Strategy to handle missing values
+        imputation_method (ImputationMethod): Statistic used to fill missing values when imputing
+        memory_budget (Optional[MemoryBudgetConfig]): Memory footprint reduction to apply
     """
 
     column_name: str = Field(..., description="Name of the numerical column to process")
@@ -140,6 +194,27 @@ class NumericalFeaturesConfig(BaseModel):
         None, description="Outlier removal configuration to use"
     )
     nan_values: Optional[NanStrategy] = Field(None, description="Strategy to handle missing values")
+    imputation_method: ImputationMethod = Field(
+        ImputationMethod.MEAN, description="Statistic used to fill missing values when imputing"
+    )
+    memory_budget: Optional[MemoryBudgetConfig] = Field(
+        None, description="Memory footprint reduction to apply"
+    )
+
+
+class ParallelPreparationConfig(BaseModel):
+    """
+    Configuration for the process-parallel preparation of numerical features
+
+    Attributes:
+        n_jobs (Optional[int]): Number of worker processes (all available cores if not set)
+        columns_per_task (Optional[int]): Number of columns sent to a worker in each task
+    """
+
+    n_jobs: Optional[int] = Field(None, description="Number of worker processes")
+    columns_per_task: Optional[int] = Field(
+        None, description="Number of columns sent to a worker in each task"
+    )
 
 
 class FlagFeatureConfig(BaseModel):
@@ -149,7 +224,36 @@ class FlagFeatureConfig(BaseModel):
     Attributes:
         column_name (str): Name of the numerical column to process
         output_column_name (str): Name of the output column
+        memory_budget (Optional[MemoryBudgetConfig]): Memory footprint reduction to apply
     """
 
     column_name: str = Field(..., description="Name of the column to process")
     output_column_name: str = Field(..., description="Name of the output column")
+    memory_budget: Optional[MemoryBudgetConfig] = Field(
+        None, description="Memory footprint reduction to apply"
+    )
+
+
+class FlagRepresentation(str, Enum):
+    DENSE = "dense"
+    BITSET = "bitset"
+    SPARSE = "sparse"
+
+
+class BulkFlagFeaturesConfig(BaseModel):
+    """
+    Configuration for the bulk creation of flag features
+
+    Attributes:
+        flags (List[FlagFeatureConfig]): Flag features to create
+        representation (FlagRepresentation): Representation of the flags in the output data
+        bitset_column_prefix (str): Prefix of the ``uint64`` columns holding 64 flags each
+    """
+
+    flags: List[FlagFeatureConfig] = Field(..., description="Flag features to create")
+    representation: FlagRepresentation = Field(
+        FlagRepresentation.DENSE, description="Representation of the flags in the output data"
+    )
+    bitset_column_prefix: str = Field(
+        "flags_bitset", description="Prefix of the uint64 columns holding 64 flags each"
+    )
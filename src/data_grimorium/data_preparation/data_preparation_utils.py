@@ -3,23 +3,31 @@ The module includes functions for implementing data transformations
 """
 
 # Import Standard Libraries
+import os
 import numpy as np
 import pandas as pd
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from sentence_transformers import SentenceTransformer
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import MinMaxScaler
 from scipy.stats import zscore
-from typing import List
+from typing import List, Optional, Tuple, Union
 
 # Import Package Modules
 from data_grimorium.data_preparation.data_preparation_types import (
     EmbeddingsConfig,
     CompressEmbeddingsConfig,
     EncodingTextConfig,
+    MemoryBudgetConfig,
     DateExtractionConfig,
     NumericalFeaturesConfig,
+    StandardisationMethod,
+    ImputationMethod,
+    ParallelPreparationConfig,
     FlagFeatureConfig,
+    BulkFlagFeaturesConfig,
 )
 
 # Setup logging
@@ -128,9 +136,224 @@ def encode_text(
     return compressed_embeddings
 
 
+def _compute_nan_statistics(
+    values: np.ndarray, missing: np.ndarray
+) -> Tuple[int, float, float, float, float, float]:
+    """
+    Compute the statistics of ``values`` ignoring NaN values with a single copy of the valid values:
+    a partition-based selection returns the minimum, the median and the maximum, then the
+    copy is reused in place to compute the standard deviation.
+
+    Args:
+        values (np.ndarray): Column values
+        missing (np.ndarray): Boolean mask of the NaN values
+
+    Returns:
+        (Tuple[int, float, float, float, float, float]): Count, mean, standard deviation,
+        median, minimum and maximum of the valid values
+    """
+    # Copy the valid values
+    valid = values[~missing]
+    count = valid.size
+
+    if count == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+
+    # Select the minimum, the median and the maximum in place
+    middle = count // 2
+    valid.partition(sorted({0, max(middle - 1, 0), middle, count - 1}))
+    median = valid[middle] if count % 2 else (valid[middle - 1] + valid[middle]) / 2
+    minimum, maximum = valid[0], valid[count - 1]
+
+    # Compute the mean and the standard deviation (ddof=0) reusing the copy
+    mean = valid.sum() / count
+    np.subtract(valid, mean, out=valid)
+    np.multiply(valid, valid, out=valid)
+    std = np.sqrt(valid.sum() / count)
+
+    return count, mean, std, median, minimum, maximum
+
+
+def _impute_and_standardise_values(
+    values: np.ndarray,
+    imputation_method: Optional[ImputationMethod],
+    standardisation: Optional[StandardisationMethod],
+    out: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Fused NaN-aware kernel: compute the statistics of ``values`` once, fill the NaN values in place
+    with ``imputation_method`` (if set) and standardise the values with ``standardisation`` (if set).
+    The statistics of the imputed values are derived from the ones of the valid values,
+    so that the result matches an imputation followed by the standardisation.
+
+    Args:
+        values (np.ndarray): Column values (float64), imputed in place
+        imputation_method (Optional[ImputationMethod]): Statistic used to fill the NaN values
+        standardisation (Optional[StandardisationMethod]): Standardisation method to apply
+        out (Optional[np.ndarray]): Buffer for the standardised values (``values`` to standardise in place)
+
+    Returns:
+        (Optional[np.ndarray]): Standardised values (None if no standardisation is set)
+    """
+    # Compute the statistics on the valid values
+    missing = np.isnan(values)
+    count, mean, std, median, minimum, maximum = _compute_nan_statistics(values, missing)
+
+    # Fill the NaN values in place
+    if imputation_method is not None and 0 < count < values.size:
+        match imputation_method:
+            case "mean":
+                fill_value = mean
+            case "median":
+                fill_value = median
+            case _:
+                raise ValueError("Invalid imputation method")
+
+        np.copyto(values, fill_value, where=missing)
+
+        # Update the statistics with the filled values (which lie within the minimum and the maximum)
+        n_missing = values.size - count
+        imputed_mean = (count * mean + n_missing * fill_value) / values.size
+        imputed_variance = (
+            count * (std**2 + (mean - imputed_mean) ** 2)
+            + n_missing * (fill_value - imputed_mean) ** 2
+        ) / values.size
+        mean, std = imputed_mean, np.sqrt(imputed_variance)
+
+    # Standardise the values, mapping constant columns to zero as done by scikit-learn
+    match standardisation:
+        case None:
+            return None
+
+        case "min_max_scaler":
+            shift, scale = minimum, (maximum - minimum) or 1.0
+
+        case "standard_scaler":
+            shift, scale = mean, std or 1.0
+
+        case _:
+            raise ValueError("Invalid standardisation method")
+
+    out = np.subtract(values, shift, out=out)
+    np.divide(out, scale, out=out)
+
+    return out
+
+
+def reduce_memory_usage(
+    data: pd.DataFrame, config: MemoryBudgetConfig, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Reduce the memory footprint of ``data`` by downcasting numerical columns to the narrowest
+    dtype and converting low-cardinality strings to ``category``. Float columns are downcast
+    only if ``float32`` keeps their values within ``config.float_tolerance``.
+
+    Args:
+        data (pd.DataFrame): Input data
+        config (MemoryBudgetConfig): Memory footprint reduction configurations
+        columns (Optional[List[str]]): Columns to process (all the columns if not set)
+
+    Returns:
+        (pd.DataFrame): Output data with compact dtypes
+    """
+    # Initialise the dtypes to convert
+    dtypes = {}
+
+    for column_name in columns if columns is not None else data.columns:
+        column = data[column_name]
+
+        # Switch based on the column kind (bool columns are already one byte per row)
+        if pd.api.types.is_bool_dtype(column):
+            continue
+        elif pd.api.types.is_integer_dtype(column) and config.downcast_integers:
+            downcast = "unsigned" if len(column) and column.min() >= 0 else "integer"
+            dtype = pd.to_numeric(column, downcast=downcast).dtype
+        elif pd.api.types.is_float_dtype(column) and config.downcast_floats:
+            values = column.to_numpy(dtype="float64", na_value=np.nan)
+            with np.errstate(over="ignore"):
+                narrowed = values.astype(np.float32)
+            lossless = np.allclose(
+                narrowed, values, rtol=config.float_tolerance, atol=0, equal_nan=True
+            )
+            dtype = pd.to_numeric(column, downcast="float").dtype if lossless else column.dtype
+        elif pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            low_cardinality = column.nunique() <= config.category_threshold * len(column)
+            dtype = "category" if low_cardinality else column.dtype
+        else:
+            continue
+
+        if dtype != column.dtype:
+            dtypes[column_name] = dtype
+
+    return data.astype(dtypes) if dtypes else data
+
+
+def _apply_memory_budget(
+    data: pd.DataFrame,
+    config: MemoryBudgetConfig,
+    step: str,
+    columns: List[str],
+    bytes_before: int,
+) -> pd.DataFrame:
+    """
+    Apply ``reduce_memory_usage`` at the end of a preparation step and report the bytes
+    before and after the step in ``data.attrs["memory_report"]``.
+
+    Args:
+        data (pd.DataFrame): Output data of the step
+        config (MemoryBudgetConfig): Memory footprint reduction configurations
+        step (str): Name of the preparation step
+        columns (List[str]): Columns created or modified by the step
+        bytes_before (int): Memory usage of the input data of the step
+
+    Returns:
+        (pd.DataFrame): Output data with compact dtypes
+    """
+    # Reduce the memory footprint
+    data = reduce_memory_usage(data, config, [column for column in columns if column in data])
+
+    # Report the memory usage
+    bytes_after = int(data.memory_usage(deep=True).sum())
+    data.attrs["memory_report"] = data.attrs.get("memory_report", []) + [
+        {"step": step, "bytes_before": bytes_before, "bytes_after": bytes_after}
+    ]
+
+    logging.info(f"\t🪶 Memory usage after {step}: {bytes_before} → {bytes_after} bytes")
+
+    return data
+
+
+def _gather_date_part(
+    values: np.ndarray, codes: np.ndarray, dtype: str
+) -> Union[np.ndarray, pd.api.extensions.ExtensionArray]:
+    """
+    Gather a date part computed on the unique dates back to the rows through the factorisation
+    ``codes``, casting it to the compact ``dtype``. Integer parts become nullable when a date is missing.
+
+    Args:
+        values (np.ndarray): Date part of the unique dates (NaN for missing dates)
+        codes (np.ndarray): Position of each row in the unique dates (-1 for missing dates)
+        dtype (str): Compact numpy dtype of the part (e.g., ``int8``)
+
+    Returns:
+        (Union[np.ndarray, pd.api.extensions.ExtensionArray]): Date part for each row
+    """
+    # Floating parts carry missing dates as NaN: the appended NaN is gathered by the -1 codes
+    if np.dtype(dtype).kind == "f":
+        return np.append(values, np.nan).astype(dtype)[codes]
+
+    # Integer parts switch to the nullable dtype only when needed
+    if np.isnan(values).any() or (codes < 0).any():
+        return pd.array(values, dtype=dtype.capitalize()).take(codes, allow_fill=True)
+
+    return values.astype(dtype)[codes]
+
+
 def extract_date_information(data: pd.DataFrame, config: DateExtractionConfig) -> pd.DataFrame:
     """
     Extract date information from a column included in the ``config.column_name`` like the year, the month, etc.
+    The column is factorised, so that each unique date string is parsed once (with ``config.date_format``
+    when provided) and every date part is computed on the unique dates only.
 
     Args:
         data (pd.DataFrame): Input data
@@ -144,14 +367,56 @@ def extract_date_information(data: pd.DataFrame, config: DateExtractionConfig) -
 
     logging.info(f"\t🗓️ Extract date information from column: {column_name}")
 
+    # Measure the memory usage before the step
+    bytes_before = int(data.memory_usage(deep=True).sum()) if config.memory_budget else 0
+    input_columns = data.columns
+
+    # Parse each unique date once
+    codes, uniques = pd.factorize(data[column_name])
+    dates = pd.DatetimeIndex(pd.to_datetime(uniques, format=config.date_format))
+
     # Convert column to datetime
-    data[column_name] = pd.to_datetime(data[column_name])
+    data[column_name] = dates.take(codes, allow_fill=True, fill_value=pd.NaT)
+
+    # Define the date parts to extract as (flag, name, unique values, dtype, period)
+    date_parts = [
+        (config.extract_year, "year", dates.year, "int16", None),
+        (config.extract_month, "month", dates.month, "int8", (dates.month - 1, 12)),
+        (config.extract_day, "day", dates.day, "int8", (dates.day - 1, dates.days_in_month)),
+        (config.extract_weekday, "weekday", dates.weekday, "int8", (dates.weekday, 7)),
+        (config.extract_quarter, "quarter", dates.quarter, "int8", None),
+        (config.extract_week, "week", dates.isocalendar().week.astype("Float64"), "int8", None),
+        (config.extract_hour, "hour", dates.hour, "int8", (dates.hour, 24)),
+        (config.extract_epoch, "epoch", dates.as_unit("s").asi8, "int64", None),
+    ]
 
     # Extract date information
-    if config.extract_year:
-        data[f"{column_name}_year"] = data[column_name].dt.year
-    if config.extract_month:
-        data[f"{column_name}_month"] = data[column_name].dt.month
+    missing = dates.isna()
+    for extract, name, values, dtype, period in date_parts:
+        if not extract:
+            continue
+
+        # Mark missing dates as NaN
+        values = np.asarray(values, dtype=np.float64)
+        values[missing] = np.nan
+
+        data[f"{column_name}_{name}"] = _gather_date_part(values, codes, dtype)
+
+        # Add the cyclical encodings
+        if config.cyclical_encoding and period is not None:
+            angle = 2 * np.pi * np.asarray(period[0], dtype=np.float64) / np.asarray(period[1])
+            data[f"{column_name}_{name}_sin"] = _gather_date_part(np.sin(angle), codes, "float32")
+            data[f"{column_name}_{name}_cos"] = _gather_date_part(np.cos(angle), codes, "float32")
+
+    # Reduce the memory footprint of the new columns
+    if config.memory_budget:
+        data = _apply_memory_budget(
+            data,
+            config.memory_budget,
+            "extract_date_information",
+            data.columns.difference(input_columns).to_list(),
+            bytes_before,
+        )
 
     return data
 
@@ -173,6 +438,9 @@ def standardise_features(data: pd.DataFrame, config: NumericalFeaturesConfig) ->
 
     logging.info(f"\t🛠️ Standardise feature {column_name} with method: {standardisation}")
 
+    # Measure the memory usage before the step
+    bytes_before = int(data.memory_usage(deep=True).sum()) if config.memory_budget else 0
+
     # Switch based on the standardisation method
     match standardisation:
         case "min_max_scaler":
@@ -184,10 +452,27 @@ def standardise_features(data: pd.DataFrame, config: NumericalFeaturesConfig) ->
                 data[[column_name]]
             )
 
+        case "standard_scaler":
+            # Standardise a copy of the column in place
+            values = data[column_name].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            _impute_and_standardise_values(values, None, standardisation, out=values)
+
+            data.loc[:, f"{column_name}_standardised"] = values
+
         case _:
             logging.error(f"\t🚨 Unknown standardisation method: {standardisation}")
             raise ValueError("Invalid standardisation method")
 
+    # Reduce the memory footprint of the standardised column
+    if config.memory_budget:
+        data = _apply_memory_budget(
+            data,
+            config.memory_budget,
+            "standardise_features",
+            [f"{column_name}_standardised"],
+            bytes_before,
+        )
+
     return data
 
 
@@ -210,6 +495,9 @@ def drop_outliers(data: pd.DataFrame, config: NumericalFeaturesConfig) -> pd.Dat
         f"\t🪂️ Drop outliers from feature {column_name} with method: {drop_outliers_method}"
     )
 
+    # Measure the memory usage before the step
+    bytes_before = int(data.memory_usage(deep=True).sum()) if config.memory_budget else 0
+
     match drop_outliers_method:
         case "z_score":
             # Compute z-score
@@ -237,6 +525,17 @@ def drop_outliers(data: pd.DataFrame, config: NumericalFeaturesConfig) -> pd.Dat
             logging.error(f"\t🚨 Unknown drop outliers method: {drop_outliers_method}")
             raise ValueError("Invalid drop outliers method")
 
+    if config.memory_budget:
+        # Drop the z-score helper column
+        helper_column_name = f"{column_name}_{drop_outliers_method}"
+        if config.memory_budget.drop_helper_columns and helper_column_name in data:
+            data = data.drop(columns=helper_column_name)
+
+        # Reduce the memory footprint of the helper column (if kept)
+        data = _apply_memory_budget(
+            data, config.memory_budget, "drop_outliers", [helper_column_name], bytes_before
+        )
+
     return data
 
 
@@ -264,6 +563,14 @@ def manage_nan_values(data: pd.DataFrame, config: NumericalFeaturesConfig) -> pd
             # Drop NaN values
             data = data.dropna(subset=[column_name])
 
+        case "simple_imputer":
+            # Fill NaN values of a copy of the column in place
+            values = data[column_name].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            _impute_and_standardise_values(values, config.imputation_method, None)
+
+            # Assign the column on a new frame, since the input might be a slice of the outliers step
+            data = data.assign(**{column_name: values})
+
         case _:
             logging.error(f"\t🚨 Unknown nan values method: {nan_values_method}")
             raise ValueError("Invalid nan values method")
@@ -284,8 +591,13 @@ def prepare_numerical_features(data: pd.DataFrame, config: NumericalFeaturesConf
     Returns:
         (pd.DataFrame): Prepared data
     """
-    # Apply drop outliers
-    data = drop_outliers(data, config)
+    # Apply drop outliers (if configured)
+    if config.drop_outliers is not None:
+        data = drop_outliers(data, config)
+
+    # Impute and standardise with a single pass of the fused kernel
+    if config.nan_values == "simple_imputer" and config.standardisation is not None:
+        return _impute_and_standardise_features(data, config)
 
     # Apply nan values
     data = manage_nan_values(data, config)
@@ -296,6 +608,320 @@ def prepare_numerical_features(data: pd.DataFrame, config: NumericalFeaturesConf
     return data
 
 
+def _impute_and_standardise_features(
+    data: pd.DataFrame, config: NumericalFeaturesConfig
+) -> pd.DataFrame:
+    """
+    Impute and standardise the column ``config.column_name`` computing the statistics once,
+    as ``manage_nan_values`` followed by ``standardise_features`` would do.
+
+    Args:
+        data (pd.DataFrame): Input data
+        config (NumericalFeaturesConfig): Object including transformation configurations
+
+    Returns:
+        (pd.DataFrame): Output data with applied transformation
+    """
+    # Retrieve configurations
+    column_name = config.column_name
+
+    logging.info(
+        f"\t🛠️ Impute and standardise feature {column_name} with methods: "
+        f"{config.imputation_method}, {config.standardisation}"
+    )
+
+    # Measure the memory usage before the step
+    bytes_before = int(data.memory_usage(deep=True).sum()) if config.memory_budget else 0
+
+    # Impute a copy of the column in place and standardise it
+    values = data[column_name].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    standardised_values = _impute_and_standardise_values(
+        values, config.imputation_method, config.standardisation
+    )
+
+    # Assign the columns on a new frame, since the input might be a slice of the outliers step
+    data = data.assign(**{column_name: values, f"{column_name}_standardised": standardised_values})
+
+    # Reduce the memory footprint of the standardised column
+    if config.memory_budget:
+        data = _apply_memory_budget(
+            data,
+            config.memory_budget,
+            "standardise_features",
+            [f"{column_name}_standardised"],
+            bytes_before,
+        )
+
+    return data
+
+
+def _create_shared_array(
+    shape: Tuple[int, ...], dtype: np.dtype
+) -> Tuple[SharedMemory, np.ndarray]:
+    """
+    Allocate a shared memory block and wrap it into a numpy array.
+
+    Args:
+        shape (Tuple[int, ...]): Shape of the array
+        dtype (np.dtype): Data type of the array
+
+    Returns:
+        (Tuple[SharedMemory, np.ndarray]): The shared memory block and the array backed by it
+    """
+    # Allocate at least one byte, since empty shared memory blocks are not allowed
+    size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    shared_memory = SharedMemory(create=True, size=size)
+
+    return shared_memory, np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+
+
+def _attach_shared_array(
+    name: str, shape: Tuple[int, ...], dtype: np.dtype
+) -> Tuple[SharedMemory, np.ndarray]:
+    """
+    Attach to an existing shared memory block and wrap it into a numpy array.
+
+    Args:
+        name (str): Name of the shared memory block
+        shape (Tuple[int, ...]): Shape of the array
+        dtype (np.dtype): Data type of the array
+
+    Returns:
+        (Tuple[SharedMemory, np.ndarray]): The shared memory block and the array backed by it
+    """
+    # The block is owned (and unlinked) by the parent process
+    shared_memory = SharedMemory(name=name, track=False)
+
+    return shared_memory, np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+
+
+def _compute_keep_mask(values: np.ndarray, config: NumericalFeaturesConfig) -> np.ndarray:
+    """
+    Compute the rows of a single column surviving the outliers and NaN values strategies
+    in ``config``. It mirrors ``drop_outliers`` and ``manage_nan_values`` on a numpy array.
+
+    Args:
+        values (np.ndarray): Column values
+        config (NumericalFeaturesConfig): Object including transformation configurations
+
+    Returns:
+        (np.ndarray): Boolean mask of the rows to keep
+    """
+    # Initialise the mask
+    keep = np.ones(values.shape[0], dtype=bool)
+
+    # Drop outliers
+    if config.drop_outliers is not None:
+        match config.drop_outliers.method:
+            case "z_score":
+                # Compute z-score
+                z_score = (values - values.mean()) / values.std()
+                keep &= np.abs(z_score) <= config.drop_outliers.n_std
+
+            case "iqr":
+                # Compute Q1, Q3 and the bounds
+                q1, q3 = np.nanquantile(values, [0.25, 0.75])
+                iqr = q3 - q1
+                keep &= (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+
+            case _:
+                raise ValueError("Invalid drop outliers method")
+
+    # Manage NaN values
+    match config.nan_values:
+        case None:
+            pass
+
+        case "drop_nan":
+            keep &= ~np.isnan(values)
+
+        case "simple_imputer":
+            pass
+
+        case _:
+            raise ValueError("Invalid nan values method")
+
+    return keep
+
+
+def _compute_keep_masks_task(
+    input_name: str, masks_name: str, shape: Tuple[int, int], tasks: List[Tuple[int, dict]]
+) -> None:
+    """
+    Worker task computing the keep mask of a group of columns placed in shared memory.
+
+    Args:
+        input_name (str): Name of the shared memory block with the input columns
+        masks_name (str): Name of the shared memory block where to write the masks
+        shape (Tuple[int, int]): Shape of the input block (n_columns, n_rows)
+        tasks (List[Tuple[int, dict]]): Column positions and their serialised configurations
+    """
+    input_memory, input_array = _attach_shared_array(input_name, shape, np.float64)
+    masks_memory, masks_array = _attach_shared_array(masks_name, shape, np.bool_)
+
+    try:
+        for position, config in tasks:
+            masks_array[position] = _compute_keep_mask(
+                input_array[position], NumericalFeaturesConfig(**config)
+            )
+    finally:
+        # Release the views before closing the blocks
+        del input_array, masks_array
+        input_memory.close()
+        masks_memory.close()
+
+
+def _transform_columns_task(
+    input_name: str,
+    keep_name: str,
+    output_name: str,
+    shape: Tuple[int, int],
+    tasks: List[Tuple[int, dict]],
+) -> None:
+    """
+    Worker task imputing and standardising a group of columns placed in shared memory,
+    fitting the statistics on the rows kept across all columns. The imputed values are
+    written back into the input block.
+
+    Args:
+        input_name (str): Name of the shared memory block with the input columns
+        keep_name (str): Name of the shared memory block with the global keep mask
+        output_name (str): Name of the shared memory block where to write the standardised values
+        shape (Tuple[int, int]): Shape of the input block (n_columns, n_rows)
+        tasks (List[Tuple[int, dict]]): Column positions and their serialised configurations
+    """
+    input_memory, input_array = _attach_shared_array(input_name, shape, np.float64)
+    keep_memory, keep_array = _attach_shared_array(keep_name, (shape[1],), np.bool_)
+    output_memory, output_array = _attach_shared_array(output_name, shape, np.float64)
+
+    try:
+        for position, config in tasks:
+            config = NumericalFeaturesConfig(**config)
+            impute = config.nan_values == "simple_imputer"
+
+            # Impute and standardise the kept rows
+            values = input_array[position, keep_array]
+            standardised_values = _impute_and_standardise_values(
+                values, config.imputation_method if impute else None, config.standardisation
+            )
+
+            if impute:
+                input_array[position, keep_array] = values
+            if standardised_values is not None:
+                output_array[position, keep_array] = standardised_values
+    finally:
+        # Release the views before closing the blocks
+        del input_array, keep_array, output_array
+        input_memory.close()
+        keep_memory.close()
+        output_memory.close()
+
+
+def prepare_numerical_features_parallel(
+    data: pd.DataFrame,
+    configs: List[NumericalFeaturesConfig],
+    parallel_config: ParallelPreparationConfig,
+) -> pd.DataFrame:
+    """
+    Apply the transformations in ``configs`` to several numerical columns through a process pool.
+    The input columns are placed once in shared memory, so that the workers read them
+    without pickling the DataFrame, and write their results back in shared memory.
+
+    Differently from chaining ``prepare_numerical_features``, the outliers and NaN values
+    strategies of every column are evaluated on the input data and the rows dropped by any
+    of them are removed. The imputation and the standardisation are then fitted on the remaining rows.
+
+    Args:
+        data (pd.DataFrame): Input data
+        configs (List[NumericalFeaturesConfig]): Transformation configurations, one per column
+        parallel_config (ParallelPreparationConfig): Process pool configurations
+
+    Returns:
+        (pd.DataFrame): Prepared data
+    """
+    # Retrieve configurations
+    column_names = [config.column_name for config in configs]
+    n_jobs = parallel_config.n_jobs or os.cpu_count() or 1
+    shape = (len(configs), len(data))
+
+    logging.info(f"\t🧩 Prepare {len(configs)} numerical features with {n_jobs} processes")
+
+    # Group the columns into tasks
+    tasks = [(position, config.model_dump()) for position, config in enumerate(configs)]
+    columns_per_task = parallel_config.columns_per_task or -(-len(tasks) // n_jobs)
+    task_groups = [
+        tasks[start : start + columns_per_task] for start in range(0, len(tasks), columns_per_task)
+    ]
+
+    # Allocate the shared memory blocks
+    input_memory, input_array = _create_shared_array(shape, np.float64)
+    masks_memory, masks_array = _create_shared_array(shape, np.bool_)
+    keep_memory, keep_array = _create_shared_array((shape[1],), np.bool_)
+    output_memory, output_array = _create_shared_array(shape, np.float64)
+
+    try:
+        # Place the input columns in shared memory
+        for position, column_name in enumerate(column_names):
+            input_array[position] = data[column_name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            # Compute the rows to keep for every column
+            futures = [
+                executor.submit(
+                    _compute_keep_masks_task, input_memory.name, masks_memory.name, shape, group
+                )
+                for group in task_groups
+            ]
+            for future in futures:
+                future.result()
+
+            # Combine the masks of all the columns
+            np.logical_and.reduce(masks_array, axis=0, out=keep_array)
+
+            # Impute and standardise the columns on the kept rows
+            transformed_groups = [
+                [
+                    (position, config)
+                    for position, config in group
+                    if config["standardisation"] or config["nan_values"] == "simple_imputer"
+                ]
+                for group in task_groups
+            ]
+            futures = [
+                executor.submit(
+                    _transform_columns_task,
+                    input_memory.name,
+                    keep_memory.name,
+                    output_memory.name,
+                    shape,
+                    group,
+                )
+                for group in transformed_groups
+                if group
+            ]
+            for future in futures:
+                future.result()
+
+        # Gather the results into the output frame
+        data = data.loc[keep_array].copy()
+        for position, config in enumerate(configs):
+            if config.nan_values == "simple_imputer":
+                data[config.column_name] = input_array[position, keep_array]
+            if config.standardisation:
+                data[f"{config.column_name}_standardised"] = output_array[position, keep_array]
+
+        logging.info(f"\t✅ Kept {len(data)} rows out of {shape[1]}")
+
+    finally:
+        # Release the views before freeing the shared memory blocks
+        del input_array, masks_array, keep_array, output_array
+        for shared_memory in (input_memory, masks_memory, keep_memory, output_memory):
+            shared_memory.close()
+            shared_memory.unlink()
+
+    return data
+
+
 def create_flag_feature(data: pd.DataFrame, config: FlagFeatureConfig) -> pd.DataFrame:
     """
     Create a flag feature from the column in ``config.column_name``.
@@ -310,7 +936,137 @@ def create_flag_feature(data: pd.DataFrame, config: FlagFeatureConfig) -> pd.Dat
 
     logging.info(f"\t🏳 Creating flag feature from column {config.column_name}")
 
+    # Measure the memory usage before the step
+    bytes_before = int(data.memory_usage(deep=True).sum()) if config.memory_budget else 0
+
     # Create a flag feature where the column has a value
     data.loc[:, config.output_column_name] = data.loc[:, config.column_name].notna()
 
+    # Reduce the memory footprint of the flag (the source column is left as it is)
+    if config.memory_budget:
+        data = _apply_memory_budget(
+            data,
+            config.memory_budget,
+            "create_flag_feature",
+            [config.output_column_name],
+            bytes_before,
+        )
+
     return data
+
+
+def _bitset_column_names(config: BulkFlagFeaturesConfig) -> List[str]:
+    """
+    Compute the names of the ``uint64`` bitset columns, each one holding 64 flags.
+
+    Args:
+        config (BulkFlagFeaturesConfig): Bulk flag features configurations
+
+    Returns:
+        (List[str]): Names of the bitset columns
+    """
+    n_words = -(-len(config.flags) // 64)
+
+    return [f"{config.bitset_column_prefix}_{word}" for word in range(n_words)]
+
+
+def create_flag_features(data: pd.DataFrame, config: BulkFlagFeaturesConfig) -> pd.DataFrame:
+    """
+    Create all the flag features in ``config.flags`` with a single vectorised pass
+    over the selected columns. The flags are stored according to ``config.representation``:
+
+        - dense: one ``bool`` column per flag (as ``create_flag_feature``)
+
+        - bitset: ``uint64`` columns, where bit ``i`` of column ``k`` is the flag ``64 * k + i``
+
+        - sparse: one sparse ``bool`` column per flag, storing only the rows with a value
+
+    Args:
+        data (pd.DataFrame): Input data
+        config (BulkFlagFeaturesConfig): Bulk flag features configurations
+
+    Returns:
+        (pd.DataFrame): Prepared data
+    """
+    # Retrieve configurations
+    column_names = [flag.column_name for flag in config.flags]
+    output_column_names = [flag.output_column_name for flag in config.flags]
+
+    logging.info(f"\t🏳 Creating {len(config.flags)} flag features as {config.representation.value}")
+
+    # Compute all the null masks at once
+    masks = data[column_names].notna().to_numpy()
+
+    match config.representation:
+        case "dense":
+            flags = pd.DataFrame(masks, columns=output_column_names, index=data.index)
+
+        case "bitset":
+            # Pad the flags to a multiple of 64 and pack them into little-endian words
+            bitset_column_names = _bitset_column_names(config)
+            padded_masks = np.zeros((len(data), len(bitset_column_names) * 64), dtype=bool)
+            padded_masks[:, : len(config.flags)] = masks
+            words = np.packbits(padded_masks, axis=1, bitorder="little").view("<u8")
+
+            flags = pd.DataFrame(
+                words.astype(np.uint64), columns=bitset_column_names, index=data.index
+            )
+
+        case "sparse":
+            flags = pd.DataFrame(
+                {
+                    output_column_name: pd.arrays.SparseArray(masks[:, position], fill_value=False)
+                    for position, output_column_name in enumerate(output_column_names)
+                },
+                index=data.index,
+            )
+
+        case _:
+            logging.error(f"\t🚨 Unknown flag representation: {config.representation}")
+            raise ValueError("Invalid flag representation")
+
+    return pd.concat([data, flags], axis=1)
+
+
+def unpack_flag_features(
+    data: pd.DataFrame,
+    config: BulkFlagFeaturesConfig,
+    output_column_names: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Unpack the flag features created by ``create_flag_features`` into dense ``bool`` columns.
+
+    Args:
+        data (pd.DataFrame): Data including the flag features
+        config (BulkFlagFeaturesConfig): Bulk flag features configurations
+        output_column_names (Optional[List[str]]): Flags to unpack (all the flags if not set)
+
+    Returns:
+        (pd.DataFrame): Dense flag features
+    """
+    # Retrieve the flags to unpack
+    all_column_names = [flag.output_column_name for flag in config.flags]
+    output_column_names = output_column_names or all_column_names
+
+    match config.representation:
+        case "dense":
+            flags = data[output_column_names]
+
+        case "bitset":
+            # Extract each flag from its word
+            words = data[_bitset_column_names(config)].to_numpy(dtype=np.uint64)
+            flags = {}
+            for output_column_name in output_column_names:
+                word, bit = divmod(all_column_names.index(output_column_name), 64)
+                flags[output_column_name] = (words[:, word] >> np.uint64(bit)) & np.uint64(1) == 1
+
+            flags = pd.DataFrame(flags, index=data.index)
+
+        case "sparse":
+            flags = data[output_column_names].sparse.to_dense()
+
+        case _:
+            logging.error(f"\t🚨 Unknown flag representation: {config.representation}")
+            raise ValueError("Invalid flag representation")
+
+    return flags
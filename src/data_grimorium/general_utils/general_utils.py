@@ -6,6 +6,14 @@ specific technology or SDK binding (e.g., Google SDK)
 # Import Standard Libraries
 import logging
 import pathlib
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from typing import Dict, Iterable, Tuple, Union
+from urllib.parse import quote
+
+# Import Package Modules
+from data_grimorium.general_utils.general_utils_types import ParquetSpillConfig, ParquetSpillHandle
 
 # Setup logging
 logging.basicConfig(
@@ -46,3 +54,116 @@ def read_file_from_path(file_path: pathlib.Path, root_path: pathlib.Path) -> str
         raise FileNotFoundError(f"\t❌ Unable to locate file: {file_path.as_posix()}")
 
     return file_read
+
+
+def write_parquet_chunks(
+    chunks: Iterable[Union[pa.Table, pa.RecordBatch]],
+    output_path: pathlib.Path,
+    spill_config: ParquetSpillConfig,
+) -> ParquetSpillHandle:
+    """
+    Write Arrow chunks into a Parquet dataset, one chunk at a time, so that the whole data
+    is never held in memory. Without partition columns the dataset is a single
+    ``part-00000.parquet`` file, otherwise a file in each Hive-style directory
+    (e.g., ``country=IT/part-00000.parquet``). Existing files with the same names are overwritten,
+    the other files of the directory are left as they are (and ignored by the returned handle).
+    The schema is promoted across chunks (e.g., a column of NULL values in the first chunk
+    and of ``double`` values later): a partition whose file was opened with an older schema
+    continues in a new file (e.g., ``part-00001.parquet``).
+
+    Args:
+        chunks (Iterable[Union[pa.Table, pa.RecordBatch]]): Chunks with compatible schemas
+        output_path (pathlib.Path): Directory of the Parquet dataset
+        spill_config (ParquetSpillConfig): Row group size, partitioning and compression
+
+    Returns:
+        (ParquetSpillHandle): Path, number of rows, schema and files of the dataset
+    """
+    partition_columns = spill_config.partition_columns or []
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    logging.info(f"\t💾 Write Parquet dataset to {output_path.as_posix()}")
+
+    writers: Dict[Tuple, pq.ParquetWriter] = {}
+    directories: Dict[Tuple, pathlib.Path] = {}
+    indexes: Dict[Tuple, int] = {}
+    files = []
+    schema = None
+    rows = 0
+
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_batches([chunk]) if isinstance(chunk, pa.RecordBatch) else chunk
+
+            # The first chunk sets the schema of the dataset, the next ones can promote it
+            if schema is None:
+                missing = set(partition_columns) - set(table.column_names)
+                if missing:
+                    raise ValueError(f"🚨 Unknown partition columns: {sorted(missing)}")
+                schema = table.schema
+            elif table.schema != schema:
+                schema = pa.unify_schemas([schema, table.schema], promote_options="permissive")
+            table = table.select(schema.names).cast(schema)
+            rows += table.num_rows
+
+            # Split the chunk by the values of the partition columns
+            if partition_columns:
+                keys = table.select(partition_columns).group_by(partition_columns).aggregate([])
+                parts = []
+                for key in keys.to_pylist():
+                    mask = None
+                    for column, value in key.items():
+                        condition = (
+                            pc.is_null(table[column])
+                            if value is None
+                            else pc.equal(table[column], value)
+                        )
+                        mask = condition if mask is None else pc.and_(mask, condition)
+                    parts.append(
+                        (tuple(key.values()), table.filter(mask).drop_columns(partition_columns))
+                    )
+            else:
+                parts = [((), table)]
+
+            for key, part in parts:
+                # Open a file per partition on first use or when the schema was promoted
+                if key not in writers or writers[key].schema != part.schema:
+                    if key in writers:
+                        writers[key].close()
+                        directory, index = directories[key], indexes[key] + 1
+                    else:
+                        # Values are formatted by Arrow and URI-encoded as expected by Hive readers
+                        directory, index = pathlib.Path(), 0
+                        for column, value in zip(partition_columns, key):
+                            if value is None:
+                                value = "__HIVE_DEFAULT_PARTITION__"
+                            else:
+                                value = quote(
+                                    pa.scalar(value, schema.field(column).type)
+                                    .cast(pa.string())
+                                    .as_py(),
+                                    safe="",
+                                )
+                            directory = directory / f"{column}={value}"
+                        (output_path / directory).mkdir(parents=True, exist_ok=True)
+                    directories[key], indexes[key] = directory, index
+                    files.append((directory / f"part-{index:05d}.parquet").as_posix())
+                    writers[key] = pq.ParquetWriter(
+                        output_path / files[-1],
+                        part.schema,
+                        compression=spill_config.compression,
+                        compression_level=spill_config.compression_level,
+                    )
+                writers[key].write_table(part, row_group_size=spill_config.row_group_size)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    logging.info(f"\t✅ Written {rows} rows in {len(files)} Parquet files")
+
+    return ParquetSpillHandle(
+        path=output_path.as_posix(),
+        rows=rows,
+        columns={field.name: str(field.type) for field in schema} if schema else {},
+        files=files,
+    )
@@ -0,0 +1,80 @@
+"""
+The module includes Pydantic types for the general utils shared by the connectors.
+"""
+
+# Import Standard Modules
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+
+class ParquetSpillConfig(BaseModel):
+    """
+    Configuration to write query results as Parquet files, chunk by chunk
+
+    Attributes:
+        row_group_size (Integer): Maximum number of rows per chunk and row group
+        partition_columns (List[String]): [Optional] Columns of the Hive-style partition directories
+        compression (String): Parquet compression codec (e.g., snappy, zstd, gzip, none)
+        compression_level (Integer): [Optional] Level of the compression codec
+    """
+
+    row_group_size: int = Field(100_000, gt=0, description="Maximum number of rows per row group")
+    partition_columns: Optional[List[str]] = Field(
+        None, description="Columns of the Hive-style partition directories"
+    )
+    compression: str = Field("snappy", description="Parquet compression codec")
+    compression_level: Optional[int] = Field(None, description="Level of the compression codec")
+
+
+class ParquetSpillHandle(BaseModel):
+    """
+    Lightweight handle of query results written as Parquet files
+
+    Attributes:
+        path (String): Directory of the Parquet dataset
+        rows (Integer): Number of written rows
+        columns (Dict[String, String]): Arrow type by column name (including the partition columns)
+        files (List[String]): Written files, relative to ``path``
+    """
+
+    path: str = Field(..., description="Directory of the Parquet dataset")
+    rows: int = Field(..., description="Number of written rows")
+    columns: Dict[str, str] = Field(..., description="Arrow type by column name")
+    files: List[str] = Field(..., description="Written files, relative to path")
+
+    def read(self) -> pd.DataFrame:
+        """
+        Read the written files into a DataFrame, with the values of the partition columns
+        inferred from the directory names. Other files of the directory are ignored.
+
+        Returns:
+            (pd.DataFrame): The written data
+        """
+        if not self.files:
+            return pd.DataFrame(columns=list(self.columns))
+
+        paths = [f"{self.path}/{file}" for file in self.files]
+        dataset = ds.dataset(
+            paths, format="parquet", partitioning="hive", partition_base_dir=self.path
+        )
+
+        # Files written before a schema promotion have an older schema
+        schema = pa.unify_schemas(
+            [dataset.schema] + [fragment.physical_schema for fragment in dataset.get_fragments()],
+            promote_options="permissive",
+        )
+
+        return (
+            ds.dataset(
+                paths,
+                schema=schema,
+                format="parquet",
+                partitioning="hive",
+                partition_base_dir=self.path,
+            )
+            .to_table()
+            .to_pandas()
+        )
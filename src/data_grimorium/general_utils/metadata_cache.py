@@ -0,0 +1,84 @@
+"""
+The module includes a thread-safe cache with time-to-live used by the connectors
+in order to avoid repeated metadata lookups (e.g., schemas, tables and column types).
+"""
+
+# Import Standard Libraries
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class MetadataCache:
+    """
+    The class implements a thread-safe metadata cache with time-to-live.
+    Keys are tuples whose first element is the kind of metadata
+    (e.g., ``("table", "dataset.users")``), so that entries can be invalidated by prefix.
+
+    Attributes:
+        _ttl_seconds (float): Seconds after which an entry expires (0 disables the cache)
+        _entries (Dict[Tuple, Tuple[Any, float]]): Cached values with their expiry time
+        _lock (threading.Lock): Lock guarding the entries
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Constructor of the class MetadataCache
+
+        Args:
+            ttl_seconds (float): Seconds after which an entry expires (0 disables the cache)
+        """
+        # Initialise attributes
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+        # Initialise metrics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key (Tuple[Hashable, ...]): Key of the entry
+
+        Returns:
+            (Optional[Any]): The cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """
+        Cache a value for ``ttl_seconds``.
+
+        Args:
+            key (Tuple[Hashable, ...]): Key of the entry
+            value (Any): Value to cache (None values are not cached)
+        """
+        if self._ttl_seconds <= 0 or value is None:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self._ttl_seconds)
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """
+        Remove the entries whose key starts with ``prefix`` (all the entries if empty).
+
+        Args:
+            prefix (Hashable): First elements of the keys to remove
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[: len(prefix)] == prefix]:
+                del self._entries[key]
@@ -0,0 +1,387 @@
+"""
+The module includes an asyncio connector in order to interact
+with the PostgreSQL database from async services.
+"""
+
+# Import Standard Libraries
+import asyncio
+import logging
+import time
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+from psycopg import AsyncClientCursor, AsyncConnection, Error, sql
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import AsyncConnectionPool
+
+# Import Package Modules
+from data_grimorium.general_utils.general_utils import read_file_from_path
+from data_grimorium.postgresql_connector.postgresql_connector import PostgreSQLConnector
+from data_grimorium.postgresql_connector.postgresql_types import (
+    PostgreSQLClientConfig,
+    PostgreSQLQueryConfig,
+    PostgreSQLPoolConfig,
+    PostgreSQLPoolMetrics,
+)
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M",
+)
+
+
+class AsyncPostgreSQLConnector:
+    """
+    The class implements an asyncio PostgreSQL Connector on top of ``psycopg`` (version 3)
+    and its connection pool, with the same surface of ``PostgreSQLConnector``.
+    Independent queries can be sent in pipeline mode, without waiting for each response.
+
+    Attributes:
+        _root_path (pathlib.Path): Root path of the project
+        _client_config (PostgreSQLClientConfig): Client configurations
+        _pool_config (PostgreSQLPoolConfig): Connection pool configurations
+        _pool (AsyncConnectionPool): Connection pool (opened on first use)
+        _lock (asyncio.Lock): Lock guarding the pool creation
+    """
+
+    def __init__(
+        self,
+        client_config: PostgreSQLClientConfig,
+        root_path: Path,
+        pool_config: Optional[PostgreSQLPoolConfig] = None,
+    ):
+        """
+        Constructor of the class AsyncPostgreSQLConnector
+
+        Args:
+            client_config (PostgreSQLClientConfig): Config for instance a PostgreSQL Client
+            root_path (Path): Root path to the project
+            pool_config (Optional[PostgreSQLPoolConfig]): Config for the connection pool
+        """
+        # Initialise attributes
+        self._client_config = client_config
+        self._root_path = root_path
+        self._pool_config = pool_config or PostgreSQLPoolConfig()
+        self._pool = None
+        self._lock = asyncio.Lock()
+
+    async def _get_pool(self) -> AsyncConnectionPool:
+        """
+        Retrieve the connection pool, opening it on first use.
+
+        Returns:
+            (AsyncConnectionPool): The connection pool of the connector
+        """
+        async with self._lock:
+            if self._pool is None:
+                logging.info(
+                    f"🏊 Create async connection pool with sizes "
+                    f"[{self._pool_config.min_size}, {self._pool_config.max_size}]"
+                )
+                # Decode text as UTF-8 like psycopg2, even on SQL_ASCII databases
+                pool = AsyncConnectionPool(
+                    make_conninfo(**self._client_config.model_dump(), client_encoding="utf8"),
+                    min_size=self._pool_config.min_size,
+                    max_size=self._pool_config.max_size,
+                    timeout=self._pool_config.checkout_timeout,
+                    max_idle=self._pool_config.idle_timeout,
+                    check=AsyncConnectionPool.check_connection,
+                    open=False,
+                )
+                await pool.open(wait=True)
+                self._pool = pool
+
+            return self._pool
+
+    @staticmethod
+    async def _set_schema(conn: AsyncConnection, schema: str | None) -> None:
+        """
+        Set ``schema`` as ``search_path`` for the current transaction only,
+        so that pooled connections are returned with their default ``search_path``.
+
+        Args:
+            conn (AsyncConnection): Connection within a transaction
+            schema (str): Name of the schema to use
+        """
+        if schema:
+            await conn.execute("SELECT set_config('search_path', %s, true)", (schema,))
+
+    async def _create_schema(self, conn: AsyncConnection, schema: str) -> None:
+        """
+        Create a schema if it does not exist. The schema is looked up in ``pg_namespace``
+        first, since ``CREATE SCHEMA IF NOT EXISTS`` requires the CREATE privilege
+        on the database even when the schema exists (e.g., for read-only roles).
+
+        Args:
+            conn (AsyncConnection): Connection to use
+            schema (str): Name of the schema to create
+        """
+        cursor = await conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_namespace WHERE nspname = %s)", (schema,)
+        )
+        if not (await cursor.fetchone())[0]:
+            await conn.execute(
+                sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema))
+            )
+
+    async def pool_metrics(self) -> PostgreSQLPoolMetrics:
+        """
+        Retrieve the wait time and utilisation metrics of the connection pool.
+
+        Returns:
+            (PostgreSQLPoolMetrics): Connection pool metrics
+        """
+        pool = await self._get_pool()
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        idle = stats.get("pool_available", 0)
+
+        return PostgreSQLPoolMetrics(
+            size=size,
+            in_use=size - idle,
+            idle=idle,
+            utilisation=(size - idle) / self._pool_config.max_size,
+            checkouts=stats.get("requests_num", 0),
+            total_wait_seconds=stats.get("requests_wait_ms", 0) / 1000,
+            max_wait_seconds=0.0,
+            created=stats.get("connections_num", 0),
+            discarded=stats.get("connections_lost", 0) + stats.get("returns_bad", 0),
+        )
+
+    async def close(self) -> None:
+        """
+        Close the pooled connections.
+        """
+        async with self._lock:
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+
+    async def execute_query_from_config(
+        self, query_config: PostgreSQLQueryConfig
+    ) -> Union[pd.DataFrame, bool]:
+        """
+        Execute a query from local path and with a certain set of parameter configurations.
+
+        Args:
+            query_config (PostgreSQLQueryConfig): Query configuration
+
+        Returns:
+            (Union[pd.DataFrame, bool]): The result of the query execution.
+            Either the data or a bool in case of table creation.
+        """
+        return (await self.execute_queries_from_config([query_config]))[0]
+
+    async def execute_queries_from_config(
+        self, query_configs: Sequence[PostgreSQLQueryConfig]
+    ) -> List[Union[pd.DataFrame, bool]]:
+        """
+        Execute queries from local paths over a single connection in pipeline mode:
+        every statement is sent before reading the responses, saving a round trip per query.
+
+        The queries must not depend on the results of each other and run in a single
+        transaction, so any failure rolls all of them back (including the queries that succeeded).
+        The parameters are bound on the client side, so they can be used in any position
+        (e.g., ``SET`` or DDL statements). The pipeline mode does not support multiple statements
+        in a single query, therefore each SQL file must contain a single statement.
+
+        Args:
+            query_configs (Sequence[PostgreSQLQueryConfig]): Query configurations
+
+        Returns:
+            (List[Union[pd.DataFrame, bool]]): The result of each query, in order.
+            Either the data or a bool in case of table creation.
+        """
+        # Read the queries
+        queries = [
+            read_file_from_path(Path(query_config.query_path), self._root_path)
+            for query_config in query_configs
+        ]
+
+        logging.info(f"🚀 Execute {len(queries)} queries in pipeline mode")
+        start = time.perf_counter()
+
+        pool = await self._get_pool()
+        try:
+            async with pool.connection() as conn:
+                async with conn.transaction():
+                    for schema in dict.fromkeys(config.schema for config in query_configs):
+                        await self._create_schema(conn, schema)
+
+                    async with conn.pipeline():
+                        cursors = []
+                        for query_config, query in zip(query_configs, queries):
+                            await self._set_schema(conn, query_config.schema)
+                            cursor = AsyncClientCursor(conn)
+                            await cursor.execute(query, query_config.query_parameters or None)
+                            cursors.append(cursor)
+
+                    # Read the responses
+                    results = []
+                    for cursor in cursors:
+                        if cursor.description:
+                            results.append(
+                                PostgreSQLConnector._build_dataframe(
+                                    await cursor.fetchall(), cursor.description
+                                )
+                            )
+                        else:
+                            results.append(True)  # For CREATE, INSERT, UPDATE, etc.
+
+        except Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        logging.info(
+            f"✅ {len(queries)} queries executed successfully "
+            f"in {time.perf_counter() - start:.3f} seconds"
+        )
+
+        return results
+
+    async def schema_exists(self, schema: str) -> bool:
+        """
+        Check if a schema exists in the database.
+
+        Args:
+            schema (str): Name of the schema to check.
+
+        Returns:
+            (bool): True if the schema exists, False otherwise.
+        """
+        pool = await self._get_pool()
+        try:
+            async with pool.connection() as conn:
+                cursor = await conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_namespace WHERE nspname = %s)",
+                    (schema,),
+                )
+                exists = (await cursor.fetchone())[0]
+
+        except Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        logging.info(f"🕵🏻 Schema {schema} exists? → {exists}")
+
+        return exists
+
+    async def table_exists(self, table_name: str, schema: str | None = None) -> bool:
+        """
+        Check if a table (or view) exists in the database.
+
+        Args:
+            table_name (str): Name of the table to check.
+            schema (str): Name of the schema to use (any schema if None)
+
+        Returns:
+            (bool): True if the table exists, False otherwise.
+        """
+        pool = await self._get_pool()
+        try:
+            async with pool.connection() as conn:
+                cursor = await conn.execute(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1
+                        FROM pg_catalog.pg_class c
+                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                        WHERE c.relname = %(table_name)s
+                          AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                          AND (%(schema)s::text IS NULL OR n.nspname = %(schema)s)
+                    )
+                    """,
+                    {"table_name": table_name, "schema": schema},
+                )
+                exists = (await cursor.fetchone())[0]
+
+        except Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        logging.info(f"🕵🏻 Table {table_name} exists? → {exists}")
+
+        return exists
+
+    async def upload_dataframe(
+        self,
+        data: pd.DataFrame,
+        table_name: str,
+        schema: str = "public",
+        replace: bool = False,
+        chunk_size: int = 100_000,
+    ) -> int:
+        """
+        Upload a DataFrame to a PostgreSQL table through ``COPY ... FROM STDIN``.
+        The table is created from the DataFrame dtypes when it does not exist.
+
+        Args:
+            data (pd.DataFrame): Data to upload.
+            table_name (str): Name of the table.
+            schema (str): Name of the schema to use
+            replace (bool): If True, drop and recreate the table.
+            chunk_size (int): Number of rows serialised at once.
+
+        Returns:
+            (int): Number of uploaded rows
+        """
+        # Check if the DataFrame is empty
+        if data.empty:
+            raise ValueError("🚨 The provided DataFrame is empty and cannot be uploaded.")
+
+        logging.info(
+            f"🪁 Upload {len(data)} into the table {self._client_config.dbname}.{table_name}"
+        )
+
+        # Build the statements
+        table = sql.Identifier(schema, table_name)
+        columns = sql.SQL(", ").join(sql.Identifier(column) for column in data.columns)
+        columns_definition = sql.SQL(", ").join(
+            sql.SQL("{} {}").format(
+                sql.Identifier(column), sql.SQL(PostgreSQLConnector._postgresql_type(dtype))
+            )
+            for column, dtype in data.dtypes.items()
+        )
+
+        start = time.perf_counter()
+        pool = await self._get_pool()
+        try:
+            async with pool.connection() as conn:
+                async with conn.transaction():
+                    await self._create_schema(conn, schema)
+
+                    # Create the table from the dtypes
+                    if replace:
+                        await conn.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(table))
+                    await conn.execute(
+                        sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+                            table, columns_definition
+                        )
+                    )
+
+                    # Stream the chunks
+                    async with conn.cursor() as cursor:
+                        async with cursor.copy(
+                            sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+                                table, columns
+                            )
+                        ) as copy:
+                            for chunk_start in range(0, len(data), chunk_size):
+                                chunk = data.iloc[chunk_start : chunk_start + chunk_size]
+                                await copy.write(
+                                    PostgreSQLConnector._serialise_csv_chunk(chunk).getvalue()
+                                )
+
+        except Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        elapsed = time.perf_counter() - start
+        logging.info(
+            f"✅ Data uploaded to {self._client_config.dbname}.{table_name} "
+            f"({len(data) / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+
+        return len(data)
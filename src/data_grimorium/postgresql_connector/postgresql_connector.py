@@ -4,19 +4,53 @@ with the PostgreSQL database.
 """
 
 # Import Standard Libraries
+import csv
+import datetime
+import hashlib
+import io
 import logging
+import re
+import struct
+import threading
+import time
+import uuid
 import psycopg2
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager
+from decimal import Decimal
 from pathlib import Path
-from typing import Union
-from sqlalchemy import create_engine
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from psycopg2 import sql
+from psycopg2.extensions import connection as Connection
+from psycopg2.extras import execute_batch, execute_values
+from sqlalchemy import create_engine, Engine
 
 
 # Import Package Modules
-from data_grimorium.general_utils.general_utils import read_file_from_path
+from data_grimorium.general_utils.general_utils import read_file_from_path, write_parquet_chunks
+from data_grimorium.general_utils.general_utils_types import ParquetSpillConfig, ParquetSpillHandle
+from data_grimorium.postgresql_connector.postgresql_pool import PostgreSQLConnectionPool
+from data_grimorium.postgresql_connector.postgresql_metadata_cache import PostgreSQLMetadataCache
 from data_grimorium.postgresql_connector.postgresql_types import (
+    ChunkFormat,
+    EmbeddingStorage,
     PostgreSQLClientConfig,
+    PostgreSQLMetadataCacheConfig,
+    PostgreSQLPartitionConfig,
     PostgreSQLQueryConfig,
+    PostgreSQLPoolConfig,
+    PostgreSQLPoolMetrics,
+    PostgreSQLProfilingConfig,
+    PostgreSQLQueryProfile,
+    PostgreSQLStatementCacheConfig,
+    PostgreSQLStatementCacheMetrics,
+    PostgreSQLStreamConfig,
+    PostgreSQLUpsertResult,
+    UploadMethod,
 )
 
 # Setup logging
@@ -27,6 +61,24 @@ logging.basicConfig(
 )
 
 
+# Pandas and Arrow types of the PostgreSQL type OIDs (other types are kept as Python objects)
+_OID_TYPES = {
+    16: ("boolean", pa.bool_()),
+    19: ("object", pa.string()),
+    20: ("Int64", pa.int64()),
+    21: ("Int16", pa.int16()),
+    23: ("Int32", pa.int32()),
+    25: ("object", pa.string()),
+    700: ("float32", pa.float32()),
+    701: ("float64", pa.float64()),
+    1042: ("object", pa.string()),
+    1043: ("object", pa.string()),
+    1082: ("datetime64[ns]", pa.date32()),
+    1114: ("datetime64[ns]", pa.timestamp("us")),
+    1184: ("datetime64[ns, UTC]", pa.timestamp("us", tz="UTC")),
+}
+
+
 class PostgreSQLConnector:
     """
     The class implements a PostgreSQL Connector
@@ -35,22 +87,63 @@ class PostgreSQLConnector:
     Attributes:
         _root_path (pathlib.Path): Root path of the project
         _client_config (PostgreSQLClientConfig): Client configurations
+        _pool_config (PostgreSQLPoolConfig): Connection pool configurations
+        _pool (PostgreSQLConnectionPool): Connection pool (created on first use)
+        _engine (Engine): SQLAlchemy engine (created on first use)
+        _metadata_cache (PostgreSQLMetadataCache): Cache of schema and table existence and column types
+        _statement_cache_config (PostgreSQLStatementCacheConfig): Statement cache configurations
+        _sql_files (Dict[Path, Tuple[int, str]]): SQL files content with their modification time
+        _executions (Dict[Tuple[str, str], int]): Number of executions by query and schema
+        _profiles (List[PostgreSQLQueryProfile]): Registry of the recorded query profiles
     """
 
-    def __init__(self, client_config: PostgreSQLClientConfig, root_path: Path):
+    def __init__(
+        self,
+        client_config: PostgreSQLClientConfig,
+        root_path: Path,
+        pool_config: Optional[PostgreSQLPoolConfig] = None,
+        metadata_cache_config: Optional[PostgreSQLMetadataCacheConfig] = None,
+        statement_cache_config: Optional[PostgreSQLStatementCacheConfig] = None,
+    ):
         """
         Constructor of the class PostgreSQLConnector
 
         Args:
             client_config (PostgreSQLClientConfig): Config for instance a PostgreSQL Client
+            root_path (Path): Root path to the project
+            pool_config (Optional[PostgreSQLPoolConfig]): Config for the connection pool
+            metadata_cache_config (Optional[PostgreSQLMetadataCacheConfig]): Config for the metadata cache
+            statement_cache_config (Optional[PostgreSQLStatementCacheConfig]): Config for the SQL file
+                and prepared statement caches
         """
         # Initialise attributes
         self._client_config = client_config
         self._root_path = root_path
+        self._pool_config = pool_config or PostgreSQLPoolConfig()
+        self._pool = None
+        self._engine = None
+        self._lock = threading.Lock()
+        self._metadata_cache = PostgreSQLMetadataCache(
+            (metadata_cache_config or PostgreSQLMetadataCacheConfig()).ttl_seconds
+        )
+        self._statement_cache_config = statement_cache_config or PostgreSQLStatementCacheConfig()
+        self._sql_files: Dict[Path, Tuple[int, str]] = {}
+        self._executions: Dict[Tuple[str, str | None], int] = {}
+        self._prepare_seconds: Dict[Tuple[str, str | None], float] = {}
+        self._unpreparable = set()
+        self._profiles: List[PostgreSQLQueryProfile] = []
+
+        # Initialise statement cache metrics
+        self._sql_file_hits = 0
+        self._sql_file_misses = 0
+        self._prepared_statements = 0
+        self._prepared_hits = 0
+        self._saved_seconds = 0.0
 
     def _get_connection(self, schema: str | None = None):
         """
         Creates and returns a new PostgreSQL connection.
+        It is used by the connection pool to open its connections.
         """
         # Open connection
         connection = psycopg2.connect(**self._client_config.model_dump())
@@ -68,162 +161,1799 @@ class PostgreSQLConnector:
 
         return connection
 
+    def _get_pool(self) -> PostgreSQLConnectionPool:
+        """
+        Retrieve the connection pool, creating it on first use.
+
+        Returns:
+            (PostgreSQLConnectionPool): The connection pool of the connector
+        """
+        with self._lock:
+            if self._pool is None:
+                logging.info(
+                    f"🏊 Create connection pool with sizes "
+                    f"[{self._pool_config.min_size}, {self._pool_config.max_size}]"
+                )
+                self._pool = PostgreSQLConnectionPool(self._get_connection, self._pool_config)
+
+            return self._pool
+
+    def _connection(self, schema: str | None = None) -> AbstractContextManager[Connection]:
+        """
+        Check out a pooled connection with ``schema`` as ``search_path``.
+        The transaction is committed when the block succeeds and rolled back otherwise.
+
+        Args:
+            schema (str): Name of the schema to use
+
+        Returns:
+            (AbstractContextManager[Connection]): Context manager returning the connection to the pool
+        """
+        return self._get_pool().connection(schema)
+
+    def _get_engine(self) -> Engine:
+        """
+        Retrieve the SQLAlchemy engine, creating it on first use.
+
+        Returns:
+            (Engine): The SQLAlchemy engine of the connector
+        """
+        with self._lock:
+            if self._engine is None:
+                self._engine = create_engine(self._client_config.as_sqlalchemy_engine_url())
+
+            return self._engine
+
+    def pool_metrics(self) -> PostgreSQLPoolMetrics:
+        """
+        Retrieve the wait time and utilisation metrics of the connection pool.
+
+        Returns:
+            (PostgreSQLPoolMetrics): Connection pool metrics
+        """
+        return self._get_pool().metrics()
+
+    def close(self) -> None:
+        """
+        Close the pooled connections and the SQLAlchemy engine.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+
+    @staticmethod
+    def _build_dataframe(rows: List[Tuple], description: Sequence) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from the fetched rows, using the type OIDs
+        in ``cursor.description`` to fill typed arrays instead of inferring dtypes
+        from boxed Python objects. Integers and booleans are nullable.
+
+        Args:
+            rows (List[Tuple]): Fetched rows
+            description (Sequence): Cursor description of the result
+
+        Returns:
+            (pd.DataFrame): Data with typed columns
+        """
+        columns = [desc[0] for desc in description]
+        values = list(zip(*rows)) or [()] * len(columns)
+
+        arrays = []
+        for desc, column_values in zip(description, values):
+            dtype = _OID_TYPES.get(desc.type_code, (None, None))[0]
+
+            # Switch based on the dtype
+            match dtype:
+                case "float32" | "float64":
+                    arrays.append(np.array(column_values, dtype=dtype))
+                case "boolean" | "Int16" | "Int32" | "Int64":
+                    arrays.append(pd.array(column_values, dtype=dtype))
+                case "datetime64[ns]" | "datetime64[ns, UTC]":
+                    try:
+                        arrays.append(
+                            pd.to_datetime(
+                                pd.Series(column_values, dtype=object), utc="UTC" in dtype
+                            )
+                        )
+                    except (ValueError, OverflowError):
+                        # Keep values outside of the nanosecond range (e.g., infinity) as objects
+                        arrays.append(pd.Series(column_values, dtype=object))
+                case _:
+                    arrays.append(pd.Series(column_values, dtype=object))
+
+        data = pd.DataFrame(dict(enumerate(arrays)))
+        data.columns = columns
+
+        return data
+
+    @staticmethod
+    def _build_arrow_table(rows: List[Tuple], description: Sequence) -> pa.Table:
+        """
+        Build an Arrow table column by column from the fetched rows, using the type OIDs
+        in ``cursor.description`` for the Arrow types (inferred for the other types).
+
+        Args:
+            rows (List[Tuple]): Fetched rows
+            description (Sequence): Cursor description of the result
+
+        Returns:
+            (pa.Table): Data with typed columns
+        """
+        columns = [desc[0] for desc in description]
+        values = list(zip(*rows)) or [()] * len(columns)
+
+        return pa.Table.from_arrays(
+            [
+                pa.array(column_values, type=_OID_TYPES.get(desc.type_code, (None, None))[1])
+                for desc, column_values in zip(description, values)
+            ],
+            names=columns,
+        )
+
+    def _read_query(self, query_path: Path) -> str:
+        """
+        Read a SQL file, caching its content until its modification time changes.
+
+        Args:
+            query_path (Path): Path of the SQL file relative to the root path
+
+        Returns:
+            (str): The SQL query
+        """
+        file_path = self._root_path / query_path
+
+        try:
+            modified = file_path.stat().st_mtime_ns
+        except OSError:
+            # Let the file reader raise the error
+            return read_file_from_path(query_path, self._root_path)
+
+        with self._lock:
+            cached = self._sql_files.get(file_path)
+            if cached is not None and cached[0] == modified:
+                self._sql_file_hits += 1
+                return cached[1]
+
+        query = read_file_from_path(query_path, self._root_path)
+
+        with self._lock:
+            self._sql_files[file_path] = (modified, query)
+            self._sql_file_misses += 1
+
+        return query
+
+    @staticmethod
+    def _strip_statement(query: str) -> str:
+        """
+        Remove the comments, the surrounding whitespaces and the trailing semicolon of a statement.
+        String literals, quoted identifiers and dollar-quoted strings are kept as they are,
+        even if they contain ``--`` or ``/*``.
+
+        Args:
+            query (str): SQL query
+
+        Returns:
+            (str): The stripped statement
+        """
+        statement = re.sub(
+            r"""(?P<quoted>(?<![\w$])[eE]'(?:[^'\\]|\\.|'')*'|'(?:[^']|'')*'|"(?:[^"]|"")*"|"""
+            r"""\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$)|/\*.*?\*/|--[^\n]*""",
+            lambda match: match.group("quoted") or " ",
+            query,
+            flags=re.DOTALL,
+        )
+
+        return statement.strip().rstrip(";").rstrip()
+
+    @staticmethod
+    def _to_prepared_statement(
+        query: str, parametrised: bool = True
+    ) -> Optional[Tuple[str, List[str]]]:
+        """
+        Convert a single statement with named parameters (``%(name)s``) into the body of
+        a ``PREPARE`` statement with positional parameters (``$1``).
+
+        Args:
+            query (str): SQL query
+            parametrised (bool): If False, the query is sent as it is (no placeholders nor ``%%`` escapes)
+
+        Returns:
+            (Optional[Tuple[str, List[str]]]): The statement and the parameter names in order,
+            or None if the query cannot be prepared
+        """
+        statement = PostgreSQLConnector._strip_statement(query)
+
+        # Only single DML statements can be prepared
+        if (
+            not re.match(r"(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b", statement, flags=re.I)
+            or ";" in statement
+        ):
+            return None
+        elif not parametrised:
+            return statement, []
+
+        # Positional parameters are not supported
+        if "%" in re.sub(r"%%|%\(\w+\)s", "", statement):
+            return None
+
+        names = list(dict.fromkeys(re.findall(r"%\((\w+)\)s", statement)))
+
+        # Replace the named parameters with their position
+        statement = re.sub(
+            r"%%|%\((\w+)\)s",
+            lambda match: f"${names.index(match.group(1)) + 1}" if match.group(1) else "%",
+            statement,
+        )
+
+        return statement, names
+
+    def _execute(
+        self, cur, query: str, query_parameters: Optional[Dict[str, Any]], schema: str | None
+    ) -> None:
+        """
+        Execute a query, preparing it on the pooled connection once it has been executed
+        ``prepare_threshold`` times, so that the server skips parsing and planning it again.
+
+        Args:
+            cur: psycopg2 cursor of a pooled connection
+            query (str): SQL query
+            query_parameters (Optional[Dict[str, Any]]): Query parameters
+            schema (str): Name of the schema used by the connection
+        """
+        key = (query, schema)
+        threshold = self._statement_cache_config.prepare_threshold
+
+        if threshold is None or key in self._unpreparable:
+            cur.execute(query, query_parameters or None)
+            return
+
+        with self._lock:
+            executions = self._executions[key] = self._executions.get(key, 0) + 1
+
+        prepared_statements = self._get_pool().state(cur.connection).prepared_statements
+        prepared = prepared_statements.get(key)
+
+        if prepared is not None:
+            # Reuse the statement prepared on this connection
+            prepared_statements.move_to_end(key)
+            with self._lock:
+                self._prepared_hits += 1
+                self._saved_seconds += self._prepare_seconds.get(key, 0.0)
+
+        elif executions >= threshold:
+            statement = self._to_prepared_statement(query, bool(query_parameters))
+            if statement is None:
+                self._unpreparable.add(key)
+                cur.execute(query, query_parameters or None)
+                return
+
+            # Prepare the statement, timing the parse and analysis
+            name = f"data_grimorium_{hashlib.sha1(repr(key).encode()).hexdigest()[:16]}"
+            start = time.perf_counter()
+
+            # A failed PREPARE must not roll back the earlier statements of the transaction
+            cur.execute("SAVEPOINT data_grimorium_prepare")
+            try:
+                cur.execute(f"PREPARE {name} AS {statement[0]}")
+            except psycopg2.Error as e:
+                # Fall back to plain executions (e.g., undetermined parameter types)
+                logging.warning(f"⚠️ Unable to prepare the query, execute it as it is: {e}")
+                cur.execute("ROLLBACK TO SAVEPOINT data_grimorium_prepare")
+                self._unpreparable.add(key)
+                cur.execute(query, query_parameters or None)
+                return
+            prepare_seconds = time.perf_counter() - start
+            cur.execute("RELEASE SAVEPOINT data_grimorium_prepare")
+
+            prepared = prepared_statements[key] = (name, statement[1])
+            with self._lock:
+                self._prepare_seconds.setdefault(key, prepare_seconds)
+                self._prepared_statements += 1
+
+            # Deallocate the least recently used statements
+            while len(prepared_statements) > self._statement_cache_config.max_prepared_statements:
+                _, (old_name, _) = prepared_statements.popitem(last=False)
+                cur.execute(f"DEALLOCATE {old_name}")
+
+        if prepared is None:
+            cur.execute(query, query_parameters or None)
+        else:
+            name, names = prepared
+            arguments = ", ".join(f"%({parameter})s" for parameter in names)
+            cur.execute(
+                f"EXECUTE {name}" + (f" ({arguments})" if names else ""),
+                query_parameters if names else None,
+            )
+
+    def statement_cache_metrics(self) -> PostgreSQLStatementCacheMetrics:
+        """
+        Retrieve the hit counts of the SQL file and prepared statement caches.
+
+        Returns:
+            (PostgreSQLStatementCacheMetrics): Statement cache metrics
+        """
+        with self._lock:
+            return PostgreSQLStatementCacheMetrics(
+                sql_file_hits=self._sql_file_hits,
+                sql_file_misses=self._sql_file_misses,
+                prepared_statements=self._prepared_statements,
+                prepared_hits=self._prepared_hits,
+                saved_seconds=self._saved_seconds,
+            )
+
+    def _explain(
+        self, cur, query: str, query_parameters: Optional[Dict[str, Any]]
+    ) -> Optional[Any]:
+        """
+        Capture the ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` plan of a statement within a
+        savepoint which is rolled back, so that the side effects of the statement are discarded.
+
+        Args:
+            cur: psycopg2 cursor within a transaction
+            query (str): SQL query
+            query_parameters (Optional[Dict[str, Any]]): Query parameters
+
+        Returns:
+            (Optional[Any]): The JSON plan or None if the statement cannot be explained
+        """
+        statement = self._strip_statement(query)
+        if not re.match(r"(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b", statement, flags=re.I):
+            logging.info("🔍 Skip EXPLAIN of a statement which is not a query or a DML")
+            return None
+
+        cur.execute("SAVEPOINT data_grimorium_explain")
+        try:
+            cur.execute(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", query_parameters or None
+            )
+            plan = cur.fetchone()[0]
+        except psycopg2.Error as e:
+            logging.warning(f"⚠️ Unable to capture the query plan: {e}")
+            plan = None
+        finally:
+            cur.execute("ROLLBACK TO SAVEPOINT data_grimorium_explain")
+
+        return plan
+
+    def _record_profile(
+        self, profile: PostgreSQLQueryProfile, profiling_config: PostgreSQLProfilingConfig
+    ) -> None:
+        """
+        Store a query profile in the registry and append it to the JSON-lines file (if set).
+
+        Args:
+            profile (PostgreSQLQueryProfile): Query profile
+            profiling_config (PostgreSQLProfilingConfig): Profiling configuration
+        """
+        with self._lock:
+            self._profiles.append(profile)
+
+            if profiling_config.output_path:
+                output_path = self._root_path / profiling_config.output_path
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "a", encoding="utf-8") as file:
+                    file.write(profile.model_dump_json(by_alias=True) + "\n")
+
+        logging.info(
+            f"⏱️ Query profile of {profile.query_path}: connect {profile.connect_seconds:.4f}s, "
+            f"execute {profile.execute_seconds:.4f}s, fetch {profile.fetch_seconds:.4f}s, "
+            f"build {profile.build_seconds:.4f}s"
+        )
+
+    def query_profiles(self) -> pd.DataFrame:
+        """
+        Retrieve the query profiles recorded by ``execute_query_from_config``.
+
+        Returns:
+            (pd.DataFrame): One row per profiled execution
+        """
+        with self._lock:
+            profiles = [profile.as_dict() for profile in self._profiles]
+
+        columns = [
+            field.alias or name for name, field in PostgreSQLQueryProfile.model_fields.items()
+        ]
+
+        return pd.DataFrame(profiles, columns=columns)
+
     def execute_query_from_config(
-        self, query_config: PostgreSQLQueryConfig
-    ) -> Union[pd.DataFrame, bool]:
+        self,
+        query_config: PostgreSQLQueryConfig,
+        profiling_config: Optional[PostgreSQLProfilingConfig] = None,
+        spill_config: Optional[ParquetSpillConfig] = None,
+    ) -> Union[pd.DataFrame, bool, ParquetSpillHandle]:
         """
         Execute a query from local path and with a certain set of parameter configurations.
+        When the query configuration has a ``local_path``, the result of the SELECT query is
+        streamed through a server-side cursor into a Parquet dataset in that directory,
+        one row group at a time, and a handle is returned instead of the data
+        (other statements raise a ``ValueError``, since a server-side cursor cannot run them).
 
         Args:
             query_config (PostgreSQLQueryConfig): Query configuration
+            profiling_config (Optional[PostgreSQLProfilingConfig]): Config to record the timings
+                of the connect, execute, fetch and build phases (and optionally the query plan)
+                of the queries whose result is returned in memory
+            spill_config (Optional[ParquetSpillConfig]): Row group size, partitioning and
+                compression of the Parquet dataset written to ``local_path``
 
         Returns:
-            (Union[pd.DataFrame, bool]): The result of the query execution.
-            Either the data or a bool in case of table creation.
+            (Union[pd.DataFrame, bool, ParquetSpillHandle]): The result of the query execution.
+            Either the data, a bool in case of table creation or the handle of the Parquet dataset.
         """
-        # Check if the schema already exists, otherwise create it
-        if not self.schema_exists(query_config.schema):
-            logging.info(f"📝 Creating schema {query_config.schema}")
-            try:
-                with self._get_connection() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(f"CREATE SCHEMA {query_config.schema}")
-                        conn.commit()
-            except psycopg2.Error as e:
-                logging.error(f"❌ Database error: {e}")
-                raise
+        # Create the schema if it does not exist
+        self._create_schema(query_config.schema)
 
         # Retrieve query path
         query_path = Path(query_config.query_path)
 
         # Read query
-        query = read_file_from_path(query_path, self._root_path)
+        query = self._read_query(query_path)
+
+        # Stream the result into Parquet files
+        if query_config.local_path:
+            # A server-side cursor only runs queries returning rows
+            if not re.match(
+                r"(SELECT|WITH|VALUES|TABLE)\b", self._strip_statement(query), flags=re.I
+            ):
+                raise ValueError(
+                    f"🚨 Only a SELECT query can be written to {query_config.local_path}."
+                )
+
+            spill_config = spill_config or ParquetSpillConfig()
+            chunks = self._stream_query(
+                query,
+                query_config.query_parameters,
+                query_config.schema,
+                PostgreSQLStreamConfig(
+                    itersize=spill_config.row_group_size, chunk_format=ChunkFormat.ARROW
+                ),
+            )
+            handle = write_parquet_chunks(
+                chunks, self._root_path / query_config.local_path, spill_config
+            )
+            logging.info(f"✅ Query from {query_path} written to {handle.path}")
+
+            return handle
+
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        timings = [time.perf_counter()]
+        rows, plan = None, None
 
         # Execute within a context manager to auto-close connection
         try:
-            with self._get_connection(schema=query_config.schema) as conn:
+            with self._connection(schema=query_config.schema) as conn:
                 with conn.cursor() as cur:
+                    timings.append(time.perf_counter())
+
                     # Execute the query with the parameters (if present)
-                    cur.execute(query, query_config.query_parameters or None)
+                    self._execute(cur, query, query_config.query_parameters, query_config.schema)
+                    timings.append(time.perf_counter())
 
                     # If query returns data (e.g., SELECT), fetch into DataFrame
                     if cur.description:
-                        columns = [desc[0] for desc in cur.description]
                         data = cur.fetchall()
-                        result = pd.DataFrame(data, columns=columns)
+                        timings.append(time.perf_counter())
+                        result = self._build_dataframe(data, cur.description)
+                        rows = len(data)
                     else:
+                        timings.append(time.perf_counter())
                         result = True  # For CREATE, INSERT, UPDATE, etc.
+                        rows = cur.rowcount
+
+                        # The statement may have changed the tables
+                        self._metadata_cache.invalidate("table")
+                        self._metadata_cache.invalidate("columns")
+                    timings.append(time.perf_counter())
+
+                    # Capture the plan of the same statement and parameters
+                    if profiling_config is not None and profiling_config.explain:
+                        plan = self._explain(cur, query, query_config.query_parameters)
 
                     conn.commit()
                     logging.info(f"✅ Query executed successfully from {query_path}")
-                    return result
 
         except psycopg2.Error as e:
             logging.error(f"❌ Database error: {e}")
             raise
 
-    def schema_exists(self, schema: str) -> bool:
+        # Record the profile
+        if profiling_config is not None:
+            connect, execute, fetch, build = np.diff(timings).tolist()
+            self._record_profile(
+                PostgreSQLQueryProfile(
+                    query_path=query_path.as_posix(),
+                    schema=query_config.schema,
+                    query_parameters=query_config.query_parameters,
+                    started_at=started_at,
+                    connect_seconds=connect,
+                    execute_seconds=execute,
+                    fetch_seconds=fetch,
+                    build_seconds=build,
+                    total_seconds=timings[-1] - timings[0],
+                    rows=rows,
+                    plan=plan,
+                ),
+                profiling_config,
+            )
+
+        return result
+
+    @staticmethod
+    def _split_insert_values(query: str) -> Optional[Tuple[str, str]]:
         """
-        Check if a schema exists in the database.
+        Split a single-row ``INSERT ... VALUES (...)`` statement into the statement with a
+        ``VALUES %s`` placeholder and the row template, as expected by ``execute_values``.
 
         Args:
-            schema (str): Name of the schema to check.
+            query (str): SQL statement
 
         Returns:
-            (bool): True if the schema exists, False otherwise.
+            (Optional[Tuple[str, str]]): Statement and row template, or None for other statements
         """
-        # Execute within a context manager to auto-close connection
+        statement = PostgreSQLConnector._strip_statement(query)
+
+        insert = re.match(r"INSERT\s+INTO\s.+?\sVALUES\s*\(", statement, flags=re.I | re.S)
+        if insert is None:
+            return None
+
+        # Find the parenthesis closing the row, skipping quoted literals
+        start, depth, quoted = insert.end() - 1, 0, False
+        for end, char in enumerate(statement[start:], start=start + 1):
+            if char == "'":
+                quoted = not quoted
+            elif not quoted and char == "(":
+                depth += 1
+            elif not quoted and char == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            return None
+
+        # Statements already inserting several rows are executed as they are
+        if statement[end:].lstrip().startswith(","):
+            return None
+
+        return statement[:start] + "%s" + statement[end:], statement[start:end]
+
+    def execute_many_from_config(
+        self,
+        query_config: PostgreSQLQueryConfig,
+        parameters: Sequence[Dict[str, Any]],
+        page_size: int = 1000,
+        single_transaction: bool = True,
+    ) -> Union[pd.DataFrame, int]:
+        """
+        Execute a query from local path once per parameter set over a single connection.
+        Single-row ``INSERT ... VALUES`` statements are rewritten into one multi-row INSERT
+        per page of ``page_size`` parameter sets. The other statements without results
+        (e.g., UPDATE, DELETE) are sent with ``execute_batch``, one round trip per page, and
+        their affected rows are counted through ``pg_stat_xact_all_tables`` (which includes
+        the rows changed by triggers). Statements returning rows (e.g., SELECT or RETURNING) are
+        executed one by one, since the rows of every execution must be fetched.
+        The ``query_parameters`` of the configuration are ignored.
+
+        Args:
+            query_config (PostgreSQLQueryConfig): Query configuration
+            parameters (Sequence[Dict[str, Any]]): Parameter sets
+            page_size (int): Number of parameter sets per page
+            single_transaction (bool): If True, commit once at the end, otherwise after each page
+
+        Returns:
+            (Union[pd.DataFrame, int]): The concatenated results of the query (e.g., SELECT or
+            RETURNING) or the total number of affected rows.
+        """
+        # Check the parameters
+        if not parameters:
+            raise ValueError("🚨 No parameter sets provided.")
+
+        # Create the schema if it does not exist
+        self._create_schema(query_config.schema)
+
+        # Retrieve query path
+        query_path = Path(query_config.query_path)
+
+        # Read query once
+        query = self._read_query(query_path)
+        insert = self._split_insert_values(query)
+
+        logging.info(
+            f"📦 Execute {len(parameters)} parameter sets from {query_path} "
+            f"in pages of {page_size}" + (" with multi-row VALUES" if insert else "")
+        )
+
+        rows, description, row_count = [], None, 0
+        returns_rows = None
         try:
-            with self._get_connection() as conn:
+            with self._connection(schema=query_config.schema) as conn:
                 with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT schema_name FROM information_schema.schemata WHERE schema_name=%s",
-                        (schema,),
-                    )
-                    conn.commit()
+                    for start in range(0, len(parameters), page_size):
+                        page = parameters[start : start + page_size]
+
+                        # Execute the page as a single multi-row INSERT
+                        if insert:
+                            statement, template = insert
+                            execute_values(
+                                cur, statement, page, template=template, page_size=len(page)
+                            )
+                            if cur.description:
+                                description = cur.description
+                                rows.extend(cur.fetchall())
+                            row_count += cur.rowcount
+                        else:
+                            # Read the changed rows counter at the start of the transaction
+                            if start == 0 or not single_transaction:
+                                changed_rows = self._changed_rows_counter(cur)
 
-                    logging.info(f"🕵🏻 Schema {schema} exists? → {bool(cur.rowcount)}")
+                            # Execute the first statement to find out if it returns rows
+                            if returns_rows is None:
+                                cur.execute(query, page[0])
+                                returns_rows = cur.description is not None
+                                if returns_rows:
+                                    description = cur.description
+                                    rows.extend(cur.fetchall())
+                                page = page[1:]
 
-                    return bool(cur.rowcount)
+                            if returns_rows:
+                                # Execute the page statement by statement to fetch the rows
+                                for page_parameters in page:
+                                    cur.execute(query, page_parameters)
+                                    rows.extend(cur.fetchall())
+                            else:
+                                # Execute the page in a single round trip
+                                if page:
+                                    execute_batch(cur, query, page, page_size=len(page))
+
+                                # Count the changed rows at the end of the transaction
+                                if not single_transaction or start + page_size >= len(parameters):
+                                    row_count += self._changed_rows_counter(cur) - changed_rows
+
+                        if not single_transaction:
+                            conn.commit()
 
         except psycopg2.Error as e:
             logging.error(f"❌ Database error: {e}")
             raise
 
-    def table_exists(self, table_name: str, schema: str | None = None) -> bool:
+        if description is not None:
+            logging.info(f"✅ Query executed successfully from {query_path} ({len(rows)} rows)")
+            return self._build_dataframe(rows, description)
+
+        # The statements may have changed the tables
+        self._metadata_cache.invalidate("table")
+        self._metadata_cache.invalidate("columns")
+
+        logging.info(f"✅ Query executed successfully from {query_path} ({row_count} rows)")
+
+        return row_count
+
+    @staticmethod
+    def _changed_rows_counter(cur) -> int:
         """
-        Check if a table exists in the database.
+        Read the counter of the rows inserted, updated or deleted by the connection
+        that are not yet flushed to the cumulative statistics. The counter is not flushed
+        within a transaction, so the difference of two reads gives the rows changed in between.
 
         Args:
-            table_name (str): Name of the table to check.
+            cur: psycopg2 cursor within a transaction
+
+        Returns:
+            (int): Number of changed rows
+        """
+        cur.execute(
+            "SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0) "
+            "FROM pg_catalog.pg_stat_xact_all_tables"
+        )
+
+        return int(cur.fetchone()[0])
+
+    def _stream_query(
+        self,
+        query: Union[str, sql.Composable],
+        query_parameters: Optional[Dict[str, Any]],
+        schema: str | None,
+        stream_config: PostgreSQLStreamConfig,
+    ) -> Iterator[Union[pd.DataFrame, pa.Table]]:
+        """
+        Execute a SELECT query through a server-side (named) cursor and yield its result in chunks.
+
+        Args:
+            query (Union[str, sql.Composable]): SQL query
+            query_parameters (Optional[Dict[str, Any]]): Query parameters
             schema (str): Name of the schema to use
+            stream_config (PostgreSQLStreamConfig): Chunk size and format
 
         Returns:
-            (bool): True if the table exists, False otherwise.
+            (Iterator[Union[pd.DataFrame, pa.Table]]): Chunks of at most ``itersize`` rows
         """
-        # Execute within a context manager to auto-close connection
         try:
-            with self._get_connection(schema=schema) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "select * from information_schema.tables where table_name=%s", (table_name,)
-                    )
-                    conn.commit()
+            with self._connection(schema=schema) as conn:
+                # Named cursors are declared on the server and live within the transaction
+                with conn.cursor(name=f"data_grimorium_{uuid.uuid4().hex}") as cur:
+                    cur.itersize = stream_config.itersize
+                    cur.execute(query, query_parameters or None)
+
+                    n_chunks, n_rows = 0, 0
+                    while rows := cur.fetchmany(stream_config.itersize):
+                        n_chunks, n_rows = n_chunks + 1, n_rows + len(rows)
 
-                    logging.info(f"🕵🏻 Table {table_name} exists? → {bool(cur.rowcount)}")
+                        # Switch based on the chunk format
+                        match stream_config.chunk_format:
+                            case "pandas":
+                                yield self._build_dataframe(rows, cur.description)
+                            case "arrow":
+                                yield self._build_arrow_table(rows, cur.description)
+                            case _:
+                                logging.error(
+                                    f"🚨 Unknown chunk format: {stream_config.chunk_format}"
+                                )
+                                raise ValueError("Invalid chunk format")
 
-                    return bool(cur.rowcount)
+                    logging.info(f"✅ Query streamed {n_rows} rows in {n_chunks} chunks")
 
         except psycopg2.Error as e:
             logging.error(f"❌ Database error: {e}")
             raise
 
-    def upload_dataframe(
-        self, data: pd.DataFrame, table_name: str, schema: str = "public", replace: bool = False
-    ) -> Union[int, None]:
+    def stream_query_from_config(
+        self,
+        query_config: PostgreSQLQueryConfig,
+        stream_config: Optional[PostgreSQLStreamConfig] = None,
+    ) -> Iterator[Union[pd.DataFrame, pa.Table]]:
         """
-        Upload a DataFrame to a PostgreSQL table.
+        Execute a SELECT query from local path and yield its result in chunks. The rows are read
+        through a server-side (named) cursor, so only ``itersize`` rows are held in memory at once.
+        The pooled connection is held until the iterator is exhausted or closed.
 
         Args:
-            data (pd.DataFrame): Data to upload.
-            table_name (str): Name of the table.
-            schema (str): Name of the schema to use
-            replace (bool): If True, replace the rows if it already exists.
+            query_config (PostgreSQLQueryConfig): Query configuration
+            stream_config (Optional[PostgreSQLStreamConfig]): Chunk size and format
 
         Returns:
-            (Union[int, None]): Number of affected rows or None if an error occurred
+            (Iterator[Union[pd.DataFrame, pa.Table]]): Chunks of at most ``itersize`` rows
         """
-        # Check if the DataFrame is empty
-        if data.empty:
-            raise ValueError("🚨 The provided DataFrame is empty and cannot be uploaded.")
+        stream_config = stream_config or PostgreSQLStreamConfig()
 
-        # Check if the schema already exists, otherwise create it
-        if not self.schema_exists(schema):
-            logging.info(f"📝 Creating schema {schema}")
-            try:
-                with self._get_connection() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(f"CREATE SCHEMA {schema}")
-                        conn.commit()
-            except psycopg2.Error as e:
-                logging.error(f"❌ Database error: {e}")
-                raise
+        # Retrieve query path
+        query_path = Path(query_config.query_path)
 
-        # Setup SQLAlchemy engine
-        engine = create_engine(self._client_config.as_sqlalchemy_engine_url())
-        mode = "replace" if replace else "append"
+        # Read query
+        query = self._read_query(query_path)
 
         logging.info(
-            f"🪁 Upload {len(data)} into the table {self._client_config.dbname}.{table_name}"
+            f"🌊 Stream query from {query_path} in chunks of {stream_config.itersize} rows"
         )
 
-        # Load the DataFrame to PostgreSQL
-        rows = data.to_sql(name=table_name, con=engine, if_exists=mode, schema=schema, index=False)
+        yield from self._stream_query(
+            query, query_config.query_parameters, query_config.schema, stream_config
+        )
 
-        # Check the result
-        if rows is None:
-            raise RuntimeError(f"❌ Upload failed: Pandas returned None for {table_name}")
+    @staticmethod
+    def _partition_bounds(lower: Any, upper: Any, n_partitions: int) -> List[Any]:
+        """
+        Split the range ``[lower, upper]`` of a numeric or timestamp column into
+        ``n_partitions`` contiguous ranges of equal width. The bounds are computed with
+        exact arithmetic (microseconds, integers or ``Decimal``), so that they keep
+        the precision of the column.
+
+        Args:
+            lower (Any): Minimum value of the column
+            upper (Any): Maximum value of the column
+            n_partitions (int): Number of partitions
+
+        Returns:
+            (List[Any]): The ``n_partitions + 1`` bounds of the partitions
+        """
+        # Switch based on the type of the column
+        if isinstance(lower, datetime.date) or (isinstance(lower, int) and isinstance(upper, int)):
+            # Timedeltas are integer microseconds (days for dates)
+            bounds = [lower + (upper - lower) * i // n_partitions for i in range(n_partitions + 1)]
+        elif isinstance(lower, Decimal) or isinstance(upper, Decimal):
+            lower, upper = Decimal(lower), Decimal(upper)
+            bounds = [lower + (upper - lower) * i / n_partitions for i in range(n_partitions + 1)]
         else:
-            logging.info(f"✅ Data uploaded to {self._client_config.dbname}.{table_name}")
+            bounds = np.linspace(float(lower), float(upper), n_partitions + 1).tolist()
 
-        return rows
+        # Keep the range exactly
+        bounds[0], bounds[-1] = lower, upper
+
+        return bounds
+
+    def _read_partition(
+        self,
+        query: sql.Composable,
+        query_parameters: Dict[str, Any],
+        schema: str,
+        stream_config: PostgreSQLStreamConfig,
+        output_file: Optional[Path],
+    ) -> Union[pd.DataFrame, Path]:
+        """
+        Read a partition, either into a DataFrame or into a Parquet file written chunk by chunk.
+
+        Args:
+            query (sql.Composable): SQL query of the partition
+            query_parameters (Dict[str, Any]): Query parameters
+            schema (str): Name of the schema to use
+            stream_config (PostgreSQLStreamConfig): Chunk size
+            output_file (Optional[Path]): Parquet file of the partition (None for a DataFrame)
+
+        Returns:
+            (Union[pd.DataFrame, Path]): The data or the Parquet file of the partition
+        """
+        if output_file is None:
+            chunks = list(self._stream_query(query, query_parameters, schema, stream_config))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+        # Write the Arrow chunks as row groups of the partition file
+        writer = None
+        arrow_config = stream_config.model_copy(update={"chunk_format": ChunkFormat.ARROW})
+        try:
+            for table in self._stream_query(query, query_parameters, schema, arrow_config):
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return output_file
+
+    def read_partitioned_from_config(
+        self,
+        query_config: PostgreSQLQueryConfig,
+        partition_config: PostgreSQLPartitionConfig,
+        stream_config: Optional[PostgreSQLStreamConfig] = None,
+    ) -> Union[pd.DataFrame, Path]:
+        """
+        Execute a SELECT query from local path as ``n_partitions`` range sub-queries on
+        ``partition_column``, read concurrently over pooled connections. The partitions are
+        combined into a DataFrame or, when the query configuration has a ``local_path``,
+        written as a Parquet dataset (one file per partition) in that directory.
+
+        Args:
+            query_config (PostgreSQLQueryConfig): Query configuration
+            partition_config (PostgreSQLPartitionConfig): Partitioning configuration
+            stream_config (Optional[PostgreSQLStreamConfig]): Chunk size used to read each partition
+
+        Returns:
+            (Union[pd.DataFrame, Path]): The data or the directory of the Parquet dataset
+        """
+        stream_config = stream_config or PostgreSQLStreamConfig()
+
+        # Retrieve query path
+        query_path = Path(query_config.query_path)
+
+        # Read query and wrap it as a sub-query
+        query = self._read_query(query_path).strip().rstrip(";")
+        column = sql.Identifier(partition_config.partition_column)
+        parameters = dict(query_config.query_parameters or {})
+
+        # Retrieve the range of the partition column
+        lower, upper = partition_config.lower_bound, partition_config.upper_bound
+        if lower is None or upper is None:
+            try:
+                with self._connection(schema=query_config.schema) as conn:
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            sql.SQL("SELECT min({0}), max({0}) FROM ({1}\n) AS partitioned").format(
+                                column, sql.SQL(query)
+                            ),
+                            parameters or None,
+                        )
+                        bounds = cur.fetchone()
+            except psycopg2.Error as e:
+                logging.error(f"❌ Database error: {e}")
+                raise
+            lower = bounds[0] if lower is None else lower
+            upper = bounds[1] if upper is None else upper
+
+        # Prepare the output dataset
+        output_path = None
+        if query_config.local_path:
+            output_path = self._root_path / query_config.local_path
+            output_path.mkdir(parents=True, exist_ok=True)
+
+            # Remove the partitions of a previous read, which would be read back with the dataset
+            for stale_file in output_path.glob("part-*.parquet"):
+                stale_file.unlink()
+
+        # Every row of the column is NULL (or the result is empty)
+        if lower is None:
+            bounds = [None, None]
+            n_partitions = 1
+        else:
+            n_partitions = partition_config.n_partitions
+            bounds = self._partition_bounds(lower, upper, n_partitions)
+
+        logging.info(
+            f"🧩 Read query from {query_path} in {n_partitions} partitions "
+            f"on {partition_config.partition_column}"
+        )
+
+        # Build the sub-queries, the first and last partitions are open-ended
+        # (the NULL values belong to the first partition). The bounds are literals, so that
+        # a query without parameters keeps its "%" characters as they are
+        partitions = []
+        for index in range(n_partitions):
+            conditions = []
+            if index > 0:
+                conditions.append(sql.SQL("{} >= {}").format(column, sql.Literal(bounds[index])))
+            if index < n_partitions - 1:
+                conditions.append(sql.SQL("{} < {}").format(column, sql.Literal(bounds[index + 1])))
+            if index == 0 and conditions:
+                conditions = [sql.SQL("({} OR {} IS NULL)").format(conditions[0], column)]
+            partition_query = sql.SQL("SELECT * FROM ({}\n) AS partitioned").format(sql.SQL(query))
+            if conditions:
+                partition_query = sql.SQL("{} WHERE {}").format(
+                    partition_query, sql.SQL(" AND ").join(conditions)
+                )
+            if partition_config.ordered:
+                partition_query = sql.SQL("{} ORDER BY {}").format(partition_query, column)
+
+            partitions.append(
+                (
+                    partition_query,
+                    parameters,
+                    output_path / f"part-{index:05d}.parquet" if output_path else None,
+                )
+            )
+
+        # Bound the concurrency by the pool size
+        max_workers = min(
+            n_partitions, partition_config.max_workers or n_partitions, self._pool_config.max_size
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._read_partition,
+                    partition_query,
+                    partition_parameters,
+                    query_config.schema,
+                    stream_config,
+                    output_file,
+                )
+                for partition_query, partition_parameters, output_file in partitions
+            ]
+
+            # Combine the partitions in their order or as soon as they are read
+            results = [
+                future.result()
+                for future in (futures if partition_config.ordered else as_completed(futures))
+            ]
+
+        if output_path is not None:
+            logging.info(f"✅ Query partitions written to {output_path}")
+            return output_path
+
+        data = pd.concat(results, ignore_index=True)
+        logging.info(f"✅ Query read successfully from {query_path} ({len(data)} rows)")
+
+        return data
+
+    def invalidate_metadata_cache(
+        self, schema: str | None = None, table_name: str | None = None
+    ) -> None:
+        """
+        Invalidate the cached metadata of a table, of a schema and its tables, or all of it.
+
+        Args:
+            schema (str): Name of the schema (all the schemas if None)
+            table_name (str): Name of the table (all the tables of the schema if None)
+        """
+        if schema is None and table_name is None:
+            self._metadata_cache.invalidate()
+        elif table_name is None:
+            self._metadata_cache.invalidate("schema", schema)
+            self._metadata_cache.invalidate("table", schema)
+            self._metadata_cache.invalidate("table", None)
+            self._metadata_cache.invalidate("columns", schema)
+        else:
+            self._metadata_cache.invalidate("table", schema, table_name)
+            self._metadata_cache.invalidate("table", None, table_name)
+            self._metadata_cache.invalidate("columns", schema, table_name)
+
+    def _create_schema(self, schema: str) -> None:
+        """
+        Create a schema if it does not exist. The schema is looked up in ``pg_namespace``
+        first, since ``CREATE SCHEMA IF NOT EXISTS`` requires the CREATE privilege
+        on the database even when the schema exists (e.g., for read-only roles).
+
+        Args:
+            schema (str): Name of the schema to create
+        """
+        if self.schema_exists(schema):
+            return
+
+        logging.info(f"📝 Creating schema {schema} if it does not exist")
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema))
+                    )
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        self._metadata_cache.set(("schema", schema), True)
+
+    def schema_exists(self, schema: str) -> bool:
+        """
+        Check if a schema exists in the database. The result is cached.
+
+        Args:
+            schema (str): Name of the schema to check.
+
+        Returns:
+            (bool): True if the schema exists, False otherwise.
+        """
+        # Look up the metadata cache first
+        exists = self._metadata_cache.get(("schema", schema))
+        if exists is not None:
+            return exists
+
+        # Execute within a context manager to auto-close connection
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_namespace WHERE nspname = %s)",
+                        (schema,),
+                    )
+                    exists = cur.fetchone()[0]
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        logging.info(f"🕵🏻 Schema {schema} exists? → {exists}")
+        self._metadata_cache.set(("schema", schema), exists)
+
+        return exists
+
+    def table_exists(self, table_name: str, schema: str | None = None) -> bool:
+        """
+        Check if a table (or view) exists in the database. The result is cached.
+
+        Args:
+            table_name (str): Name of the table to check.
+            schema (str): Name of the schema to use (any schema if None)
+
+        Returns:
+            (bool): True if the table exists, False otherwise.
+        """
+        # Look up the metadata cache first
+        exists = self._metadata_cache.get(("table", schema, table_name))
+        if exists is not None:
+            return exists
+
+        # Execute within a context manager to auto-close connection
+        try:
+            with self._connection(schema=schema) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT EXISTS (
+                            SELECT 1
+                            FROM pg_catalog.pg_class c
+                            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                            WHERE c.relname = %(table_name)s
+                              AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                              AND (%(schema)s::text IS NULL OR n.nspname = %(schema)s)
+                        )
+                        """,
+                        {"table_name": table_name, "schema": schema},
+                    )
+                    exists = cur.fetchone()[0]
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        logging.info(f"🕵🏻 Table {table_name} exists? → {exists}")
+        self._metadata_cache.set(("table", schema, table_name), exists)
+
+        return exists
+
+    def get_table_columns(self, table_name: str, schema: str = "public") -> Dict[str, str]:
+        """
+        Retrieve the column names and PostgreSQL types of a table. The result is cached.
+
+        Args:
+            table_name (str): Name of the table.
+            schema (str): Name of the schema to use
+
+        Returns:
+            (Dict[str, str]): Column types by column name (empty if the table does not exist)
+        """
+        # Look up the metadata cache first
+        columns = self._metadata_cache.get(("columns", schema, table_name))
+        if columns is not None:
+            return columns
+
+        # Execute within a context manager to auto-close connection
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT a.attname, pg_catalog.format_type(a.atttypid, a.atttypmod)
+                        FROM pg_catalog.pg_attribute a
+                        JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = %s AND c.relname = %s
+                          AND a.attnum > 0 AND NOT a.attisdropped
+                        ORDER BY a.attnum
+                        """,
+                        (schema, table_name),
+                    )
+                    columns = dict(cur.fetchall())
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        self._metadata_cache.set(("columns", schema, table_name), columns)
+
+        return columns
+
+    @staticmethod
+    def _postgresql_type(dtype) -> str:
+        """
+        Map a pandas dtype to the PostgreSQL column type used to create tables.
+
+        Args:
+            dtype: pandas dtype of the column
+
+        Returns:
+            (str): PostgreSQL column type
+        """
+        # Switch based on the dtype kind
+        if pd.api.types.is_bool_dtype(dtype):
+            return "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            # Unsigned integers need the next signed size
+            size = dtype.itemsize * (1 if pd.api.types.is_signed_integer_dtype(dtype) else 2)
+            if size <= 2:
+                return "smallint"
+            elif size <= 4:
+                return "integer"
+            return "bigint" if size <= 8 else "numeric"
+        elif pd.api.types.is_float_dtype(dtype):
+            return "real" if dtype.itemsize == 4 else "double precision"
+        elif isinstance(dtype, pd.DatetimeTZDtype):
+            return "timestamptz"
+        elif pd.api.types.is_datetime64_dtype(dtype):
+            return "timestamp"
+        elif pd.api.types.is_timedelta64_dtype(dtype):
+            return "interval"
+
+        return "text"
+
+    @staticmethod
+    def _serialise_csv_chunk(chunk: pd.DataFrame) -> io.StringIO:
+        """
+        Serialise a chunk of data into an in-memory CSV for ``COPY ... FROM STDIN``.
+        Missing values (NaN, NaT, None and NA) are written as unquoted empty fields,
+        which PostgreSQL reads as NULL, while every other value is quoted.
+
+        Args:
+            chunk (pd.DataFrame): Data to serialise
+
+        Returns:
+            (io.StringIO): CSV buffer positioned at the beginning
+        """
+        # Convert each column into Python objects, with None for missing values
+        columns = [
+            column.astype(object).where(column.notna(), None).tolist()
+            for _, column in chunk.items()
+        ]
+
+        # Write the rows
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+        writer.writerows(zip(*columns))
+        buffer.seek(0)
+
+        return buffer
+
+    def _create_table_statement(
+        self, data: pd.DataFrame, table: sql.Composable, key_columns: Optional[List[str]] = None
+    ) -> sql.Composed:
+        """
+        Build the ``CREATE TABLE IF NOT EXISTS`` statement of a table from the DataFrame dtypes.
+
+        Args:
+            data (pd.DataFrame): Data to store in the table.
+            table (sql.Composable): Qualified name of the table.
+            key_columns (Optional[List[str]]): Columns of the primary key.
+
+        Returns:
+            (sql.Composed): The statement
+        """
+        definitions = [
+            sql.SQL("{} {}").format(sql.Identifier(column), sql.SQL(self._postgresql_type(dtype)))
+            for column, dtype in data.dtypes.items()
+        ]
+        if key_columns:
+            definitions.append(
+                sql.SQL("PRIMARY KEY ({})").format(
+                    sql.SQL(", ").join(sql.Identifier(column) for column in key_columns)
+                )
+            )
+
+        return sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+            table, sql.SQL(", ").join(definitions)
+        )
+
+    def _copy_chunks(self, cur, data: pd.DataFrame, table: sql.Composable, chunk_size: int) -> None:
+        """
+        Stream a DataFrame into a table through ``COPY ... FROM STDIN`` in chunks.
+
+        Args:
+            cur: psycopg2 cursor
+            data (pd.DataFrame): Data to copy.
+            table (sql.Composable): Qualified name of the table.
+            chunk_size (int): Number of rows serialised at once.
+        """
+        copy_statement = (
+            sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)")
+            .format(table, sql.SQL(", ").join(sql.Identifier(column) for column in data.columns))
+            .as_string(cur.connection)
+        )
+        for start in range(0, len(data), chunk_size):
+            cur.copy_expert(
+                copy_statement, self._serialise_csv_chunk(data.iloc[start : start + chunk_size])
+            )
+
+    def _copy_dataframe(
+        self, data: pd.DataFrame, table_name: str, schema: str, replace: bool, chunk_size: int
+    ) -> int:
+        """
+        Upload a DataFrame through ``COPY ... FROM STDIN``, streaming it in chunks.
+        The table is created from the DataFrame dtypes when it does not exist.
+
+        Args:
+            data (pd.DataFrame): Data to upload.
+            table_name (str): Name of the table.
+            schema (str): Name of the schema to use
+            replace (bool): If True, drop and recreate the table.
+            chunk_size (int): Number of rows serialised at once.
+
+        Returns:
+            (int): Number of uploaded rows
+        """
+        table = sql.Identifier(schema, table_name)
+
+        try:
+            with self._connection(schema=schema) as conn:
+                with conn.cursor() as cur:
+                    # Create the table from the dtypes
+                    if replace:
+                        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(table))
+                    cur.execute(self._create_table_statement(data, table))
+
+                    # Stream the chunks
+                    self._copy_chunks(cur, data, table, chunk_size)
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        return len(data)
+
+    def upsert_dataframe(
+        self,
+        data: pd.DataFrame,
+        table_name: str,
+        key_columns: List[str],
+        schema: str = "public",
+        chunk_size: int = 100_000,
+    ) -> PostgreSQLUpsertResult:
+        """
+        Insert or update the rows of a DataFrame in a PostgreSQL table, matching them on
+        ``key_columns``. The data is copied into a temporary staging table and merged with a
+        single ``INSERT ... ON CONFLICT DO UPDATE`` statement within one transaction.
+        The table is created with ``key_columns`` as primary key when it does not exist,
+        otherwise it requires a unique constraint on ``key_columns``.
+
+        Args:
+            data (pd.DataFrame): Data to upsert.
+            table_name (str): Name of the table.
+            key_columns (List[str]): Columns identifying a row.
+            schema (str): Name of the schema to use
+            chunk_size (int): Number of rows serialised at once.
+
+        Returns:
+            (PostgreSQLUpsertResult): Number of inserted and updated rows
+        """
+        # Check the key columns
+        if not key_columns or not set(key_columns).issubset(data.columns):
+            raise ValueError(f"🚨 Invalid key columns {key_columns} for the provided DataFrame.")
+
+        # Create the schema if it does not exist
+        self._create_schema(schema)
+
+        # A row can be updated only once per statement, keep the last occurrence of each key
+        duplicated = data.duplicated(subset=key_columns, keep="last")
+        if duplicated.any():
+            logging.warning(f"⚠️ Drop {duplicated.sum()} rows with duplicated keys")
+            data = data[~duplicated]
+
+        # Build the statements
+        table = sql.Identifier(schema, table_name)
+        staging = sql.Identifier(f"staging_{table_name}")
+        columns = sql.SQL(", ").join(sql.Identifier(column) for column in data.columns)
+        keys = sql.SQL(", ").join(sql.Identifier(column) for column in key_columns)
+        updates = [
+            sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(column))
+            for column in data.columns
+            if column not in key_columns
+        ]
+        conflict_action = (
+            sql.SQL("DO UPDATE SET {}").format(sql.SQL(", ").join(updates))
+            if updates
+            else sql.SQL("DO NOTHING")
+        )
+
+        try:
+            with self._connection(schema=schema) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self._create_table_statement(data, table, key_columns))
+
+                    # Temporary tables are not WAL-logged and are dropped with the transaction
+                    cur.execute(
+                        sql.SQL(
+                            "CREATE TEMPORARY TABLE {} ON COMMIT DROP AS "
+                            "SELECT {} FROM {} WITH NO DATA"
+                        ).format(staging, columns, table)
+                    )
+                    self._copy_chunks(cur, data, staging, chunk_size)
+
+                    # Merge the staging table, xmax is 0 only for the inserted rows
+                    cur.execute(
+                        sql.SQL(
+                            "WITH upserted AS ("
+                            "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+                            "ON CONFLICT ({keys}) {conflict_action} "
+                            "RETURNING (xmax = 0) AS inserted) "
+                            "SELECT count(*) FILTER (WHERE inserted), "
+                            "count(*) FILTER (WHERE NOT inserted) FROM upserted"
+                        ).format(
+                            table=table,
+                            columns=columns,
+                            staging=staging,
+                            keys=keys,
+                            conflict_action=conflict_action,
+                        )
+                    )
+                    inserted, updated = cur.fetchone()
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        # The table may have been created
+        self.invalidate_metadata_cache(schema, table_name)
+
+        logging.info(
+            f"✅ Data upserted to {self._client_config.dbname}.{table_name} "
+            f"({inserted} inserted, {updated} updated)"
+        )
+
+        return PostgreSQLUpsertResult(inserted=inserted, updated=updated)
+
+    def upload_dataframe(
+        self,
+        data: pd.DataFrame,
+        table_name: str,
+        schema: str = "public",
+        replace: bool = False,
+        method: UploadMethod = UploadMethod.TO_SQL,
+        chunk_size: int = 100_000,
+        key_columns: Optional[List[str]] = None,
+    ) -> Union[int, None]:
+        """
+        Upload a DataFrame to a PostgreSQL table.
+
+        Args:
+            data (pd.DataFrame): Data to upload.
+            table_name (str): Name of the table.
+            schema (str): Name of the schema to use
+            replace (bool): If True, replace the rows if it already exists.
+            method (UploadMethod): Either ``to_sql`` (row-wise INSERTs), ``copy`` (``COPY FROM STDIN``)
+                or ``upsert`` (staging table merged on ``key_columns``)
+            chunk_size (int): Number of rows serialised at once with the ``copy`` and ``upsert`` methods.
+            key_columns (Optional[List[str]]): Columns identifying a row with the ``upsert`` method.
+
+        Returns:
+            (Union[int, None]): Number of affected rows or None if an error occurred
+        """
+        # Check if the DataFrame is empty
+        if data.empty:
+            raise ValueError("🚨 The provided DataFrame is empty and cannot be uploaded.")
+
+        # Create the schema if it does not exist
+        self._create_schema(schema)
+
+        logging.info(
+            f"🪁 Upload {len(data)} into the table {self._client_config.dbname}.{table_name}"
+        )
+
+        start = time.perf_counter()
+
+        # Switch based on the upload method
+        match method:
+            case "to_sql":
+                # Retrieve SQLAlchemy engine
+                engine = self._get_engine()
+                mode = "replace" if replace else "append"
+
+                # Load the DataFrame to PostgreSQL
+                rows = data.to_sql(
+                    name=table_name, con=engine, if_exists=mode, schema=schema, index=False
+                )
+
+            case "copy":
+                # Stream the DataFrame through COPY
+                rows = self._copy_dataframe(data, table_name, schema, replace, chunk_size)
+
+            case "upsert":
+                if replace:
+                    raise ValueError("🚨 The upsert method cannot replace the table.")
+
+                # Merge the DataFrame on the key columns
+                result = self.upsert_dataframe(data, table_name, key_columns, schema, chunk_size)
+                rows = result.inserted + result.updated
+
+            case _:
+                logging.error(f"🚨 Unknown upload method: {method}")
+                raise ValueError("Invalid upload method")
+
+        # The table may have been created or replaced
+        self.invalidate_metadata_cache(schema, table_name)
+
+        # Check the result
+        if rows is None:
+            raise RuntimeError(f"❌ Upload failed: Pandas returned None for {table_name}")
+        else:
+            elapsed = time.perf_counter() - start
+            logging.info(
+                f"✅ Data uploaded to {self._client_config.dbname}.{table_name} "
+                f"with {UploadMethod(method).value} ({rows / max(elapsed, 1e-9):.0f} rows/s)"
+            )
+
+        return rows
+
+    @staticmethod
+    def _binary_copy_fields(column: pd.Series) -> Union[np.ndarray, List[bytes]]:
+        """
+        Encode a column as fields of a binary ``COPY`` stream (length followed by the value).
+        Fixed-width types are encoded at once as a ``uint8`` matrix with a row per field,
+        text as a list of bytes.
+
+        Args:
+            column (pd.Series): Column without missing values
+
+        Returns:
+            (Union[np.ndarray, List[bytes]]): The encoded fields
+        """
+        if column.isna().any():
+            raise ValueError(f"🚨 The column {column.name} contains missing values.")
+
+        # Switch based on the PostgreSQL type
+        match PostgreSQLConnector._postgresql_type(column.dtype):
+            case "boolean":
+                value_type = "u1"
+            case "smallint":
+                value_type = ">i2"
+            case "integer":
+                value_type = ">i4"
+            case "bigint":
+                value_type = ">i8"
+            case "real":
+                value_type = ">f4"
+            case "double precision":
+                value_type = ">f8"
+            case "text":
+                values = [str(value).encode("utf-8") for value in column]
+                return [struct.pack(">i", len(value)) + value for value in values]
+            case _:
+                raise ValueError(f"🚨 Unsupported dtype {column.dtype} of column {column.name}.")
+
+        fields = np.empty(len(column), dtype=[("length", ">i4"), ("value", value_type)])
+        fields["length"] = np.dtype(value_type).itemsize
+        fields["value"] = column.to_numpy()
+
+        return fields.view(np.uint8).reshape(len(column), -1)
+
+    @staticmethod
+    def _serialise_binary_chunk(
+        ids: pd.DataFrame, embeddings: np.ndarray, storage: EmbeddingStorage
+    ) -> io.BytesIO:
+        """
+        Serialise a chunk of embeddings with their id columns into an in-memory
+        binary ``COPY`` stream. The embeddings are written as ``real[]`` (big-endian
+        ``float4`` elements) or as ``bytea`` holding the raw little-endian ``float32`` values.
+
+        Args:
+            ids (pd.DataFrame): Id columns of the rows
+            embeddings (np.ndarray): Embeddings matrix with a row per id
+            storage (EmbeddingStorage): Column type of the embeddings
+
+        Returns:
+            (io.BytesIO): Binary COPY buffer positioned at the beginning
+        """
+        n_rows, dimension = embeddings.shape
+
+        # Tuple header with the number of fields
+        header = np.full(n_rows, len(ids.columns) + 1, dtype=">i2").view(np.uint8)
+
+        # Embedding field, the whole chunk is encoded at once
+        match storage:
+            case "real_array":
+                field = np.empty(
+                    n_rows,
+                    dtype=[
+                        ("length", ">i4"),
+                        ("array_header", ">i4", (5,)),
+                        ("elements", [("length", ">i4"), ("value", ">f4")], (dimension,)),
+                    ],
+                )
+                field["length"] = field.dtype.itemsize - 4
+                # Dimensions, null flag, element type OID, dimension size and lower bound
+                field["array_header"] = (1, 0, 700, dimension, 1)
+                field["elements"]["length"] = 4
+                field["elements"]["value"] = embeddings
+            case "bytea":
+                field = np.empty(n_rows, dtype=[("length", ">i4"), ("value", "<f4", (dimension,))])
+                field["length"] = 4 * dimension
+                field["value"] = embeddings
+            case _:
+                logging.error(f"🚨 Unknown embedding storage: {storage}")
+                raise ValueError("Invalid embedding storage")
+
+        blocks = [
+            header.reshape(n_rows, -1),
+            *[PostgreSQLConnector._binary_copy_fields(column) for _, column in ids.items()],
+            field.view(np.uint8).reshape(n_rows, -1),
+        ]
+
+        # Signature, flags and header extension length
+        buffer = io.BytesIO()
+        buffer.write(b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0))
+
+        # Fixed-width rows are joined as a single matrix, text fields row by row
+        if all(isinstance(block, np.ndarray) for block in blocks):
+            buffer.write(np.hstack(blocks).tobytes())
+        else:
+            rows = zip(
+                *[
+                    [row.tobytes() for row in block] if isinstance(block, np.ndarray) else block
+                    for block in blocks
+                ]
+            )
+            buffer.write(b"".join(b"".join(row) for row in rows))
+
+        # File trailer
+        buffer.write(struct.pack(">h", -1))
+        buffer.seek(0)
+
+        return buffer
+
+    def upload_embeddings(
+        self,
+        embeddings: np.ndarray,
+        ids: pd.DataFrame,
+        table_name: str,
+        schema: str = "public",
+        embedding_column: str = "embedding",
+        storage: EmbeddingStorage = EmbeddingStorage.REAL_ARRAY,
+        replace: bool = False,
+        chunk_size: int = 100_000,
+    ) -> int:
+        """
+        Upload an embeddings matrix (e.g., the output of ``encode_text``) with its id columns
+        through binary ``COPY ... FROM STDIN``, without converting the vectors into Python lists.
+        The table is created from the id dtypes and ``storage`` when it does not exist.
+
+        Args:
+            embeddings (np.ndarray): 2D embeddings matrix, cast to ``float32``
+            ids (pd.DataFrame): Id columns with a row per embedding (no missing values)
+            table_name (str): Name of the table.
+            schema (str): Name of the schema to use
+            embedding_column (str): Name of the embeddings column
+            storage (EmbeddingStorage): Either ``real_array`` (``real[]``) or ``bytea``
+            replace (bool): If True, drop and recreate the table.
+            chunk_size (int): Number of rows serialised at once.
+
+        Returns:
+            (int): Number of uploaded rows
+        """
+        # Check the inputs
+        if embeddings.ndim != 2 or len(embeddings) != len(ids) or ids.empty:
+            raise ValueError(
+                f"🚨 The embeddings {embeddings.shape} do not match the {len(ids)} provided ids."
+            )
+        if embedding_column in ids.columns:
+            raise ValueError(f"🚨 The column {embedding_column} is already among the ids.")
+
+        embeddings = embeddings.astype(np.float32, copy=False)
+        ids = ids.reset_index(drop=True)
+
+        # Create the schema if it does not exist
+        self._create_schema(schema)
+
+        logging.info(
+            f"🪁 Upload {len(ids)} embeddings into the table "
+            f"{self._client_config.dbname}.{table_name}"
+        )
+
+        # Build the statements
+        table = sql.Identifier(schema, table_name)
+        columns = [*ids.columns, embedding_column]
+        embedding_type = "real[]" if EmbeddingStorage(storage) == "real_array" else "bytea"
+        definitions = [
+            *[
+                sql.SQL("{} {}").format(
+                    sql.Identifier(column), sql.SQL(self._postgresql_type(dtype))
+                )
+                for column, dtype in ids.dtypes.items()
+            ],
+            sql.SQL("{} {}").format(sql.Identifier(embedding_column), sql.SQL(embedding_type)),
+        ]
+
+        start = time.perf_counter()
+        try:
+            with self._connection(schema=schema) as conn:
+                with conn.cursor() as cur:
+                    # Create the table
+                    if replace:
+                        cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(table))
+                    cur.execute(
+                        sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+                            table, sql.SQL(", ").join(definitions)
+                        )
+                    )
+
+                    # Stream the chunks
+                    copy_statement = (
+                        sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT binary)")
+                        .format(table, sql.SQL(", ").join(map(sql.Identifier, columns)))
+                        .as_string(conn)
+                    )
+                    for chunk_start in range(0, len(ids), chunk_size):
+                        chunk = slice(chunk_start, chunk_start + chunk_size)
+                        cur.copy_expert(
+                            copy_statement,
+                            self._serialise_binary_chunk(
+                                ids.iloc[chunk], embeddings[chunk], storage
+                            ),
+                        )
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        # The table may have been created or replaced
+        self.invalidate_metadata_cache(schema, table_name)
+
+        elapsed = time.perf_counter() - start
+        logging.info(
+            f"✅ Embeddings uploaded to {self._client_config.dbname}.{table_name} "
+            f"({len(ids) / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+
+        return len(ids)
+
+    def read_embeddings(
+        self,
+        table_name: str,
+        id_columns: List[str],
+        schema: str = "public",
+        embedding_column: str = "embedding",
+        storage: EmbeddingStorage = EmbeddingStorage.REAL_ARRAY,
+    ) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Read the embeddings written by ``upload_embeddings``, ordered by ``id_columns``.
+        The vectors are exported through binary ``COPY ... TO STDOUT`` and the matrix is
+        decoded by NumPy from the received buffer in a single conversion (big-endian to
+        native ``float32``), without per-value Python objects. The ids and the vectors are
+        read from the same snapshot and matched by their order, so ``id_columns`` must be unique.
+
+        Args:
+            table_name (str): Name of the table.
+            id_columns (List[str]): Unique id columns, also used to order the rows
+            schema (str): Name of the schema to use
+            embedding_column (str): Name of the embeddings column
+            storage (EmbeddingStorage): Either ``real_array`` (``real[]``) or ``bytea``
+
+        Returns:
+            (Tuple[pd.DataFrame, np.ndarray]): The ids and the ``float32`` embeddings matrix
+        """
+        table = sql.Identifier(schema, table_name)
+        order = sql.SQL(", ").join(map(sql.Identifier, id_columns))
+
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    # Both statements must see the same rows
+                    cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+
+                    # Read the ids
+                    cur.execute(
+                        sql.SQL("SELECT {} FROM {} ORDER BY {}").format(order, table, order)
+                    )
+                    ids = self._build_dataframe(cur.fetchall(), cur.description)
+
+                    # The order of rows with equal ids may differ between the statements
+                    if ids.duplicated().any():
+                        raise ValueError(
+                            f"🚨 The id columns {id_columns} of {table_name} must be unique."
+                        )
+
+                    # Export the vectors
+                    buffer = io.BytesIO()
+                    cur.copy_expert(
+                        sql.SQL(
+                            "COPY (SELECT {} FROM {} ORDER BY {}) TO STDOUT WITH (FORMAT binary)"
+                        )
+                        .format(sql.Identifier(embedding_column), table, order)
+                        .as_string(conn),
+                        buffer,
+                    )
+
+        except psycopg2.Error as e:
+            logging.error(f"❌ Database error: {e}")
+            raise
+
+        # Skip the file header (19 bytes) and trailer (2 bytes)
+        data = buffer.getbuffer()[19:-2]
+        if len(ids) == 0:
+            return ids, np.empty((0, 0), dtype=np.float32)
+
+        # The first field length gives the dimension of the vectors
+        length = struct.unpack_from(">i", data, 2)[0]
+        match storage:
+            case "real_array":
+                dimension = max(length - 20, 0) // 8
+                row_type = np.dtype(
+                    [
+                        ("n_fields", ">i2"),
+                        ("length", ">i4"),
+                        ("array_header", ">i4", (5,)),
+                        ("elements", [("length", ">i4"), ("value", ">f4")], (dimension,)),
+                    ]
+                )
+            case "bytea":
+                dimension = max(length, 0) // 4
+                row_type = np.dtype(
+                    [("n_fields", ">i2"), ("length", ">i4"), ("value", "<f4", (dimension,))]
+                )
+            case _:
+                logging.error(f"🚨 Unknown embedding storage: {storage}")
+                raise ValueError("Invalid embedding storage")
+
+        # Every row must have the same size, i.e. no NULL and a single dimension
+        if len(data) != len(ids) * row_type.itemsize:
+            raise ValueError(
+                f"🚨 The embeddings of {table_name} must be non-NULL with the same dimension."
+            )
+        rows = np.frombuffer(data, dtype=row_type)
+        if (rows["length"] != length).any():
+            raise ValueError(
+                f"🚨 The embeddings of {table_name} must be non-NULL with the same dimension."
+            )
+
+        values = rows["elements"]["value"] if storage == "real_array" else rows["value"]
+        embeddings = values.astype(np.float32)
+
+        logging.info(f"✅ Read {embeddings.shape} embeddings from {table_name}")
+
+        return ids, embeddings
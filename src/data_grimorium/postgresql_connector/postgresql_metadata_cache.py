@@ -0,0 +1,15 @@
+"""
+The module includes the cache with time-to-live used by the PostgreSQL connector
+in order to avoid repeated catalog lookups (schemas, tables and column types).
+"""
+
+# Import Package Modules
+from data_grimorium.general_utils.metadata_cache import MetadataCache
+
+
+class PostgreSQLMetadataCache(MetadataCache):
+    """
+    The class implements the thread-safe metadata cache of the PostgreSQL connector.
+    Keys are tuples whose first elements are the kind of metadata and the schema
+    (e.g., ``("table", "public", "users")``), so that entries can be invalidated by prefix.
+    """
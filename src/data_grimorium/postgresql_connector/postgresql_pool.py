@@ -0,0 +1,338 @@
+"""
+The module includes a thread-safe connection pool used by the PostgreSQL connector
+in order to reuse connections across queries.
+"""
+
+# Import Standard Libraries
+import logging
+import threading
+import time
+import psycopg2
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from psycopg2.extensions import connection as Connection
+
+# Import Package Modules
+from data_grimorium.postgresql_connector.postgresql_types import (
+    PostgreSQLPoolConfig,
+    PostgreSQLPoolMetrics,
+)
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M",
+)
+
+
+class PooledConnection:
+    """
+    A connection owned by the pool, with the state tracked across checkouts.
+
+    Attributes:
+        connection (Connection): psycopg2 connection
+        schema (Optional[str]): Schema currently set as ``search_path`` (None for the default one)
+        last_used (float): Monotonic time of the last checkin
+        prepared_statements (OrderedDict): Server-side prepared statements, the most recently used last
+    """
+
+    def __init__(self, connection: Connection):
+        """
+        Constructor of the class PooledConnection
+
+        Args:
+            connection (Connection): psycopg2 connection
+        """
+        self.connection = connection
+        self.schema = None
+        self.last_used = time.monotonic()
+        self.prepared_statements = OrderedDict()
+
+
+class PostgreSQLConnectionPool:
+    """
+    The class implements a thread-safe pool of PostgreSQL connections
+    with health checks, per-checkout schema handling and idle timeout.
+
+    Attributes:
+        _connection_factory (Callable[[], Connection]): Function opening a new connection
+        _pool_config (PostgreSQLPoolConfig): Pool configurations
+        _idle (deque): Idle connections (the most recently used on the right)
+        _in_use (Dict[int, PooledConnection]): Checked out connections by connection id
+        _size (int): Number of open (or opening) connections
+        _condition (threading.Condition): Condition guarding the pool state
+    """
+
+    def __init__(
+        self, connection_factory: Callable[[], Connection], pool_config: PostgreSQLPoolConfig
+    ):
+        """
+        Constructor of the class PostgreSQLConnectionPool
+
+        Args:
+            connection_factory (Callable[[], Connection]): Function opening a new connection
+            pool_config (PostgreSQLPoolConfig): Pool configurations
+        """
+        # Initialise attributes
+        self._connection_factory = connection_factory
+        self._pool_config = pool_config
+        self._idle = deque()
+        self._in_use: Dict[int, PooledConnection] = {}
+        self._size = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # Initialise metrics
+        self._checkouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._created = 0
+        self._discarded = 0
+
+        # Open the minimum number of connections
+        for _ in range(pool_config.min_size):
+            self._idle.append(self._open())
+            self._size += 1
+            self._created += 1
+
+    def _open(self) -> PooledConnection:
+        """
+        Open a new connection through the connection factory.
+
+        Returns:
+            (PooledConnection): The new pooled connection
+        """
+        return PooledConnection(self._connection_factory())
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        """
+        Close a connection and remove it from the pool size. It must be called holding the condition.
+
+        Args:
+            pooled (PooledConnection): Connection to discard
+        """
+        try:
+            pooled.connection.close()
+        except psycopg2.Error:
+            pass
+
+        self._size -= 1
+        self._discarded += 1
+        self._condition.notify()
+
+    def _close_expired(self) -> None:
+        """
+        Close the idle connections above ``min_size`` that exceeded the idle timeout.
+        It must be called holding the condition.
+        """
+        now = time.monotonic()
+
+        # The oldest idle connections are on the left
+        while (
+            self._idle
+            and self._size > self._pool_config.min_size
+            and now - self._idle[0].last_used > self._pool_config.idle_timeout
+        ):
+            self._discard(self._idle.popleft())
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        """
+        Check if an idle connection is still usable. A round trip is done only for
+        connections idle for more than ``health_check_interval`` seconds.
+
+        Args:
+            pooled (PooledConnection): Connection to check
+
+        Returns:
+            (bool): True if the connection can be used, False otherwise
+        """
+        if pooled.connection.closed:
+            return False
+
+        if time.monotonic() - pooled.last_used > self._pool_config.health_check_interval:
+            try:
+                with pooled.connection.cursor() as cur:
+                    cur.execute("SELECT 1")
+                pooled.connection.rollback()
+            except psycopg2.Error:
+                return False
+
+        return True
+
+    def _checkout(self) -> PooledConnection:
+        """
+        Take an idle connection or open a new one, waiting for a free slot
+        up to ``checkout_timeout`` seconds when the pool is full.
+
+        Returns:
+            (PooledConnection): The checked out connection
+        """
+        start = time.monotonic()
+
+        while True:
+            pooled = None
+            opened = False
+
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("❌ The connection pool is closed")
+
+                self._close_expired()
+
+                # Wait for an idle connection or a free slot
+                while not self._idle and self._size >= self._pool_config.max_size:
+                    remaining = self._pool_config.checkout_timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"❌ No PostgreSQL connection available after "
+                            f"{self._pool_config.checkout_timeout} seconds"
+                        )
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    # Reserve the slot before opening the connection outside the lock
+                    self._size += 1
+
+            if pooled is None:
+                try:
+                    pooled = self._open()
+                    opened = True
+                except psycopg2.Error:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._is_healthy(pooled):
+                logging.info("🩺 Discard broken PostgreSQL connection")
+                with self._condition:
+                    self._discard(pooled)
+                continue
+
+            # Update metrics
+            wait_seconds = time.monotonic() - start
+            with self._condition:
+                self._in_use[id(pooled.connection)] = pooled
+                self._created += int(opened)
+                self._checkouts += 1
+                self._total_wait_seconds += wait_seconds
+                self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+            return pooled
+
+    def _checkin(self, pooled: PooledConnection) -> None:
+        """
+        Return a connection to the pool, discarding it if it is broken.
+
+        Args:
+            pooled (PooledConnection): The connection to return
+        """
+        with self._condition:
+            self._in_use.pop(id(pooled.connection), None)
+
+            if self._closed or pooled.connection.closed:
+                self._discard(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+                self._condition.notify()
+
+            self._close_expired()
+
+    @staticmethod
+    def _set_schema(pooled: PooledConnection, schema: Optional[str]) -> None:
+        """
+        Set the ``search_path`` of the connection to ``schema`` if it differs
+        from the current one (the default ``search_path`` when None).
+
+        Args:
+            pooled (PooledConnection): Connection to update
+            schema (Optional[str]): Schema to use
+        """
+        if pooled.schema == schema:
+            return
+
+        with pooled.connection.cursor() as cur:
+            if schema:
+                cur.execute("SET search_path TO %s", (schema,))
+            else:
+                cur.execute("RESET search_path")
+        pooled.connection.commit()
+
+        pooled.schema = schema
+
+    def state(self, connection: Connection) -> PooledConnection:
+        """
+        Retrieve the pool state of a checked out connection.
+
+        Args:
+            connection (Connection): A checked out connection
+
+        Returns:
+            (PooledConnection): The pooled connection wrapping ``connection``
+        """
+        with self._condition:
+            return self._in_use[id(connection)]
+
+    @contextmanager
+    def connection(self, schema: Optional[str] = None) -> Iterator[Connection]:
+        """
+        Check out a connection with ``schema`` as ``search_path``. The transaction is
+        committed when the block succeeds and rolled back otherwise, then the connection
+        returns to the pool.
+
+        Args:
+            schema (Optional[str]): Schema to use
+
+        Returns:
+            (Iterator[Connection]): The checked out connection
+        """
+        pooled = self._checkout()
+
+        try:
+            self._set_schema(pooled, schema)
+            yield pooled.connection
+            pooled.connection.commit()
+        except BaseException:
+            if not pooled.connection.closed:
+                try:
+                    pooled.connection.rollback()
+                except psycopg2.Error:
+                    pass
+            raise
+        finally:
+            self._checkin(pooled)
+
+    def metrics(self) -> PostgreSQLPoolMetrics:
+        """
+        Compute the pool metrics.
+
+        Returns:
+            (PostgreSQLPoolMetrics): Pool wait time and utilisation metrics
+        """
+        with self._condition:
+            return PostgreSQLPoolMetrics(
+                size=self._size,
+                in_use=len(self._in_use),
+                idle=len(self._idle),
+                utilisation=len(self._in_use) / self._pool_config.max_size,
+                checkouts=self._checkouts,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+                created=self._created,
+                discarded=self._discarded,
+            )
+
+    def close(self) -> None:
+        """
+        Close the idle connections and prevent new checkouts.
+        The checked out connections are closed when returned.
+        """
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._condition.notify_all()
@@ -4,7 +4,9 @@ The module includes Pydantic types for PostgreSQL Connector.
 
 # Import Standard Modules
 import pandas as pd
-from typing import Dict, Any
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -81,6 +83,22 @@ class PostgreSQLClientConfig(BaseModel):
         return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.dbname}"
 
 
+class UploadMethod(str, Enum):
+    TO_SQL = "to_sql"
+    COPY = "copy"
+    UPSERT = "upsert"
+
+
+class ChunkFormat(str, Enum):
+    PANDAS = "pandas"
+    ARROW = "arrow"
+
+
+class EmbeddingStorage(str, Enum):
+    REAL_ARRAY = "real_array"
+    BYTEA = "bytea"
+
+
 class PostgreSQLQueryConfig(BaseModel):
     """
     PostgreSQL query configuration with information on how to execute the query.
@@ -154,3 +172,518 @@ class PostgreSQLQueryConfig(BaseModel):
         Return the model as a single-row pandas DataFrame.
         """
         return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLPoolConfig(BaseModel):
+    """
+    PostgreSQL connection pool configuration.
+
+    Attributes:
+        min_size (int): Number of connections kept open.
+        max_size (int): Maximum number of open connections.
+        checkout_timeout (float): Seconds to wait for a free connection.
+        idle_timeout (float): Seconds after which an idle connection above ``min_size`` is closed.
+        health_check_interval (float): Seconds of inactivity after which a connection is checked.
+    """
+
+    min_size: int = Field(1, description="Number of connections kept open", alias="min_size")
+    max_size: int = Field(10, description="Maximum number of open connections", alias="max_size")
+    checkout_timeout: float = Field(
+        30.0, description="Seconds to wait for a free connection", alias="checkout_timeout"
+    )
+    idle_timeout: float = Field(
+        300.0, description="Seconds after which an idle connection is closed", alias="idle_timeout"
+    )
+    health_check_interval: float = Field(
+        30.0,
+        description="Seconds of inactivity after which a connection is checked",
+        alias="health_check_interval",
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL connection pool configuration.",
+            "properties": {
+                "min_size": {
+                    "type": "integer",
+                    "default": 1,
+                    "description": "Number of connections kept open.",
+                },
+                "max_size": {
+                    "type": "integer",
+                    "default": 10,
+                    "description": "Maximum number of open connections.",
+                },
+                "checkout_timeout": {
+                    "type": "number",
+                    "default": 30.0,
+                    "description": "Seconds to wait for a free connection.",
+                },
+                "idle_timeout": {
+                    "type": "number",
+                    "default": 300.0,
+                    "description": "Seconds after which an idle connection is closed.",
+                },
+                "health_check_interval": {
+                    "type": "number",
+                    "default": 30.0,
+                    "description": "Seconds of inactivity after which a connection is checked.",
+                },
+            },
+            "required": [],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLMetadataCacheConfig(BaseModel):
+    """
+    PostgreSQL metadata cache configuration.
+
+    Attributes:
+        ttl_seconds (float): Seconds after which cached schema and table metadata expire (0 disables the cache).
+    """
+
+    ttl_seconds: float = Field(
+        60.0, description="Seconds after which cached metadata expire", alias="ttl_seconds", ge=0
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL metadata cache configuration.",
+            "properties": {
+                "ttl_seconds": {
+                    "type": "number",
+                    "default": 60.0,
+                    "description": "Seconds after which cached metadata expire (0 disables the cache).",
+                },
+            },
+            "required": [],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLStatementCacheConfig(BaseModel):
+    """
+    PostgreSQL statement cache configuration.
+
+    Attributes:
+        prepare_threshold (int): [Optional] Executions of a query after which it is prepared on the server (never if not set).
+        max_prepared_statements (int): Maximum number of prepared statements per connection.
+    """
+
+    prepare_threshold: Optional[int] = Field(
+        5,
+        description="Executions of a query after which it is prepared on the server",
+        alias="prepare_threshold",
+    )
+    max_prepared_statements: int = Field(
+        100,
+        description="Maximum number of prepared statements per connection",
+        alias="max_prepared_statements",
+        gt=0,
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL statement cache configuration.",
+            "properties": {
+                "prepare_threshold": {
+                    "type": ["integer", "null"],
+                    "default": 5,
+                    "description": "Executions of a query after which it is prepared on the server (never if null).",
+                },
+                "max_prepared_statements": {
+                    "type": "integer",
+                    "default": 100,
+                    "description": "Maximum number of prepared statements per connection.",
+                },
+            },
+            "required": [],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLProfilingConfig(BaseModel):
+    """
+    PostgreSQL query profiling configuration.
+
+    Attributes:
+        explain (bool): Capture the ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` plan of the statement.
+        output_path (str): [Optional] JSON-lines file where to append the profiles.
+    """
+
+    explain: bool = Field(False, description="Capture the query plan", alias="explain")
+    output_path: Optional[str] = Field(
+        None, description="JSON-lines file where to append the profiles", alias="output_path"
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL query profiling configuration.",
+            "properties": {
+                "explain": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Capture the EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) plan of the statement.",
+                },
+                "output_path": {
+                    "type": ["string", "null"],
+                    "description": "JSON-lines file where to append the profiles.",
+                },
+            },
+            "required": [],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLQueryProfile(BaseModel):
+    """
+    PostgreSQL query profile of an execution.
+
+    Attributes:
+        query_path (str): Path to the query file.
+        schema (str): Schema name.
+        query_parameters (dict): [Optional] Query parameters.
+        started_at (datetime): Start time of the execution (UTC).
+        connect_seconds (float): Time spent checking out a pooled connection.
+        execute_seconds (float): Time spent executing the statement.
+        fetch_seconds (float): Time spent fetching the rows.
+        build_seconds (float): Time spent building the DataFrame.
+        total_seconds (float): Wall time of the execution.
+        rows (int): [Optional] Number of fetched or affected rows.
+        plan (List[Dict[str, Any]]): [Optional] JSON plan captured with ``EXPLAIN ANALYZE``.
+    """
+
+    query_path: str = Field(..., description="Path to the query file")
+    schema_name: str = Field(..., description="Schema name", alias="schema")
+    query_parameters: Optional[Dict[str, Any]] = Field(None, description="Query parameters")
+    started_at: datetime = Field(..., description="Start time of the execution (UTC)")
+    connect_seconds: float = Field(..., description="Time spent checking out a connection")
+    execute_seconds: float = Field(..., description="Time spent executing the statement")
+    fetch_seconds: float = Field(..., description="Time spent fetching the rows")
+    build_seconds: float = Field(..., description="Time spent building the DataFrame")
+    total_seconds: float = Field(..., description="Wall time of the execution")
+    rows: Optional[int] = Field(None, description="Number of fetched or affected rows")
+    plan: Optional[List[Dict[str, Any]]] = Field(None, description="JSON plan of EXPLAIN ANALYZE")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+
+class PostgreSQLPoolMetrics(BaseModel):
+    """
+    PostgreSQL connection pool metrics.
+
+    Attributes:
+        size (int): Number of open connections.
+        in_use (int): Number of checked out connections.
+        idle (int): Number of idle connections.
+        utilisation (float): Ratio of checked out connections over ``max_size``.
+        checkouts (int): Number of checkouts.
+        total_wait_seconds (float): Total time spent waiting for a connection.
+        max_wait_seconds (float): Longest time spent waiting for a connection.
+        created (int): Number of opened connections.
+        discarded (int): Number of closed connections (broken or idle).
+    """
+
+    size: int = Field(..., description="Number of open connections")
+    in_use: int = Field(..., description="Number of checked out connections")
+    idle: int = Field(..., description="Number of idle connections")
+    utilisation: float = Field(..., description="Ratio of checked out connections over max_size")
+    checkouts: int = Field(..., description="Number of checkouts")
+    total_wait_seconds: float = Field(..., description="Total time spent waiting for a connection")
+    max_wait_seconds: float = Field(..., description="Longest time spent waiting for a connection")
+    created: int = Field(..., description="Number of opened connections")
+    discarded: int = Field(..., description="Number of closed connections")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary.
+        """
+        return self.model_dump()
+
+
+class PostgreSQLStreamConfig(BaseModel):
+    """
+    PostgreSQL streaming configuration for reading large results in chunks
+    through a server-side cursor.
+
+    Attributes:
+        itersize (int): Number of rows fetched from the server at each round trip.
+        chunk_format (ChunkFormat): Format of the yielded chunks (``pandas`` or ``arrow``).
+    """
+
+    itersize: int = Field(
+        10000, description="Number of rows fetched at each round trip", alias="itersize", gt=0
+    )
+    chunk_format: ChunkFormat = Field(
+        ChunkFormat.PANDAS, description="Format of the yielded chunks", alias="chunk_format"
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL streaming configuration for reading large results in chunks.",
+            "properties": {
+                "itersize": {
+                    "type": "integer",
+                    "default": 10000,
+                    "description": "Number of rows fetched from the server at each round trip.",
+                },
+                "chunk_format": {
+                    "type": "string",
+                    "enum": ["pandas", "arrow"],
+                    "default": "pandas",
+                    "description": "Format of the yielded chunks.",
+                },
+            },
+            "required": [],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLUpsertResult(BaseModel):
+    """
+    PostgreSQL upsert result.
+
+    Attributes:
+        inserted (int): Number of inserted rows.
+        updated (int): Number of updated rows.
+    """
+
+    inserted: int = Field(..., description="Number of inserted rows")
+    updated: int = Field(..., description="Number of updated rows")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary.
+        """
+        return self.model_dump()
+
+
+class PostgreSQLPartitionConfig(BaseModel):
+    """
+    PostgreSQL partitioned read configuration, splitting a query into range sub-queries
+    on a numeric or timestamp column.
+
+    Attributes:
+        partition_column (str): Numeric or timestamp column used to split the query.
+        n_partitions (int): Number of range partitions.
+        max_workers (int): [Optional] Maximum number of partitions read concurrently (pool size if not set).
+        ordered (bool): Sort each partition by the column and combine the partitions in order.
+        lower_bound (Union[int, float, datetime]): [Optional] Lower bound of the column (queried if not set),
+            used to compute the width of the partitions. Smaller values are read by the first partition.
+        upper_bound (Union[int, float, datetime]): [Optional] Upper bound of the column (queried if not set),
+            used to compute the width of the partitions. Larger values are read by the last partition.
+    """
+
+    partition_column: str = Field(
+        ..., description="Column used to split the query", alias="partition_column"
+    )
+    n_partitions: int = Field(4, description="Number of partitions", alias="n_partitions", gt=0)
+    max_workers: Optional[int] = Field(
+        None, description="Maximum number of partitions read concurrently", alias="max_workers"
+    )
+    ordered: bool = Field(
+        False, description="Sort and combine the partitions in order", alias="ordered"
+    )
+    lower_bound: Optional[Union[int, float, datetime]] = Field(
+        None, description="Lower bound of the column", alias="lower_bound"
+    )
+    upper_bound: Optional[Union[int, float, datetime]] = Field(
+        None, description="Upper bound of the column", alias="upper_bound"
+    )
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """
+        Return the JSON schema.
+        """
+        return {
+            "type": "object",
+            "description": "PostgreSQL partitioned read configuration.",
+            "properties": {
+                "partition_column": {
+                    "type": "string",
+                    "description": "Numeric or timestamp column used to split the query.",
+                },
+                "n_partitions": {
+                    "type": "integer",
+                    "default": 4,
+                    "description": "Number of range partitions.",
+                },
+                "max_workers": {
+                    "type": ["integer", "null"],
+                    "description": "Maximum number of partitions read concurrently.",
+                },
+                "ordered": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Sort each partition by the column and combine the partitions in order.",
+                },
+                "lower_bound": {
+                    "type": ["number", "string", "null"],
+                    "description": "Lower bound of the column (queried if not set).",
+                },
+                "upper_bound": {
+                    "type": ["number", "string", "null"],
+                    "description": "Upper bound of the column (queried if not set).",
+                },
+            },
+            "required": ["partition_column"],
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary (using field aliases).
+        """
+        return self.model_dump(by_alias=True)
+
+    def as_json(self) -> str:
+        """
+        Return the model as a JSON string (with indentation for readability).
+        """
+        return self.model_dump_json(by_alias=True, indent=2)
+
+    def as_df(self) -> pd.DataFrame:
+        """
+        Return the model as a single-row pandas DataFrame.
+        """
+        return pd.DataFrame([self.as_dict()])
+
+
+class PostgreSQLStatementCacheMetrics(BaseModel):
+    """
+    PostgreSQL statement cache metrics.
+
+    Attributes:
+        sql_file_hits (int): Number of SQL files read from the cache.
+        sql_file_misses (int): Number of SQL files read from disk.
+        prepared_statements (int): Number of statements prepared on the server.
+        prepared_hits (int): Number of executions of already prepared statements.
+        saved_seconds (float): Estimated parse and plan time saved by the prepared statements.
+    """
+
+    sql_file_hits: int = Field(..., description="Number of SQL files read from the cache")
+    sql_file_misses: int = Field(..., description="Number of SQL files read from disk")
+    prepared_statements: int = Field(..., description="Number of statements prepared on the server")
+    prepared_hits: int = Field(..., description="Number of executions of prepared statements")
+    saved_seconds: float = Field(..., description="Estimated parse and plan time saved")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the model as a Python dictionary.
+        """
+        return self.model_dump()
@@ -4,12 +4,32 @@ module src/data_grimorium/bigquery_connector
 """
 
 # Import Standard Libraries
-from google.cloud import bigquery
+import pathlib
+from google.api_core.exceptions import BadRequest, NotFound
+from google.cloud import bigquery, bigquery_storage
+from unittest import mock
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 # Import Package Modules
 from data_grimorium.bigquery_connector.bigquery_connector import BigQueryConnector
-from data_grimorium.bigquery_connector.bigquery_types import BQQueryConfig
+from data_grimorium.bigquery_connector.bigquery_result_cache import BigQueryResultCache
+from data_grimorium.bigquery_connector.bigquery_types import (
+    BQBatchConfig,
+    BQChunkFormat,
+    BQFailurePolicy,
+    BQQueryConfig,
+    BQResultCacheConfig,
+    BQStorageReadConfig,
+    BQStreamConfig,
+    BQUploadConfig,
+    BQSchemaMode,
+    BQWriteMode,
+)
+from data_grimorium.general_utils.general_utils_types import ParquetSpillConfig
+from data_grimorium.general_utils.metadata_cache import MetadataCache
 
 
 @pytest.mark.skip(
@@ -191,3 +211,581 @@ def test_wrap_dictionary_to_query_config(
 
     assert wrapped_parameters.count_non_none_attributes() == expected_configs
     assert isinstance(wrapped_parameters, BQQueryConfig)
+
+
+@pytest.mark.parametrize(
+    "input_batches, partition_columns, expected_files",
+    [
+        (
+            [pa.record_batch({"id": [1, 2], "display_name": ["A", "B"]})] * 3,
+            None,
+            ["part-00000.parquet"],
+        ),
+        (
+            [pa.record_batch({"id": [1, 2], "display_name": ["A", "B"]})] * 3,
+            ["display_name"],
+            ["display_name=A/part-00000.parquet", "display_name=B/part-00000.parquet"],
+        ),
+    ],
+)
+def test_execute_query_to_parquet(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    input_batches: list,
+    partition_columns: list,
+    expected_files: list,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.execute_query_from_config
+    by writing the pages of a mocked query result into Parquet files
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        input_batches (list): Arrow record batches returned by the mocked job
+        partition_columns (list): Columns of the partition directories
+        expected_files (list): Expected written files
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset
+    """
+    # Mock the query job
+    job = fixture_bigquery_mocked_connector._client.query.return_value
+    job.statement_type = "SELECT"
+    job.result.return_value.total_rows = 6
+    job.result.return_value.to_arrow_iterable.return_value = iter(input_batches)
+
+    # Write the result in pages of two rows
+    handle = fixture_bigquery_mocked_connector.execute_query_from_config(
+        fixture_bigquery_read_query_config.model_copy(update={"local_path": str(tmp_path)}),
+        spill_config=ParquetSpillConfig(row_group_size=2, partition_columns=partition_columns),
+    )
+
+    job.result.assert_called_once_with(page_size=2)
+    job.result.return_value.to_dataframe.assert_not_called()
+    assert handle.rows == 6
+    assert sorted(handle.files) == expected_files
+    assert sorted(handle.read()["id"]) == [1, 1, 1, 2, 2, 2]
+
+
+@pytest.mark.parametrize(
+    "storage_read_config, total_rows, expected_storage",
+    [
+        (BQStorageReadConfig(), 1_000_000, True),
+        (BQStorageReadConfig(), None, True),
+        (BQStorageReadConfig(), 10, False),
+        (BQStorageReadConfig(enabled=False), 1_000_000, False),
+    ],
+)
+def test_execute_query_storage_read(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    storage_read_config: BQStorageReadConfig,
+    total_rows: int,
+    expected_storage: bool,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.execute_query_from_config
+    by checking whether a mocked query result is read through the Storage Read API
+    or the REST endpoint
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        storage_read_config (BQStorageReadConfig): Storage Read API configurations
+        total_rows (Integer): Number of rows of the mocked result
+        expected_storage (Boolean): Flag indicating if the Storage Read API is expected
+    """
+    connector = fixture_bigquery_mocked_connector
+    connector._storage_read_config = storage_read_config
+
+    # Mock the query job
+    job = connector._client.query.return_value
+    job.statement_type = "SELECT"
+    job.result.return_value.total_rows = total_rows
+
+    # Read the data twice, the Storage Read API client is created once
+    with mock.patch.object(bigquery_storage, "BigQueryReadClient") as read_client:
+        for _ in range(2):
+            connector.execute_query_from_config(fixture_bigquery_read_query_config)
+
+    _, kwargs = job.result.return_value.to_dataframe.call_args
+
+    assert read_client.call_args_list == [mock.call()] * int(expected_storage)
+    assert kwargs["create_bqstorage_client"] is False
+    assert (kwargs["bqstorage_client"] is read_client.return_value) == expected_storage
+    assert (kwargs["bqstorage_client"] is None) != expected_storage
+
+
+@pytest.mark.parametrize(
+    "stream_config, expected_method",
+    [
+        (BQStreamConfig(page_size=2, chunk_format=BQChunkFormat.PANDAS), "to_dataframe_iterable"),
+        (BQStreamConfig(page_size=2, chunk_format=BQChunkFormat.ARROW), "to_arrow_iterable"),
+    ],
+)
+def test_stream_query_from_config(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    stream_config: BQStreamConfig,
+    expected_method: str,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.stream_query_from_config
+    by streaming the pages of a mocked query result
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        stream_config (BQStreamConfig): Page size and chunk format
+        expected_method (String): Expected method of the result used to iterate the chunks
+    """
+    # Mock the query job with three pages
+    job = fixture_bigquery_mocked_connector._client.query.return_value
+    result = job.result.return_value
+    result.total_rows = 5
+    pages = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3, 4]}), pd.DataFrame({"id": [5]})]
+    getattr(result, expected_method).return_value = iter(pages)
+
+    # The job is submitted on the first chunk
+    chunks = fixture_bigquery_mocked_connector.stream_query_from_config(
+        fixture_bigquery_read_query_config, stream_config
+    )
+    job.result.assert_not_called()
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    job.result.assert_called_once_with(page_size=2)
+    getattr(result, expected_method).assert_called_once_with(
+        bqstorage_client=None, max_stream_count=None
+    )
+
+
+@pytest.mark.parametrize(
+    "ttl_seconds, check_source_tables, source_modified, expected_queries",
+    [
+        (3600, False, False, 1),
+        (0, False, False, 2),
+        (3600, True, False, 1),
+        (3600, True, True, 2),
+    ],
+)
+def test_result_cache(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    ttl_seconds: float,
+    check_source_tables: bool,
+    source_modified: bool,
+    expected_queries: int,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.execute_query_from_config
+    with the local result cache, by running the same mocked query twice
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        ttl_seconds (Float): Seconds after which a cached result expires
+        check_source_tables (Boolean): Flag to check the source tables modification
+        source_modified (Boolean): Flag to modify the source table between the two runs
+        expected_queries (Integer): Expected number of submitted jobs
+        tmp_path (pathlib.Path): Temporary directory of the cache
+    """
+    connector = fixture_bigquery_mocked_connector
+    cache_config = BQResultCacheConfig(
+        cache_dir=str(tmp_path),
+        ttl_seconds=ttl_seconds,
+        check_source_tables=check_source_tables,
+    )
+    connector._result_cache_config = cache_config
+    connector._result_cache = BigQueryResultCache(tmp_path, cache_config)
+
+    # Mock the query job and its source table
+    data = pd.DataFrame({"id": [3863], "display_name": ["Adam Hughes"]})
+    job = connector._client.query.return_value
+    job.statement_type = "SELECT"
+    job.referenced_tables = [bigquery.TableReference.from_string("project.dataset.table")]
+    job.result.return_value.total_rows = 1
+    job.result.return_value.to_dataframe.return_value = data
+    source_table = bigquery.Table("project.dataset.table")
+    source_table._properties["lastModifiedTime"] = "1704067200000"
+    connector._client.get_table.return_value = source_table
+
+    # Run the query twice
+    first = connector.execute_query_from_config(fixture_bigquery_read_query_config)
+    if source_modified:
+        source_table._properties["lastModifiedTime"] = "1704070800000"
+    second = connector.execute_query_from_config(fixture_bigquery_read_query_config)
+
+    assert connector._client.query.call_count == expected_queries
+    pd.testing.assert_frame_equal(first, data)
+    pd.testing.assert_frame_equal(second, data)
+
+
+@pytest.mark.parametrize("max_size_bytes, expected_keys", [(1, ["b"]), (1024**2, ["a", "b"])])
+def test_result_cache_eviction(
+    max_size_bytes: int, expected_keys: list, tmp_path: pathlib.Path
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_result_cache.BigQueryResultCache.set
+    by checking the least recently used results are evicted above the maximum size
+
+    Args:
+        max_size_bytes (Integer): Maximum size of the cache
+        expected_keys (list): Expected keys still cached
+        tmp_path (pathlib.Path): Temporary directory of the cache
+    """
+    cache = BigQueryResultCache(tmp_path, BQResultCacheConfig(max_size_bytes=max_size_bytes))
+
+    # Cache two results, the newest one is always kept
+    cache.set("a", pa.table({"id": [1, 2]}), {})
+    cache.set("b", pa.table({"id": [3, 4]}), {})
+
+    cached_keys = [key for key in ["a", "b"] if cache.get(key) is not None]
+
+    assert cached_keys == expected_keys
+    assert cache.get("b")[0].equals(pa.table({"id": [3, 4]}))
+
+
+@pytest.mark.parametrize(
+    "failure_policy, expected_errors, expected_queries",
+    [
+        (BQFailurePolicy.COLLECT, [None, "400 Syntax error", None], 3),
+        (BQFailurePolicy.FAIL_FAST, None, 2),
+    ],
+)
+def test_execute_queries_from_config(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    failure_policy: BQFailurePolicy,
+    expected_errors: list,
+    expected_queries: int,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.execute_queries_from_config
+    by running three mocked jobs, two at a time, where the second one fails
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        failure_policy (BQFailurePolicy): Failure policy of the batch
+        expected_errors (list): Expected error of each query (None if the batch raises)
+        expected_queries (Integer): Expected number of submitted jobs
+    """
+    connector = fixture_bigquery_mocked_connector
+
+    # Mock three jobs, the first one completes at the second poll and the second one fails
+    jobs = []
+    for index in range(3):
+        job = mock.MagicMock(job_id=f"job_{index}", statement_type="SELECT")
+        job.total_bytes_processed = 100
+        job.done.side_effect = [False, True] if index == 0 else [True]
+        job.result.return_value.total_rows = 1
+        job.result.return_value.to_dataframe.return_value = pd.DataFrame({"id": [index]})
+        jobs.append(job)
+    jobs[1].result.side_effect = BadRequest("Syntax error")
+
+    # Track the number of jobs submitted and not collected yet
+    submitted, max_running = [], []
+
+    def submit(*args, **kwargs):
+        submitted.append(jobs[len(submitted)])
+        max_running.append(sum(not job.result.called for job in submitted))
+        return submitted[-1]
+
+    connector._client.query.side_effect = submit
+
+    batch_config = BQBatchConfig(
+        max_concurrent_jobs=2, failure_policy=failure_policy, poll_interval_seconds=0
+    )
+    if expected_errors is None:
+        with pytest.raises(BadRequest):
+            connector.execute_queries_from_config(
+                [fixture_bigquery_read_query_config] * 3, batch_config
+            )
+        jobs[0].cancel.assert_called_once()
+    else:
+        results = connector.execute_queries_from_config(
+            [fixture_bigquery_read_query_config] * 3, batch_config
+        )
+
+        assert [result.error for result in results] == expected_errors
+        assert [result.job_id for result in results] == ["job_0", "job_1", "job_2"]
+        assert results[0].result["id"].tolist() == [0]
+        assert results[2].result["id"].tolist() == [2]
+        assert results[2].bytes_processed == 100
+
+    assert connector._client.query.call_count == expected_queries
+    assert max(max_running) == 2
+
+
+@pytest.mark.parametrize(
+    "total_bytes_processed, referenced_tables, expected_output",
+    [
+        (
+            2048,
+            ["project.dataset.table_a", "project.dataset.table_b"],
+            {
+                "total_bytes_processed": 2048,
+                "referenced_tables": ["project.dataset.table_a", "project.dataset.table_b"],
+                "statement_type": "SELECT",
+            },
+        ),
+        (
+            None,
+            [],
+            {"total_bytes_processed": 0, "referenced_tables": [], "statement_type": "SELECT"},
+        ),
+    ],
+)
+def test_dry_run_from_config(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    total_bytes_processed: int,
+    referenced_tables: list,
+    expected_output: dict,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.dry_run_from_config
+    by checking the estimate of a mocked dry run job
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        total_bytes_processed (Integer): Bytes processed reported by the mocked job
+        referenced_tables (list): Tables referenced by the mocked job
+        expected_output (dict): Expected dry run result
+    """
+    # Mock the dry run job
+    job = fixture_bigquery_mocked_connector._client.query.return_value
+    job.statement_type = "SELECT"
+    job.total_bytes_processed = total_bytes_processed
+    job.referenced_tables = [
+        bigquery.TableReference.from_string(table) for table in referenced_tables
+    ]
+
+    result = fixture_bigquery_mocked_connector.dry_run_from_config(
+        fixture_bigquery_read_query_config
+    )
+    job_config = fixture_bigquery_mocked_connector._client.query.call_args.kwargs["job_config"]
+
+    assert result.model_dump() == expected_output
+    assert job_config.dry_run is True
+    assert job_config.use_query_cache is False
+    job.result.assert_not_called()
+
+
+@pytest.mark.parametrize("maximum_bytes_billed", [None, 1024])
+def test_execute_query_maximum_bytes_billed(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    fixture_bigquery_read_query_config: BQQueryConfig,
+    maximum_bytes_billed: int,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.execute_query_from_config
+    by checking the scan budget of the query is set on the submitted job
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        fixture_bigquery_read_query_config (BQQueryConfig): Query configurations
+        maximum_bytes_billed (Integer): Maximum bytes billed by the query
+    """
+    # Mock the query job
+    job = fixture_bigquery_mocked_connector._client.query.return_value
+    job.statement_type = "SELECT"
+    job.result.return_value.total_rows = 1
+
+    fixture_bigquery_mocked_connector.execute_query_from_config(
+        fixture_bigquery_read_query_config.model_copy(
+            update={"maximum_bytes_billed": maximum_bytes_billed}
+        )
+    )
+    job_config = fixture_bigquery_mocked_connector._client.query.call_args.kwargs["job_config"]
+
+    assert job_config.maximum_bytes_billed == maximum_bytes_billed
+    assert job_config.dry_run is not True
+
+
+@pytest.mark.parametrize(
+    "ttl_seconds, table_found, expected_exists, expected_lookups",
+    [(300, True, True, 1), (0, True, True, 2), (300, False, False, 2)],
+)
+def test_table_exists_metadata_cache(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    ttl_seconds: float,
+    table_found: bool,
+    expected_exists: bool,
+    expected_lookups: int,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.table_exists
+    by checking the table metadata is looked up once and then cached
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        ttl_seconds (Float): Seconds after which the cached metadata expires
+        table_found (Boolean): Flag indicating if the mocked table exists
+        expected_exists (Boolean): Expected result of the look up
+        expected_lookups (Integer): Expected number of get_table calls
+    """
+    connector = fixture_bigquery_mocked_connector
+    connector._metadata_cache = MetadataCache(ttl_seconds)
+
+    # Mock the table
+    table = bigquery.Table("project.dataset.table", schema=[bigquery.SchemaField("id", "INTEGER")])
+    table._properties["numRows"] = "3"
+    if table_found:
+        connector._client.get_table.return_value = table
+    else:
+        connector._client.get_table.side_effect = NotFound("table")
+
+    # Look up the table twice
+    exists = [connector.table_exists("table", "dataset") for _ in range(2)]
+
+    assert exists == [expected_exists, expected_exists]
+    assert connector._client.get_table.call_count == expected_lookups
+    if table_found:
+        metadata = connector.get_table_metadata("dataset.table")
+        assert metadata.columns == {"id": "INTEGER"}
+        assert metadata.num_rows == 3
+
+    # The fully-qualified table ID shares the cached metadata, also when invalidated
+    if table_found and ttl_seconds:
+        project_id = connector._client_config.project_id
+        connector.get_table_metadata(f"{project_id}.dataset.table")
+        assert connector._client.get_table.call_count == expected_lookups
+        connector.invalidate_metadata_cache("dataset.table")
+        connector.get_table_metadata(f"{project_id}.dataset.table")
+        assert connector._client.get_table.call_count == expected_lookups + 1
+
+
+@pytest.mark.parametrize(
+    "write_mode, schema_mode, chunk_rows, spill_to_disk, expected_dispositions, "
+    "expected_schema_options, expected_staging",
+    [
+        (
+            BQWriteMode.APPEND,
+            BQSchemaMode.ALLOW_FIELD_ADDITION,
+            2,
+            False,
+            ["WRITE_APPEND", "WRITE_APPEND"],
+            [["ALLOW_FIELD_ADDITION"], ["ALLOW_FIELD_ADDITION"]],
+            False,
+        ),
+        (
+            BQWriteMode.TRUNCATE,
+            BQSchemaMode.ALLOW_FIELD_ADDITION,
+            10,
+            False,
+            ["WRITE_TRUNCATE"],
+            [None],
+            False,
+        ),
+        (
+            BQWriteMode.TRUNCATE,
+            BQSchemaMode.INFER,
+            2,
+            True,
+            ["WRITE_TRUNCATE", "WRITE_APPEND"],
+            [None, None],
+            True,
+        ),
+    ],
+)
+def test_upload_dataframe(
+    fixture_bigquery_mocked_connector: BigQueryConnector,
+    write_mode: BQWriteMode,
+    schema_mode: BQSchemaMode,
+    chunk_rows: int,
+    spill_to_disk: bool,
+    expected_dispositions: list,
+    expected_schema_options: list,
+    expected_staging: bool,
+) -> bool:
+    """
+    Test the function
+    src/data_grimorium/bigquery_connector/
+    bigquery_connector.BigQueryConnector.upload_dataframe
+    by checking the Parquet chunks, the configurations of the submitted load jobs
+    and the staging table copied to the truncated table
+
+    Args:
+        fixture_bigquery_mocked_connector (BigQueryConnector): BigQuery Connector with a mocked client
+        write_mode (BQWriteMode): Write mode of the upload
+        schema_mode (BQSchemaMode): Schema mode of the upload
+        chunk_rows (Integer): Number of rows loaded by each job
+        spill_to_disk (Boolean): Flag to serialise chunks to temporary files
+        expected_dispositions (List): Expected write disposition of each load job
+        expected_schema_options (List): Expected schema update options of each load job
+        expected_staging (Boolean): Flag indicating if the chunks are loaded in a staging table
+    """
+    connector = fixture_bigquery_mocked_connector
+    data = pd.DataFrame({"id": [1, 2, 3], "tags": [["a"], [], ["b", "c"]]})
+
+    # Read back the Parquet chunks sent to the load jobs
+    chunks = []
+
+    def load_table_from_file(file, table_id, rewind, job_config):
+        file.seek(0)
+        chunks.append(pq.read_table(file).to_pandas())
+        return mock.DEFAULT
+
+    connector._client.load_table_from_file.side_effect = load_table_from_file
+
+    rows = connector.upload_dataframe(
+        data,
+        "table",
+        "dataset",
+        BQUploadConfig(
+            write_mode=write_mode,
+            schema_mode=schema_mode,
+            chunk_rows=chunk_rows,
+            spill_to_disk=spill_to_disk,
+        ),
+    )
+    calls = connector._client.load_table_from_file.call_args_list
+    load_table_ids = {call.args[1] for call in calls}
+
+    assert rows == len(data)
+    assert len(load_table_ids) == 1
+    assert [call.kwargs["job_config"].write_disposition for call in calls] == expected_dispositions
+    assert [
+        call.kwargs["job_config"].schema_update_options for call in calls
+    ] == expected_schema_options
+    assert all(
+        call.kwargs["job_config"].source_format == bigquery.SourceFormat.PARQUET for call in calls
+    )
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True)[["id"]], data[["id"]])
+
+    # Check the staging table is copied to the table and then deleted
+    if expected_staging:
+        (staging_table_id,) = load_table_ids
+        copy_call = connector._client.copy_table.call_args
+        assert staging_table_id.startswith("dataset.table_staging_")
+        assert copy_call.args == (staging_table_id, "dataset.table")
+        assert copy_call.kwargs["job_config"].write_disposition == "WRITE_TRUNCATE"
+        connector._client.delete_table.assert_called_once_with(staging_table_id, not_found_ok=True)
+    else:
+        assert load_table_ids == {"dataset.table"}
+        connector._client.copy_table.assert_not_called()
+
+    # Check the empty DataFrame
+    with pytest.raises(ValueError):
+        connector.upload_dataframe(pd.DataFrame(), "table", "dataset")
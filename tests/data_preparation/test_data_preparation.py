@@ -4,10 +4,12 @@ module src.data_preparation.
 """
 
 # Import Standard Libraries
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 import pandas as pd
 import numpy as np
 import pytest
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
 
 # Import Package Modules
 from data_grimorium.data_preparation.data_preparation_utils import (
@@ -19,15 +21,23 @@ from data_grimorium.data_preparation.data_preparation_utils import (
     drop_outliers,
     manage_nan_values,
     prepare_numerical_features,
+    prepare_numerical_features_parallel,
     create_flag_feature,
+    reduce_memory_usage,
+    create_flag_features,
+    unpack_flag_features,
 )
 from data_grimorium.data_preparation.data_preparation_types import (
     EmbeddingsConfig,
     CompressEmbeddingsConfig,
     EncodingTextConfig,
+    MemoryBudgetConfig,
     DateExtractionConfig,
     NumericalFeaturesConfig,
+    OutlierConfig,
+    ParallelPreparationConfig,
     FlagFeatureConfig,
+    BulkFlagFeaturesConfig,
 )
 
 
@@ -128,6 +138,70 @@ def test_extract_date_information(
     assert output_data.columns.to_list() == expected_columns
 
 
+@pytest.mark.parametrize(
+    "input_data, config, expected_dtypes",
+    [
+        (
+            pd.DataFrame({"creation_date": ["2020-01-01T10:00:00", None, "2020-01-01T10:00:00"]}),
+            DateExtractionConfig(
+                column_name="creation_date",
+                extract_year=True,
+                extract_month=True,
+                extract_hour=True,
+                cyclical_encoding=True,
+                date_format="ISO8601",
+            ),
+            {
+                "creation_date_year": "Int16",
+                "creation_date_month": "Int8",
+                "creation_date_month_sin": "float32",
+                "creation_date_month_cos": "float32",
+                "creation_date_hour": "Int8",
+                "creation_date_hour_sin": "float32",
+                "creation_date_hour_cos": "float32",
+            },
+        ),
+        (
+            pd.DataFrame({"creation_date": ["01/01/2020", "15/06/2021", "01/01/2020"]}),
+            DateExtractionConfig(
+                column_name="creation_date",
+                extract_year=True,
+                extract_month=False,
+                extract_weekday=True,
+                extract_quarter=True,
+                extract_week=True,
+                extract_epoch=True,
+                date_format="%d/%m/%Y",
+            ),
+            {
+                "creation_date_year": "int16",
+                "creation_date_weekday": "int8",
+                "creation_date_quarter": "int8",
+                "creation_date_week": "int8",
+                "creation_date_epoch": "int64",
+            },
+        ),
+    ],
+)
+def test_extract_date_information_parts(
+    input_data: pd.DataFrame, config: DateExtractionConfig, expected_dtypes: dict
+) -> bool:
+    """
+    Test the function
+    data_grimorium/data_preparation/data_preparation_utils.extract_date_information
+    by checking the dtypes of the extracted date parts.
+
+    Args:
+        input_data (pd.DataFrame): Input data
+        config (DateExtractionConfig): Object including date extraction config
+        expected_dtypes (dict): Expected dtype of each extracted column
+    """
+    # Extract date information
+    output_data = extract_date_information(input_data, config)
+
+    assert output_data.dtypes.drop(config.column_name).astype(str).to_dict() == expected_dtypes
+
+
 @pytest.mark.parametrize(
     "input_data, expected_values",
     [(pd.DataFrame({"reputation": [12.5, 15.8, 19.7, 50.2]}), [0.0, 0.08, 0.19, 1.0])],
@@ -205,6 +279,88 @@ def test_manage_nan_values(
     assert input_data.shape[0] == expected_output_rows
 
 
+@pytest.mark.parametrize(
+    "input_data, config, transformation, expected_values",
+    [
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, None, 19.7, 50.2, None]}),
+            NumericalFeaturesConfig(column_name="reputation", nan_values="simple_imputer"),
+            manage_nan_values,
+            {"reputation": [12.5, 15.8, 24.55, 19.7, 50.2, 24.55]},
+        ),
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, None, 19.7, 50.2, None]}),
+            NumericalFeaturesConfig(
+                column_name="reputation", nan_values="simple_imputer", imputation_method="median"
+            ),
+            manage_nan_values,
+            {"reputation": [12.5, 15.8, 17.75, 19.7, 50.2, 17.75]},
+        ),
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, 19.7, 50.2]}),
+            NumericalFeaturesConfig(column_name="reputation", standardisation="standard_scaler"),
+            standardise_features,
+            {"reputation_standardised": [-0.8, -0.58, -0.32, 1.71]},
+        ),
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, None, 19.7, 50.2, None]}),
+            NumericalFeaturesConfig(
+                column_name="reputation",
+                standardisation="standard_scaler",
+                drop_outliers=OutlierConfig(method="iqr"),
+                nan_values="simple_imputer",
+                imputation_method="median",
+            ),
+            prepare_numerical_features,
+            {"reputation_standardised": [-1.19, -0.07, 1.26]},
+        ),
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, None, 19.7, 18.3, None]}),
+            NumericalFeaturesConfig(
+                column_name="reputation",
+                standardisation="standard_scaler",
+                nan_values="simple_imputer",
+                imputation_method="median",
+            ),
+            prepare_numerical_features,
+            {
+                "reputation": [12.5, 15.8, 17.05, 19.7, 18.3, 17.05],
+                "reputation_standardised": StandardScaler()
+                .fit_transform(
+                    SimpleImputer(strategy="median").fit_transform(
+                        np.array([[12.5], [15.8], [np.nan], [19.7], [18.3], [np.nan]])
+                    )
+                )
+                .ravel()
+                .tolist(),
+            },
+        ),
+    ],
+)
+def test_impute_and_standardise(
+    input_data: pd.DataFrame,
+    config: NumericalFeaturesConfig,
+    transformation: Callable[[pd.DataFrame, NumericalFeaturesConfig], pd.DataFrame],
+    expected_values: dict,
+) -> bool:
+    """
+    Test the standard scaler and the imputation of the functions
+    data_grimorium/data_preparation/data_preparation_utils.manage_nan_values,
+    standardise_features and prepare_numerical_features.
+
+    Args:
+        input_data (pd.DataFrame): Input data
+        config (NumericalFeaturesConfig): Object including numerical feature transformation configurations
+        transformation (Callable[[pd.DataFrame, NumericalFeaturesConfig], pd.DataFrame]): Function to test
+        expected_values (dict): Expected transformed column values
+    """
+    # Apply the transformations in the configuration
+    output_data = transformation(input_data, config)
+
+    for output_column_name, values in expected_values.items():
+        assert output_data.loc[:, output_column_name].to_list() == pytest.approx(values, abs=0.01)
+
+
 @pytest.mark.parametrize(
     "input_data, expected_values",
     [
@@ -240,6 +396,50 @@ def test_prepare_numerical_features(
     )
 
 
+@pytest.mark.parametrize(
+    "input_data, column_names, expected_values",
+    [
+        (
+            pd.DataFrame(
+                {"reputation": [12.5, 15.8, 19.7, None, 800.0], "views": [10, 20, np.nan, 50, 600]}
+            ),
+            ["reputation", "views"],
+            {"reputation_standardised": [0.0, 1.0], "views_standardised": [0.0, 1.0]},
+        )
+    ],
+)
+def test_prepare_numerical_features_parallel(
+    fixture_numerical_features_config: NumericalFeaturesConfig,
+    fixture_parallel_preparation_config: ParallelPreparationConfig,
+    input_data: pd.DataFrame,
+    column_names: List[str],
+    expected_values: dict,
+) -> bool:
+    """
+    Test the function data_grimorium/data_preparation/data_preparation_utils.prepare_numerical_features_parallel.
+
+    Args:
+        fixture_numerical_features_config (NumericalFeaturesConfig): Object including numerical feature transformation configurations
+        fixture_parallel_preparation_config (ParallelPreparationConfig): Object including process pool configurations
+        input_data (pd.DataFrame): Input data
+        column_names (List[str]): Columns to prepare
+        expected_values (dict): Expected transformed column values
+    """
+    # Build a configuration for each column
+    configs = [
+        fixture_numerical_features_config.model_copy(update={"column_name": column_name})
+        for column_name in column_names
+    ]
+
+    # Apply transformations
+    output_data = prepare_numerical_features_parallel(
+        input_data, configs, fixture_parallel_preparation_config
+    )
+
+    for output_column_name, values in expected_values.items():
+        assert output_data.loc[:, output_column_name].to_list() == pytest.approx(values)
+
+
 @pytest.mark.parametrize(
     "input_data, config, expected_values",
     [
@@ -247,21 +447,158 @@ def test_prepare_numerical_features(
             pd.DataFrame({"name": ["James", None, "Anthony"]}),
             FlagFeatureConfig(column_name="name", output_column_name="name_flag"),
             [True, False, True],
-        )
+        ),
+        (
+            pd.DataFrame({"country": ["IT", None, "IT"]}),
+            FlagFeatureConfig(
+                column_name="country",
+                output_column_name="country_flag",
+                memory_budget=MemoryBudgetConfig(),
+            ),
+            [True, False, True],
+        ),
     ],
 )
 def test_create_flag_feature(
     input_data: pd.DataFrame, config: FlagFeatureConfig, expected_values: List[float]
 ) -> bool:
     """
-    Test the function data_grimorium/data_preparation/data_preparation_utils.create_flag_feature.
+    Test the function data_grimorium/data_preparation/data_preparation_utils.create_flag_feature
+    by checking the flag values and that the source column keeps its dtype.
 
     Args:
         input_data (pd.DataFrame): Input data
         config (FlagFeatureConfig): Object including flag feature transformation configurations
         expected_values (List[float]): Expected transformed column values
     """
+    input_dtype = input_data[config.column_name].dtype
+
     # Compute the flag feature
     transformed_data = create_flag_feature(input_data, config)
 
     assert transformed_data.loc[:, config.output_column_name].to_list() == expected_values
+    assert transformed_data[config.column_name].dtype == input_dtype
+
+
+@pytest.mark.parametrize(
+    "input_data, config, expected_dtypes",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "views": [10, 20, 30, 40],
+                    "reputation": [12.5, 15.8, 19.7, 50.2],
+                    "country": ["IT", "IT", "FR", "IT"],
+                    "name": ["James", "Anthony", "Robert", "Mary"],
+                }
+            ),
+            MemoryBudgetConfig(float_tolerance=1e-6),
+            {"views": "uint8", "reputation": "float32", "country": "category", "name": "object"},
+        ),
+        (
+            pd.DataFrame(
+                {
+                    "exact": [0.5, 1.25, np.nan, -3.0],
+                    "reputation": [12.5, 15.8, 19.7, 50.2],
+                    "precise": [1.23456789e-6, 0.5, 0.25, 1.0],
+                    "large": [1e300, 0.5, 0.25, 1.0],
+                }
+            ),
+            MemoryBudgetConfig(),
+            {"exact": "float32", "reputation": "float64", "precise": "float64", "large": "float64"},
+        ),
+    ],
+)
+def test_reduce_memory_usage(
+    input_data: pd.DataFrame, config: MemoryBudgetConfig, expected_dtypes: dict
+) -> bool:
+    """
+    Test the function data_grimorium/data_preparation/data_preparation_utils.reduce_memory_usage.
+
+    Args:
+        input_data (pd.DataFrame): Input data
+        config (MemoryBudgetConfig): Object including memory footprint reduction configurations
+        expected_dtypes (dict): Expected dtype of each column
+    """
+    # Reduce the memory usage
+    output_data = reduce_memory_usage(input_data, config)
+
+    assert output_data.dtypes.astype(str).to_dict() == expected_dtypes
+
+
+@pytest.mark.parametrize(
+    "input_data, config, expected_dtypes",
+    [
+        (
+            pd.DataFrame({"reputation": [12.5, 15.8, 19.7, 20.1, 18.3, 980.2]}),
+            NumericalFeaturesConfig(
+                column_name="reputation",
+                standardisation="min_max_scaler",
+                drop_outliers=OutlierConfig(method="z_score", n_std=2),
+                memory_budget=MemoryBudgetConfig(float_tolerance=1e-6),
+            ),
+            {"reputation": "float64", "reputation_standardised": "float32"},
+        )
+    ],
+)
+def test_memory_budget(
+    input_data: pd.DataFrame, config: NumericalFeaturesConfig, expected_dtypes: dict
+) -> bool:
+    """
+    Test the memory budget mode of the functions
+    data_grimorium/data_preparation/data_preparation_utils.drop_outliers and standardise_features
+    by checking the output dtypes, the dropped helper column and the memory report.
+
+    Args:
+        input_data (pd.DataFrame): Input data
+        config (NumericalFeaturesConfig): Object including numerical feature transformation configurations
+        expected_dtypes (dict): Expected dtype of each output column
+    """
+    # Apply transformations
+    output_data = standardise_features(drop_outliers(input_data, config), config)
+
+    assert output_data.dtypes.astype(str).to_dict() == expected_dtypes
+    assert [report["step"] for report in output_data.attrs["memory_report"]] == [
+        "drop_outliers",
+        "standardise_features",
+    ]
+
+
+@pytest.mark.parametrize(
+    "representation, expected_columns",
+    [
+        ("dense", ["name", "age", "name_flag", "age_flag", "name_flag_2"]),
+        ("bitset", ["name", "age", "flags_bitset_0"]),
+        ("sparse", ["name", "age", "name_flag", "age_flag", "name_flag_2"]),
+    ],
+)
+def test_create_flag_features(representation: str, expected_columns: List[str]) -> bool:
+    """
+    Test the functions data_grimorium/data_preparation/data_preparation_utils.create_flag_features
+    and unpack_flag_features by checking the output columns and the unpacked flags.
+
+    Args:
+        representation (str): Representation of the flags
+        expected_columns (List[str]): Expected output columns
+    """
+    # Build the input data and the configurations
+    input_data = pd.DataFrame({"name": ["James", None, "Anthony"], "age": [None, None, 42]})
+    config = BulkFlagFeaturesConfig(
+        flags=[
+            FlagFeatureConfig(column_name="name", output_column_name="name_flag"),
+            FlagFeatureConfig(column_name="age", output_column_name="age_flag"),
+            FlagFeatureConfig(column_name="name", output_column_name="name_flag_2"),
+        ],
+        representation=representation,
+    )
+
+    # Compute and unpack the flag features
+    transformed_data = create_flag_features(input_data, config)
+    flags = unpack_flag_features(transformed_data, config)
+
+    assert transformed_data.columns.to_list() == expected_columns
+    assert flags.to_dict(orient="list") == {
+        "name_flag": [True, False, True],
+        "age_flag": [False, False, True],
+        "name_flag_2": [True, False, True],
+    }
@@ -7,6 +7,8 @@ import os
 import pathlib
 import pytest
 from dynaconf import Dynaconf
+from google.cloud import bigquery
+from unittest import mock
 
 # Import Package Modules
 from src.data_grimorium.bigquery_connector.bigquery_types import (
@@ -67,6 +69,29 @@ def fixture_bigquery_connector(
     return bigquery_connector
 
 
+@pytest.fixture
+def fixture_bigquery_mocked_connector(
+    project_id: str = os.getenv("PROJECT_ID", "test-project"),
+) -> BigQueryConnector:
+    """
+    This fixture returns a BigQueryConnector object with a mocked BigQuery client,
+    so that the connector logic can be tested without GCP credentials
+
+    Args:
+        project_id (str): GCP project id
+
+    Returns:
+        bigquery_connector (BigQueryConnector): BigQuery Connector object
+    """
+    # Instance a BigQueryConnector object with a mocked client
+    with mock.patch.object(bigquery, "Client", autospec=True):
+        bigquery_connector = BigQueryConnector(
+            client_config=BQClientConfig(project_id=project_id), root_path=root_path
+        )
+
+    return bigquery_connector
+
+
 @pytest.fixture
 def fixture_bigquery_read_query_config(
     query_config: dict = config["bigquery"]["read_query_config"],
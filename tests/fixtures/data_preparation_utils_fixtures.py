@@ -18,6 +18,7 @@ from data_grimorium.data_preparation.data_preparation_types import (
     EncodingTextConfig,
     DateExtractionConfig,
     NumericalFeaturesConfig,
+    ParallelPreparationConfig,
 )
 
 # Retrieve the root path
@@ -184,3 +185,20 @@ def fixture_numerical_features_config(
         (NumericalFeaturesConfig): Object including numerical feature transformation configurations
     """
     return NumericalFeaturesConfig(**numerical_features_config)
+
+
+@pytest.fixture
+def fixture_parallel_preparation_config(
+    parallel_preparation_config: dict = config["data_preparation"]["parallel_preparation_config"],
+) -> ParallelPreparationConfig:
+    """
+    Fixture for a ParallelPreparationConfig object
+    from src/data_grimorium/data_preparation/data_preparation_types.ParallelPreparationConfig class definition.
+
+    Args:
+        parallel_preparation_config (Dictionary): Process pool configurations
+
+    Returns:
+        (ParallelPreparationConfig): Object including process pool configurations
+    """
+    return ParallelPreparationConfig(**parallel_preparation_config)
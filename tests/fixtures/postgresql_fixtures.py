@@ -5,14 +5,21 @@ The module includes Fixtures related to the module "postgresql_connector".
 # Import Standard Libraries
 import os
 import pathlib
+import psycopg2
 import pytest
 from dynaconf import Dynaconf
 
 # Import Package Modules
 from data_grimorium.postgresql_connector.postgresql_types import (
     PostgreSQLClientConfig,
+    PostgreSQLMetadataCacheConfig,
+    PostgreSQLPartitionConfig,
     PostgreSQLQueryConfig,
+    PostgreSQLPoolConfig,
+    PostgreSQLStatementCacheConfig,
+    PostgreSQLStreamConfig,
 )
+from data_grimorium.postgresql_connector.postgresql_async_connector import AsyncPostgreSQLConnector
 from data_grimorium.postgresql_connector.postgresql_connector import PostgreSQLConnector
 
 
@@ -44,20 +51,153 @@ def fixture_postgresql_client_config(
     return PostgreSQLClientConfig(**client_config)
 
 
+@pytest.fixture
+def fixture_postgresql_pool_config(
+    pool_config: dict = config["postgresql"]["pool_config"],
+) -> PostgreSQLPoolConfig:
+    """
+    Fixture for a PostgreSQLPoolConfig object
+    from src/postgresql_connector/postgresql_types.py.
+
+    Args:
+        pool_config (Dictionary): Configurations for a PostgreSQLPoolConfig object.
+
+    Returns:
+        (PostgreSQLPoolConfig): Object of PostgreSQL connection pool configurations
+    """
+    return PostgreSQLPoolConfig(**pool_config)
+
+
+@pytest.fixture
+def fixture_postgresql_metadata_cache_config(
+    metadata_cache_config: dict = config["postgresql"]["metadata_cache_config"],
+) -> PostgreSQLMetadataCacheConfig:
+    """
+    Fixture for a PostgreSQLMetadataCacheConfig object
+    from src/postgresql_connector/postgresql_types.py.
+
+    Args:
+        metadata_cache_config (Dictionary): Configurations for a PostgreSQLMetadataCacheConfig object.
+
+    Returns:
+        (PostgreSQLMetadataCacheConfig): Object of PostgreSQL metadata cache configurations
+    """
+    return PostgreSQLMetadataCacheConfig(**metadata_cache_config)
+
+
+@pytest.fixture
+def fixture_postgresql_statement_cache_config(
+    statement_cache_config: dict = config["postgresql"]["statement_cache_config"],
+) -> PostgreSQLStatementCacheConfig:
+    """
+    Fixture for a PostgreSQLStatementCacheConfig object
+    from src/postgresql_connector/postgresql_types.py.
+
+    Args:
+        statement_cache_config (Dictionary): Configurations for a PostgreSQLStatementCacheConfig object.
+
+    Returns:
+        (PostgreSQLStatementCacheConfig): Object of PostgreSQL statement cache configurations
+    """
+    return PostgreSQLStatementCacheConfig(**statement_cache_config)
+
+
 @pytest.fixture
 def fixture_postgresql_connector(
     fixture_postgresql_client_config: PostgreSQLClientConfig,
+    fixture_postgresql_pool_config: PostgreSQLPoolConfig,
+    fixture_postgresql_metadata_cache_config: PostgreSQLMetadataCacheConfig,
+    fixture_postgresql_statement_cache_config: PostgreSQLStatementCacheConfig,
 ) -> PostgreSQLConnector:
     """
     Fixture for a PostgreSQLConnector object in order to connect to a PostgreSQL Database.
 
     Args:
         fixture_postgresql_client_config (PostgreSQLClientConfig): Client configurations.
+        fixture_postgresql_pool_config (PostgreSQLPoolConfig): Connection pool configurations.
+        fixture_postgresql_metadata_cache_config (PostgreSQLMetadataCacheConfig): Metadata cache configurations.
+        fixture_postgresql_statement_cache_config (PostgreSQLStatementCacheConfig): Statement cache configurations.
 
     Returns:
         (PostgreSQLConnector): Object of PostgreSQL Connector
     """
-    return PostgreSQLConnector(client_config=fixture_postgresql_client_config, root_path=root_path)
+    connector = PostgreSQLConnector(
+        client_config=fixture_postgresql_client_config,
+        root_path=root_path,
+        pool_config=fixture_postgresql_pool_config,
+        metadata_cache_config=fixture_postgresql_metadata_cache_config,
+        statement_cache_config=fixture_postgresql_statement_cache_config,
+    )
+
+    yield connector
+
+    # Close the pooled connections
+    connector.close()
+
+
+@pytest.fixture
+def fixture_postgresql_read_only_connector(
+    fixture_postgresql_client_config: PostgreSQLClientConfig,
+    fixture_postgresql_pool_config: PostgreSQLPoolConfig,
+) -> PostgreSQLConnector:
+    """
+    Fixture for a PostgreSQLConnector object logged in with a read-only role,
+    which lacks the CREATE privilege on the database.
+
+    Args:
+        fixture_postgresql_client_config (PostgreSQLClientConfig): Client configurations.
+        fixture_postgresql_pool_config (PostgreSQLPoolConfig): Connection pool configurations.
+
+    Returns:
+        (PostgreSQLConnector): Object of PostgreSQL Connector with a read-only role
+    """
+    role, password = "test_read_only_user", "read_only"
+
+    # Create the read-only role
+    conn = psycopg2.connect(**fixture_postgresql_client_config.model_dump())
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f"DROP ROLE IF EXISTS {role}")
+        cur.execute(f"CREATE ROLE {role} LOGIN PASSWORD %s IN ROLE pg_read_all_data", (password,))
+
+    connector = PostgreSQLConnector(
+        client_config=fixture_postgresql_client_config.model_copy(
+            update={"user": role, "password": password}
+        ),
+        root_path=root_path,
+        pool_config=fixture_postgresql_pool_config,
+    )
+
+    yield connector
+
+    # Close the pooled connections and drop the role
+    connector.close()
+    with conn.cursor() as cur:
+        cur.execute(f"DROP ROLE {role}")
+    conn.close()
+
+
+@pytest.fixture
+def fixture_async_postgresql_connector(
+    fixture_postgresql_client_config: PostgreSQLClientConfig,
+    fixture_postgresql_pool_config: PostgreSQLPoolConfig,
+) -> AsyncPostgreSQLConnector:
+    """
+    Fixture for an AsyncPostgreSQLConnector object in order to connect to a PostgreSQL Database.
+    The pool is opened and closed within the event loop of each test.
+
+    Args:
+        fixture_postgresql_client_config (PostgreSQLClientConfig): Client configurations.
+        fixture_postgresql_pool_config (PostgreSQLPoolConfig): Connection pool configurations.
+
+    Returns:
+        (AsyncPostgreSQLConnector): Object of async PostgreSQL Connector
+    """
+    return AsyncPostgreSQLConnector(
+        client_config=fixture_postgresql_client_config,
+        root_path=root_path,
+        pool_config=fixture_postgresql_pool_config,
+    )
 
 
 @pytest.fixture
@@ -122,3 +262,133 @@ def fixture_postgresql_select_query(
         (PostgreSQLQueryConfig): PostgreSQL query configuration object.
     """
     return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_batch_insert_query(
+    query_config=config["postgresql"]["batch_insert_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to insert a batch of values into a table.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_batch_update_query(
+    query_config=config["postgresql"]["batch_update_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to update a batch of values in a table.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_batch_select_query(
+    query_config=config["postgresql"]["batch_select_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to select a batch of values in a table.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_stream_query(
+    query_config=config["postgresql"]["stream_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to stream a generated series of rows.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_typed_query(
+    query_config=config["postgresql"]["typed_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to select columns of several types.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_stream_config(
+    stream_config: dict = config["postgresql"]["stream_config"],
+) -> PostgreSQLStreamConfig:
+    """
+    Fixture for a PostgreSQLStreamConfig object
+    from src/postgresql_connector/postgresql_types.py.
+
+    Args:
+        stream_config (Dictionary): Configurations for a PostgreSQLStreamConfig object.
+
+    Returns:
+        (PostgreSQLStreamConfig): Object of PostgreSQL streaming configurations
+    """
+    return PostgreSQLStreamConfig(**stream_config)
+
+
+@pytest.fixture
+def fixture_postgresql_partition_query(
+    query_config=config["postgresql"]["partition_query_config"],
+) -> PostgreSQLQueryConfig:
+    """
+    Fixture for a PostgreSQLQueryConfig object in order to read a table in partitions.
+
+    Args:
+        query_config (PostgreSQLQueryConfig): Query configurations.
+
+    Returns:
+        (PostgreSQLQueryConfig): PostgreSQL query configuration object.
+    """
+    return PostgreSQLQueryConfig(**query_config.to_dict())
+
+
+@pytest.fixture
+def fixture_postgresql_partition_config(
+    partition_config: dict = config["postgresql"]["partition_config"],
+) -> PostgreSQLPartitionConfig:
+    """
+    Fixture for a PostgreSQLPartitionConfig object
+    from src/postgresql_connector/postgresql_types.py.
+
+    Args:
+        partition_config (Dictionary): Configurations for a PostgreSQLPartitionConfig object.
+
+    Returns:
+        (PostgreSQLPartitionConfig): Object of PostgreSQL partitioned read configurations
+    """
+    return PostgreSQLPartitionConfig(**partition_config)
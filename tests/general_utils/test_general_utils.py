@@ -7,9 +7,12 @@ module src.general_utils.general_utils
 import os
 import pathlib
 import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Import Package Modules
-from src.data_grimorium.general_utils.general_utils import read_file_from_path
+from src.data_grimorium.general_utils.general_utils import read_file_from_path, write_parquet_chunks
+from src.data_grimorium.general_utils.general_utils_types import ParquetSpillConfig
 
 # Retrieve root path
 root_path = pathlib.Path(os.getenv("DATA_GRIMORIUM_ROOT_PATH"))
@@ -63,3 +66,125 @@ def test_read_file_from_path_exceptions(
 
     with pytest.raises(expected_exception):
         read_file_from_path(input_path, root_path)
+
+
+@pytest.mark.parametrize(
+    "input_chunks, spill_config, expected_files",
+    [
+        (
+            [
+                pa.table({"row_id": [1, 2, 3], "country": ["IT", "FR", None]}),
+                pa.record_batch({"row_id": [4, 5], "country": ["IT", "IT"]}),
+            ],
+            ParquetSpillConfig(row_group_size=2, compression="zstd"),
+            {"part-00000.parquet": 3},
+        ),
+        (
+            [
+                pa.table({"row_id": [1, 2, 3], "country": ["IT", "FR", None]}),
+                pa.record_batch({"row_id": [4, 5], "country": ["IT", "IT"]}),
+            ],
+            ParquetSpillConfig(row_group_size=2, partition_columns=["country"], compression="zstd"),
+            {
+                "country=IT/part-00000.parquet": 2,
+                "country=FR/part-00000.parquet": 1,
+                "country=__HIVE_DEFAULT_PARTITION__/part-00000.parquet": 1,
+            },
+        ),
+    ],
+)
+def test_write_parquet_chunks(
+    input_chunks: list,
+    spill_config: ParquetSpillConfig,
+    expected_files: dict,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function src/data_grimorium/general_utils/general_utils.write_parquet_chunks
+    by writing Arrow chunks with and without partition columns and reading them back
+
+    Args:
+        input_chunks (list): Arrow chunks to write
+        spill_config (ParquetSpillConfig): Row group size, partitioning and compression
+        expected_files (dict): Expected number of row groups by written file
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset
+    """
+    # Write the chunks
+    handle = write_parquet_chunks(input_chunks, tmp_path, spill_config)
+
+    # Read the written files
+    row_groups = {file: pq.ParquetFile(tmp_path / file).num_row_groups for file in handle.files}
+    compression = pq.ParquetFile(tmp_path / handle.files[0]).metadata.row_group(0).column(0)
+
+    assert handle.rows == 5
+    assert handle.columns == {"row_id": "int64", "country": "string"}
+    assert row_groups == expected_files
+    assert compression.compression == "ZSTD"
+    assert sorted(handle.read()["row_id"]) == [1, 2, 3, 4, 5]
+
+
+def test_write_parquet_chunks_promote_schema(tmp_path: pathlib.Path) -> bool:
+    """
+    Test the function src/data_grimorium/general_utils/general_utils.write_parquet_chunks
+    by writing a first chunk with a column of NULL values, then rewriting the same directory
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset
+    """
+    spill_config = ParquetSpillConfig(partition_columns=["country"])
+
+    # The score column has the null type in the first chunk
+    chunks = [
+        pa.table({"country": ["IT", "FR"], "score": [None, None]}),
+        pa.table({"country": ["IT", "DE"], "score": [0.5, 1.5]}),
+    ]
+    handle = write_parquet_chunks(chunks, tmp_path, spill_config)
+    data = handle.read().sort_values("score", ignore_index=True)
+
+    assert handle.columns == {"country": "string", "score": "double"}
+    assert sorted(handle.files) == [
+        "country=DE/part-00000.parquet",
+        "country=FR/part-00000.parquet",
+        "country=IT/part-00000.parquet",
+        "country=IT/part-00001.parquet",
+    ]
+    assert data["score"].tolist()[:2] == [0.5, 1.5] and data["score"].isna().sum() == 2
+
+    # Rewrite the directory with a single partition
+    handle = write_parquet_chunks(
+        [pa.table({"country": ["DE"], "score": [2.0]})], tmp_path, spill_config
+    )
+
+    assert handle.rows == 1
+    assert handle.read()["score"].tolist() == [2.0]
+
+
+@pytest.mark.parametrize(
+    "input_chunks, spill_config, expected_exception",
+    [
+        (
+            [pa.table({"row_id": [1, 2, 3]})],
+            ParquetSpillConfig(partition_columns=["country"]),
+            ValueError,
+        )
+    ],
+)
+def test_write_parquet_chunks_exceptions(
+    input_chunks: list,
+    spill_config: ParquetSpillConfig,
+    expected_exception: Exception,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the exceptions to the function
+    src/data_grimorium/general_utils/general_utils.write_parquet_chunks
+
+    Args:
+        input_chunks (list): Arrow chunks to write
+        spill_config (ParquetSpillConfig): Partitioning on a missing column
+        expected_exception (Exception): Instance of triggered exception
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset
+    """
+
+    with pytest.raises(expected_exception):
+        write_parquet_chunks(input_chunks, tmp_path, spill_config)
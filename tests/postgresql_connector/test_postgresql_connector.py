@@ -4,17 +4,37 @@ module src.postgresql_connector.
 """
 
 # Import Standard Libraries
+import asyncio
+import datetime
 import os
 import pathlib
 import pytest
+import psycopg
 import psycopg2
 import time
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+from decimal import Decimal
 from dynaconf import Dynaconf
 from types import ModuleType
+from typing import Any
+from unittest import mock
 
 # Import Package Modules
+from data_grimorium.general_utils.general_utils_types import ParquetSpillConfig
+from data_grimorium.postgresql_connector import postgresql_connector
+from data_grimorium.postgresql_connector.postgresql_async_connector import AsyncPostgreSQLConnector
 from data_grimorium.postgresql_connector.postgresql_connector import PostgreSQLConnector
+from data_grimorium.postgresql_connector.postgresql_types import (
+    ChunkFormat,
+    EmbeddingStorage,
+    PostgreSQLPartitionConfig,
+    PostgreSQLProfilingConfig,
+    PostgreSQLQueryConfig,
+    PostgreSQLStreamConfig,
+    UploadMethod,
+)
 
 # Retrieve the root path
 root_path = os.getenv("DATA_GRIMORIUM_ROOT_PATH")
@@ -83,6 +103,63 @@ def test_get_connection(
     assert connection.info.dbname == database_name
 
 
+@pytest.mark.parametrize(
+    "schema_name, expected_search_path",
+    [("test_data_layer", "test_data_layer"), (None, '"$user", public')],
+)
+def test_connection(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    schema_name: str,
+    expected_search_path: str,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector._connection
+    by checking the search_path of a pooled connection reused across schemas.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector
+        schema_name (str): Name of the schema to use
+        expected_search_path (str): Expected search_path
+    """
+    # Use the pooled connection with another schema first
+    with fixture_postgresql_connector._connection(schema="public"):
+        pass
+
+    with fixture_postgresql_connector._connection(schema=schema_name) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SHOW search_path")
+            search_path = cur.fetchone()[0]
+
+    assert search_path == expected_search_path
+
+
+@pytest.mark.parametrize("n_queries, expected_created", [(3, 1)])
+def test_pool_metrics(
+    fixture_postgresql_connector: PostgreSQLConnector, n_queries: int, expected_created: int
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.pool_metrics
+    by checking that the connections are reused across queries.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector
+        n_queries (int): Number of queries to execute
+        expected_created (int): Expected number of opened connections
+    """
+    # Check out a connection for each query
+    for _ in range(n_queries):
+        with fixture_postgresql_connector._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+
+    # Retrieve metrics
+    metrics = fixture_postgresql_connector.pool_metrics()
+
+    assert metrics.created == expected_created
+    assert metrics.checkouts == n_queries
+    assert metrics.in_use == 0
+
+
 @pytest.mark.parametrize(
     "schema_name, expected_output", [("test_data_layer", True), ("non_existent_data_layer", False)]
 )
@@ -255,3 +332,940 @@ def test_upload_dataframe_exceptions(
         fixture_postgresql_connector.upload_dataframe(
             data=input_data, table_name=input_table_name, replace=True
         )
+
+
+@pytest.mark.parametrize(
+    "input_data, input_table_name, expected_output",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "row_id": pd.array([1, 2, None], dtype="Int64"),
+                    "score": [1.5, None, -0.25],
+                    "display_name": ['A, "quoted"', "", None],
+                    "is_active": [True, False, True],
+                    "created_at": pd.to_datetime(
+                        ["2024-01-01 00:00:00", None, "2024-03-01 10:30:00"]
+                    ),
+                }
+            ),
+            "test_table_copy",
+            pd.DataFrame(
+                {
+                    "row_id": [1.0, 2.0, None],
+                    "score": [1.5, None, -0.25],
+                    "display_name": ['A, "quoted"', "", None],
+                    "is_active": [True, False, True],
+                    "created_at": pd.to_datetime(
+                        ["2024-01-01 00:00:00", None, "2024-03-01 10:30:00"]
+                    ),
+                }
+            ),
+        )
+    ],
+)
+def test_upload_dataframe_copy(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    input_data: pd.DataFrame,
+    input_table_name: str,
+    expected_output: pd.DataFrame,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.upload_dataframe
+    with the COPY method by reading back the uploaded rows.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        input_data (pd.DataFrame): Data to upload.
+        input_table_name (str): Name of the table.
+        expected_output (pd.DataFrame): Expected uploaded data.
+    """
+    # Upload data in chunks of two rows
+    result = fixture_postgresql_connector.upload_dataframe(
+        data=input_data,
+        table_name=input_table_name,
+        schema="test_data_layer",
+        replace=True,
+        method=UploadMethod.COPY,
+        chunk_size=2,
+    )
+
+    # Read the uploaded data
+    uploaded = pd.read_sql_query(
+        f"SELECT * FROM test_data_layer.{input_table_name}",
+        fixture_postgresql_connector._get_engine(),
+    )
+
+    assert result == len(input_data)
+    pd.testing.assert_frame_equal(
+        uploaded.sort_values("row_id").reset_index(drop=True),
+        expected_output.sort_values("row_id").reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "chunk_format, expected_chunk_sizes",
+    [
+        (ChunkFormat.PANDAS, [10, 10, 5]),
+        (ChunkFormat.ARROW, [10, 10, 5]),
+    ],
+)
+def test_stream_query_from_config(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_stream_query: PostgreSQLQueryConfig,
+    fixture_postgresql_stream_config: PostgreSQLStreamConfig,
+    chunk_format: ChunkFormat,
+    expected_chunk_sizes: list,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.stream_query_from_config
+    by checking the size and the content of the streamed chunks.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_stream_query (PostgreSQLQueryConfig): Query generating the rows.
+        fixture_postgresql_stream_config (PostgreSQLStreamConfig): Streaming configurations.
+        chunk_format (ChunkFormat): Format of the chunks.
+        expected_chunk_sizes (list): Expected number of rows of each chunk.
+    """
+    stream_config = fixture_postgresql_stream_config.model_copy(
+        update={"chunk_format": chunk_format}
+    )
+
+    # Stream the query
+    chunks = list(
+        fixture_postgresql_connector.stream_query_from_config(
+            fixture_postgresql_stream_query, stream_config
+        )
+    )
+
+    # Convert the chunks to pandas
+    if chunk_format == ChunkFormat.ARROW:
+        chunks = [chunk.to_pandas() for chunk in chunks]
+    data = pd.concat(chunks, ignore_index=True)
+
+    assert [len(chunk) for chunk in chunks] == expected_chunk_sizes
+    assert data["row_id"].tolist() == list(range(1, 26))
+    assert data["display_name"].iloc[-1] == "name_25"
+    assert fixture_postgresql_connector.pool_metrics().in_use == 0
+
+
+@pytest.mark.parametrize(
+    "expected_dtypes, expected_arrow_types",
+    [
+        (
+            {
+                "row_id": "Int32",
+                "odd_id": "Int64",
+                "score": "float64",
+                "is_even": "boolean",
+                "created_at": "datetime64[ns]",
+                "updated_at": "datetime64[ns, UTC]",
+                "display_name": "object",
+            },
+            {
+                "row_id": "int32",
+                "odd_id": "int64",
+                "score": "double",
+                "is_even": "bool",
+                "created_at": "timestamp[us]",
+                "updated_at": "timestamp[us, tz=UTC]",
+                "display_name": "string",
+            },
+        )
+    ],
+)
+def test_typed_results(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_typed_query: PostgreSQLQueryConfig,
+    expected_dtypes: dict,
+    expected_arrow_types: dict,
+) -> bool:
+    """
+    Test the functions postgresql_connector/postgresql_connector.execute_query_from_config
+    and postgresql_connector/postgresql_connector.stream_query_from_config
+    by checking the column types built from the PostgreSQL type OIDs.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_typed_query (PostgreSQLQueryConfig): Query selecting several types.
+        expected_dtypes (dict): Expected pandas dtypes.
+        expected_arrow_types (dict): Expected Arrow types.
+    """
+    # Execute the query
+    result = fixture_postgresql_connector.execute_query_from_config(fixture_postgresql_typed_query)
+
+    # Stream the query as Arrow
+    table = next(
+        fixture_postgresql_connector.stream_query_from_config(
+            fixture_postgresql_typed_query, PostgreSQLStreamConfig(chunk_format=ChunkFormat.ARROW)
+        )
+    )
+
+    assert result.dtypes.astype(str).to_dict() == expected_dtypes
+    assert {field.name: str(field.type) for field in table.schema} == expected_arrow_types
+    assert result["odd_id"].isna().tolist() == [False, True, False, True]
+    assert table.num_rows == len(result)
+
+
+@pytest.mark.parametrize(
+    "input_data, input_table_name, expected_columns",
+    [
+        (
+            pd.DataFrame({"row_id": [1, 2], "display_name": ["A", "B"]}),
+            "test_table_metadata",
+            {"row_id": "bigint", "display_name": "text"},
+        )
+    ],
+)
+def test_metadata_cache(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    input_data: pd.DataFrame,
+    input_table_name: str,
+    expected_columns: dict,
+) -> bool:
+    """
+    Test the functions postgresql_connector/postgresql_connector.table_exists,
+    postgresql_connector/postgresql_connector.get_table_columns and
+    postgresql_connector/postgresql_connector.invalidate_metadata_cache
+    by checking the number of connection checkouts.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        input_data (pd.DataFrame): Data to upload.
+        input_table_name (str): Name of the table.
+        expected_columns (dict): Expected column types.
+    """
+    connector = fixture_postgresql_connector
+
+    # Upload the table
+    connector.upload_dataframe(
+        data=input_data,
+        table_name=input_table_name,
+        schema="test_data_layer",
+        replace=True,
+        method=UploadMethod.COPY,
+    )
+    checkouts = connector.pool_metrics().checkouts
+
+    # Look up the metadata twice
+    for _ in range(2):
+        assert connector.schema_exists("test_data_layer")
+        assert connector.table_exists(input_table_name, schema="test_data_layer")
+        assert connector.get_table_columns(input_table_name, "test_data_layer") == expected_columns
+
+    # The schema is cached by the upload, the table and the columns by the first look up
+    assert connector.pool_metrics().checkouts == checkouts + 2
+
+    # Drop the table and invalidate its metadata
+    with connector._connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP TABLE test_data_layer.{input_table_name}")
+    connector.invalidate_metadata_cache("test_data_layer", input_table_name)
+
+    assert not connector.table_exists(input_table_name, schema="test_data_layer")
+    assert connector.get_table_columns(input_table_name, "test_data_layer") == {}
+
+
+def test_read_only_role(
+    fixture_postgresql_read_only_connector: PostgreSQLConnector,
+    fixture_postgresql_stream_query: PostgreSQLQueryConfig,
+) -> bool:
+    """
+    Test the functions postgresql_connector/postgresql_connector.execute_query_from_config
+    and postgresql_connector/postgresql_async_connector.execute_queries_from_config
+    with a read-only role, which cannot run ``CREATE SCHEMA`` on existing schemas.
+
+    Args:
+        fixture_postgresql_read_only_connector (PostgreSQLConnector): PostgreSQL Connector with a read-only role.
+        fixture_postgresql_stream_query (PostgreSQLQueryConfig): Query configurations.
+    """
+    query_configs = [
+        fixture_postgresql_stream_query.model_copy(update={"schema": schema})
+        for schema in ["test_data_layer", "public"]
+    ]
+    n_rows = fixture_postgresql_stream_query.query_parameters["n_rows"]
+
+    for query_config in query_configs:
+        result = fixture_postgresql_read_only_connector.execute_query_from_config(query_config)
+
+        assert len(result) == n_rows
+
+    # Run the same queries through the async connector
+    async_connector = AsyncPostgreSQLConnector(
+        client_config=fixture_postgresql_read_only_connector._client_config,
+        root_path=fixture_postgresql_read_only_connector._root_path,
+    )
+
+    async def run() -> list:
+        try:
+            return await async_connector.execute_queries_from_config(query_configs)
+        finally:
+            await async_connector.close()
+
+    assert [len(result) for result in asyncio.run(run())] == [n_rows, n_rows]
+
+
+@pytest.mark.parametrize(
+    "n_rows, page_size, single_transaction",
+    [(25, 10, True), (7, 3, False)],
+)
+def test_execute_many_from_config(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_batch_insert_query: PostgreSQLQueryConfig,
+    fixture_postgresql_batch_update_query: PostgreSQLQueryConfig,
+    fixture_postgresql_batch_select_query: PostgreSQLQueryConfig,
+    n_rows: int,
+    page_size: int,
+    single_transaction: bool,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.execute_many_from_config
+    by inserting, updating (one batch per page) and selecting batches of rows.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_batch_insert_query (PostgreSQLQueryConfig): Single-row INSERT query.
+        fixture_postgresql_batch_update_query (PostgreSQLQueryConfig): UPDATE query.
+        fixture_postgresql_batch_select_query (PostgreSQLQueryConfig): SELECT query.
+        n_rows (int): Number of parameter sets.
+        page_size (int): Number of parameter sets per page.
+        single_transaction (bool): Flag to commit once at the end.
+    """
+    connector = fixture_postgresql_connector
+
+    # Create an empty table
+    connector.upload_dataframe(
+        data=pd.DataFrame({"row_id": [0], "display_name": ["seed"]}),
+        table_name="test_table_batch",
+        schema="test_data_layer",
+        replace=True,
+        method=UploadMethod.COPY,
+    )
+
+    parameters = [{"row_id": i, "display_name": f"name_{i}"} for i in range(1, n_rows + 1)]
+
+    # Insert, update and select the rows
+    inserted = connector.execute_many_from_config(
+        fixture_postgresql_batch_insert_query, parameters, page_size, single_transaction
+    )
+    with mock.patch.object(
+        postgresql_connector, "execute_batch", wraps=postgresql_connector.execute_batch
+    ) as execute_batch:
+        updated = connector.execute_many_from_config(
+            fixture_postgresql_batch_update_query,
+            [{"row_id": row["row_id"], "display_name": "updated"} for row in parameters[::2]],
+            page_size,
+            single_transaction,
+        )
+    result = connector.execute_many_from_config(
+        fixture_postgresql_batch_select_query, parameters, page_size, single_transaction
+    )
+
+    assert inserted == n_rows
+    assert updated == len(parameters[::2])
+    assert execute_batch.call_count == -(-len(parameters[::2]) // page_size)
+    assert result["row_id"].tolist() == list(range(1, n_rows + 1))
+    assert (result["display_name"] == "updated").sum() == len(parameters[::2])
+
+
+@pytest.mark.parametrize(
+    "initial_data, delta_data, expected_output, expected_data",
+    [
+        (
+            pd.DataFrame({"row_id": [1, 2, 3], "display_name": ["A", "B", "C"]}),
+            pd.DataFrame({"row_id": [3, 4, 2, 4], "display_name": ["C2", "D", "B2", "D2"]}),
+            {"inserted": 1, "updated": 2},
+            pd.DataFrame({"row_id": [1, 2, 3, 4], "display_name": ["A", "B2", "C2", "D2"]}),
+        )
+    ],
+)
+def test_upsert_dataframe(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    initial_data: pd.DataFrame,
+    delta_data: pd.DataFrame,
+    expected_output: dict,
+    expected_data: pd.DataFrame,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.upsert_dataframe
+    by creating a table in a new schema and merging a delta with duplicated keys into it.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        initial_data (pd.DataFrame): Data initially in the table.
+        delta_data (pd.DataFrame): Data to upsert.
+        expected_output (dict): Expected inserted and updated counts.
+        expected_data (pd.DataFrame): Expected data in the table.
+    """
+    connector = fixture_postgresql_connector
+
+    # Create the schema and the table with a primary key
+    with connector._connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DROP SCHEMA IF EXISTS test_upsert_layer CASCADE")
+    connector.invalidate_metadata_cache("test_upsert_layer")
+    connector.upsert_dataframe(initial_data, "test_table_upsert", ["row_id"], "test_upsert_layer")
+
+    # Upsert the delta
+    result = connector.upsert_dataframe(
+        delta_data, "test_table_upsert", ["row_id"], "test_upsert_layer", chunk_size=2
+    )
+
+    # Read the table
+    uploaded = pd.read_sql_query(
+        "SELECT * FROM test_upsert_layer.test_table_upsert ORDER BY row_id",
+        connector._get_engine(),
+    )
+
+    assert result.as_dict() == expected_output
+    pd.testing.assert_frame_equal(uploaded, expected_data)
+
+
+@pytest.mark.parametrize(
+    "query, expected_statement",
+    [
+        ("/* Header */\nSELECT 1; -- Trailing comment\n", "SELECT 1"),
+        ("SELECT * FROM t WHERE note = 'a--b' -- Comment", "SELECT * FROM t WHERE note = 'a--b'"),
+        ('SELECT "a/*b*/c" FROM t;', 'SELECT "a/*b*/c" FROM t'),
+        (
+            "SELECT $tag$ -- $$ $tag$, E'it\\'s -- a' /* Comment */",
+            "SELECT $tag$ -- $$ $tag$, E'it\\'s -- a'",
+        ),
+    ],
+)
+def test_strip_statement(query: str, expected_statement: str) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector._strip_statement
+    by checking comments are removed outside of the quoted literals and identifiers only.
+
+    Args:
+        query (str): SQL query.
+        expected_statement (str): Expected stripped statement.
+    """
+    assert PostgreSQLConnector._strip_statement(query) == expected_statement
+
+
+@pytest.mark.parametrize(
+    "lower, upper, n_partitions",
+    [
+        (
+            datetime.datetime(2024, 1, 1, 0, 0, 0, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2024, 3, 7, 12, 25, 56, 14165, tzinfo=datetime.timezone.utc),
+            7,
+        ),
+        (datetime.date(2024, 1, 1), datetime.date(2024, 1, 3), 4),
+        (Decimal("0.000001"), Decimal("12345678.123457"), 3),
+        (1, 50, 4),
+        (0.1, 0.7, 3),
+    ],
+)
+def test_partition_bounds(lower: Any, upper: Any, n_partitions: int) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector._partition_bounds
+    by checking the bounds keep the range exactly and do not decrease.
+
+    Args:
+        lower (Any): Minimum value of the column.
+        upper (Any): Maximum value of the column.
+        n_partitions (int): Number of partitions.
+    """
+    bounds = PostgreSQLConnector._partition_bounds(lower, upper, n_partitions)
+
+    assert len(bounds) == n_partitions + 1
+    assert bounds[0] == lower and bounds[-1] == upper
+    assert all(bound_a <= bound_b for bound_a, bound_b in zip(bounds, bounds[1:]))
+    assert all(type(bound) is type(lower) for bound in bounds)
+
+
+@pytest.mark.parametrize(
+    "partition_column, to_parquet",
+    [("row_id", False), ("created_at", False), ("row_id", True)],
+)
+def test_read_partitioned_from_config(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_partition_query: PostgreSQLQueryConfig,
+    fixture_postgresql_partition_config: PostgreSQLPartitionConfig,
+    partition_column: str,
+    to_parquet: bool,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.read_partitioned_from_config
+    by comparing the partitioned read with the table, including a NULL partition value,
+    a "%" in the query and the partitions of a previous read.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_partition_query (PostgreSQLQueryConfig): Query reading the table.
+        fixture_postgresql_partition_config (PostgreSQLPartitionConfig): Partitioning configurations.
+        partition_column (str): Column used to split the query.
+        to_parquet (bool): Flag to write the partitions as a Parquet dataset.
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset.
+    """
+    # Upload the table
+    data = pd.DataFrame(
+        {
+            "row_id": pd.array([*range(1, 50), None], dtype="Int64"),
+            "created_at": pd.date_range("2024-01-01", periods=50, freq="h"),
+            "display_name": [f"name_{i}" for i in range(50)],
+        }
+    )
+    fixture_postgresql_connector.upload_dataframe(
+        data=data,
+        table_name="test_table_partition",
+        schema="test_data_layer",
+        replace=True,
+        method=UploadMethod.COPY,
+    )
+
+    query_config = fixture_postgresql_partition_query.model_copy(
+        update={"local_path": str(tmp_path) if to_parquet else None}
+    )
+    partition_config = fixture_postgresql_partition_config.model_copy(
+        update={"partition_column": partition_column}
+    )
+
+    # A partition left by a previous read
+    if to_parquet:
+        data.head(1).to_parquet(tmp_path / "part-00099.parquet")
+
+    # Read the partitions
+    result = fixture_postgresql_connector.read_partitioned_from_config(
+        query_config, partition_config, PostgreSQLStreamConfig(itersize=5)
+    )
+    if to_parquet:
+        assert not (tmp_path / "part-00099.parquet").exists()
+        assert len(list(result.glob("*.parquet"))) == partition_config.n_partitions
+        result = pd.read_parquet(result)
+
+    # The ordered partitions are combined in order (NULL values last in the first partition)
+    assert result[partition_column].dropna().is_monotonic_increasing
+    pd.testing.assert_series_equal(
+        result.sort_values("created_at", ignore_index=True)["display_name"],
+        data["display_name"],
+    )
+
+
+@pytest.mark.parametrize(
+    "input_data, input_table_name, expected_rows",
+    [
+        (
+            pd.DataFrame({"row_id": [1, 2, 3], "display_name": ["A", None, "C"]}),
+            "test_table_async",
+            [25, 4],
+        )
+    ],
+)
+def test_async_connector(
+    fixture_async_postgresql_connector: AsyncPostgreSQLConnector,
+    fixture_postgresql_stream_query: PostgreSQLQueryConfig,
+    fixture_postgresql_typed_query: PostgreSQLQueryConfig,
+    input_data: pd.DataFrame,
+    input_table_name: str,
+    expected_rows: list,
+) -> bool:
+    """
+    Test the class postgresql_connector/postgresql_async_connector.AsyncPostgreSQLConnector
+    by uploading a table and executing queries in pipeline mode.
+
+    Args:
+        fixture_async_postgresql_connector (AsyncPostgreSQLConnector): Async PostgreSQL Connector.
+        fixture_postgresql_stream_query (PostgreSQLQueryConfig): Query generating rows.
+        fixture_postgresql_typed_query (PostgreSQLQueryConfig): Query selecting several types.
+        input_data (pd.DataFrame): Data to upload.
+        input_table_name (str): Name of the table.
+        expected_rows (list): Expected number of rows of each query.
+    """
+    connector = fixture_async_postgresql_connector
+
+    async def run() -> tuple:
+        try:
+            uploaded = await connector.upload_dataframe(
+                input_data, input_table_name, schema="test_data_layer", replace=True
+            )
+            exists = await asyncio.gather(
+                connector.schema_exists("test_data_layer"),
+                connector.table_exists(input_table_name, schema="test_data_layer"),
+                connector.table_exists(input_table_name, schema="public"),
+            )
+            results = await connector.execute_queries_from_config(
+                [fixture_postgresql_stream_query, fixture_postgresql_typed_query]
+            )
+            metrics = await connector.pool_metrics()
+        finally:
+            await connector.close()
+
+        return uploaded, exists, results, metrics
+
+    uploaded, exists, results, metrics = asyncio.run(run())
+
+    assert uploaded == len(input_data)
+    assert exists == [True, True, False]
+    assert [len(result) for result in results] == expected_rows
+    assert results[1]["row_id"].dtype == "Int32"
+    assert metrics.in_use == 0
+
+
+@pytest.mark.parametrize(
+    "queries, expected_error",
+    [
+        (
+            {
+                "SET LOCAL statement_timeout = %(timeout)s": {"timeout": "5s"},
+                "CREATE TABLE test_table_async_ddl (row_id int DEFAULT %(row_id)s)": {"row_id": 1},
+                "SELECT current_setting('statement_timeout') AS timeout": {},
+            },
+            None,
+        ),
+        (
+            {
+                "CREATE TABLE test_table_async_ddl (row_id int DEFAULT %(row_id)s)": {"row_id": 1},
+                "SELECT 1; SELECT 2": {},
+            },
+            psycopg.Error,
+        ),
+    ],
+)
+def test_async_execute_queries_from_config(
+    fixture_async_postgresql_connector: AsyncPostgreSQLConnector,
+    queries: dict,
+    expected_error: type | None,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_async_connector.execute_queries_from_config
+    by binding parameters in SET and DDL statements and by checking that a failing query
+    (multiple statements in a SQL file) rolls back the whole pipeline.
+
+    Args:
+        fixture_async_postgresql_connector (AsyncPostgreSQLConnector): Async PostgreSQL Connector.
+        queries (dict): SQL statements and their parameters.
+        expected_error (type | None): Expected error (None if the queries succeed).
+        tmp_path (pathlib.Path): Temporary directory of the SQL files.
+    """
+    connector = fixture_async_postgresql_connector
+
+    # Write the SQL files, starting from a dropped table
+    query_configs = []
+    queries = {"DROP TABLE IF EXISTS test_table_async_ddl": {}} | queries
+    for index, (query, query_parameters) in enumerate(queries.items()):
+        query_path = tmp_path / f"test_query_{index}.sql"
+        query_path.write_text(query)
+        query_configs.append(
+            PostgreSQLQueryConfig(
+                query_path=query_path.as_posix(),
+                schema="test_data_layer",
+                query_parameters=query_parameters,
+            )
+        )
+
+    async def run() -> tuple:
+        try:
+            await connector.execute_query_from_config(query_configs[0])
+            if expected_error is None:
+                results = await connector.execute_queries_from_config(query_configs[1:])
+            else:
+                with pytest.raises(expected_error):
+                    await connector.execute_queries_from_config(query_configs[1:])
+                results = None
+            exists = await connector.table_exists("test_table_async_ddl", schema="test_data_layer")
+        finally:
+            await connector.close()
+
+        return results, exists
+
+    results, exists = asyncio.run(run())
+
+    if expected_error is None:
+        assert results[:2] == [True, True]
+        assert results[2]["timeout"].tolist() == ["5s"]
+    assert exists is (expected_error is None)
+
+
+@pytest.mark.parametrize(
+    "n_executions, expected_metrics",
+    [
+        (
+            4,
+            {
+                "sql_file_hits": 2,
+                "sql_file_misses": 2,
+                "prepared_statements": 1,
+                "prepared_hits": 2,
+            },
+        )
+    ],
+)
+def test_statement_cache(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_typed_query: PostgreSQLQueryConfig,
+    n_executions: int,
+    expected_metrics: dict,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.statement_cache_metrics
+    by executing a query several times and modifying its SQL file.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_typed_query (PostgreSQLQueryConfig): Query selecting several types.
+        n_executions (int): Number of executions of the query.
+        expected_metrics (dict): Expected statement cache metrics.
+        tmp_path (pathlib.Path): Temporary directory of the SQL file.
+    """
+    # Copy the SQL file
+    query_path = tmp_path / "test_typed_query.sql"
+    query = (pathlib.Path(root_path) / fixture_postgresql_typed_query.query_path).read_text()
+    query_path.write_text(query)
+    query_config = fixture_postgresql_typed_query.model_copy(
+        update={"query_path": query_path.as_posix()}
+    )
+
+    # Execute the query, modifying the SQL file halfway
+    results = []
+    for execution in range(n_executions):
+        if execution == n_executions // 2:
+            query_path.write_text(query)
+            os.utime(query_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        results.append(fixture_postgresql_connector.execute_query_from_config(query_config))
+
+    # Retrieve the statements prepared on the pooled connection
+    with fixture_postgresql_connector._connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM pg_prepared_statements")
+            n_prepared = cur.fetchone()[0]
+
+    metrics = fixture_postgresql_connector.statement_cache_metrics().as_dict()
+    metrics.pop("saved_seconds")
+
+    assert metrics == expected_metrics
+    assert n_prepared == expected_metrics["prepared_statements"]
+    for result in results[1:]:
+        pd.testing.assert_frame_equal(result, results[0])
+
+
+def test_statement_cache_prepare_failure(fixture_postgresql_connector: PostgreSQLConnector) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector._execute
+    by checking a failed PREPARE keeps the earlier writes of the transaction.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+    """
+    connector = fixture_postgresql_connector
+    threshold = connector._statement_cache_config.prepare_threshold
+
+    with connector._connection() as conn:
+        with conn.cursor() as cur:
+            # Write a row within the transaction
+            cur.execute("CREATE TEMPORARY TABLE test_table_prepare (row_id int) ON COMMIT DROP")
+            cur.execute("INSERT INTO test_table_prepare VALUES (1)")
+
+            # The type of the parameter cannot be determined by PREPARE
+            for _ in range(threshold):
+                connector._execute(cur, "SELECT %(value)s IS NULL AS value", {"value": 1}, None)
+                assert cur.fetchone()[0] is False
+
+            cur.execute("SELECT count(*) FROM test_table_prepare")
+            n_rows = cur.fetchone()[0]
+
+    assert ("SELECT %(value)s IS NULL AS value", None) in connector._unpreparable
+    assert n_rows == 1
+
+
+@pytest.mark.parametrize(
+    "fixture_name, explain, expected_plan",
+    [
+        ("fixture_postgresql_typed_query", True, True),
+        ("fixture_postgresql_typed_query", False, False),
+        ("fixture_postgresql_update_query", True, True),
+    ],
+)
+def test_query_profiles(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_name: str,
+    explain: bool,
+    expected_plan: bool,
+    request: pytest.FixtureRequest,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.query_profiles
+    by profiling queries with and without the query plan.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_name (str): Name of the fixture query to use.
+        explain (bool): Flag to capture the query plan.
+        expected_plan (bool): Flag indicating if a plan is expected.
+        request (FixtureRequest): Object to load the required fixture.
+        tmp_path (pathlib.Path): Temporary directory of the JSON-lines file.
+    """
+    # Load fixture
+    query_config = request.getfixturevalue(fixture_name)
+    profiling_config = PostgreSQLProfilingConfig(
+        explain=explain, output_path=(tmp_path / "profiles.jsonl").as_posix()
+    )
+
+    # Profile the query twice
+    for _ in range(2):
+        fixture_postgresql_connector.execute_query_from_config(query_config, profiling_config)
+
+    profiles = fixture_postgresql_connector.query_profiles()
+    lines = (tmp_path / "profiles.jsonl").read_text().splitlines()
+
+    assert len(profiles) == len(lines) == 2
+    assert (profiles["query_path"] == query_config.query_path).all()
+    assert (profiles["total_seconds"] >= profiles["execute_seconds"]).all()
+    assert profiles["plan"].notna().all() == expected_plan
+    if expected_plan:
+        assert "Plan" in profiles.loc[0, "plan"][0]
+
+
+@pytest.mark.parametrize(
+    "storage, expected_type",
+    [(EmbeddingStorage.REAL_ARRAY, "real[]"), (EmbeddingStorage.BYTEA, "bytea")],
+)
+@pytest.mark.parametrize(
+    "input_ids",
+    [
+        pd.DataFrame({"row_id": [3, 1, 2, 5, 4]}),
+        pd.DataFrame({"row_id": [3, 1, 2, 5, 4], "display_name": ["C", "A", "B", "É", "D"]}),
+    ],
+)
+def test_upload_embeddings(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    storage: EmbeddingStorage,
+    expected_type: str,
+    input_ids: pd.DataFrame,
+) -> bool:
+    """
+    Test the functions postgresql_connector/postgresql_connector.upload_embeddings
+    and postgresql_connector/postgresql_connector.read_embeddings by writing and reading
+    back a float32 embeddings matrix, and by rejecting duplicated ids.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        storage (EmbeddingStorage): Column type of the embeddings.
+        expected_type (str): Expected PostgreSQL type of the embeddings column.
+        input_ids (pd.DataFrame): Id columns of the embeddings.
+    """
+    embeddings = np.random.default_rng(0).standard_normal((5, 8), dtype=np.float32)
+
+    # Upload in chunks of two rows
+    result = fixture_postgresql_connector.upload_embeddings(
+        embeddings,
+        input_ids,
+        "test_table_embeddings",
+        schema="test_data_layer",
+        storage=storage,
+        replace=True,
+        chunk_size=2,
+    )
+
+    # Read back the embeddings ordered by id
+    ids, output = fixture_postgresql_connector.read_embeddings(
+        "test_table_embeddings", ["row_id"], schema="test_data_layer", storage=storage
+    )
+    columns = fixture_postgresql_connector.get_table_columns(
+        "test_table_embeddings", "test_data_layer"
+    )
+    order = np.argsort(input_ids["row_id"].to_numpy())
+
+    assert result == len(input_ids)
+    assert columns["embedding"] == expected_type
+    assert ids["row_id"].tolist() == [1, 2, 3, 4, 5]
+    assert output.dtype == np.float32
+    np.testing.assert_array_equal(output, embeddings[order])
+
+    # The ids and the vectors cannot be matched without a unique key
+    fixture_postgresql_connector.upload_embeddings(
+        embeddings[:2],
+        pd.DataFrame({"row_id": [1, 1]}),
+        "test_table_embeddings",
+        schema="test_data_layer",
+        storage=storage,
+        replace=True,
+    )
+    with pytest.raises(ValueError):
+        fixture_postgresql_connector.read_embeddings(
+            "test_table_embeddings", ["row_id"], schema="test_data_layer", storage=storage
+        )
+
+
+@pytest.mark.parametrize(
+    "fixture_name, partition_columns, expected_files, expected_row_groups",
+    [
+        ("fixture_postgresql_stream_query", None, ["part-00000.parquet"], 3),
+        (
+            "fixture_postgresql_typed_query",
+            ["is_even"],
+            ["is_even=false/part-00000.parquet", "is_even=true/part-00000.parquet"],
+            2,
+        ),
+    ],
+)
+def test_execute_query_to_parquet(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_name: str,
+    partition_columns: list,
+    expected_files: list,
+    expected_row_groups: int,
+    request: pytest.FixtureRequest,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.execute_query_from_config
+    by writing the result of a query with a ``local_path`` into Parquet files.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_name (str): Name of the fixture query to use.
+        partition_columns (list): Columns of the partition directories.
+        expected_files (list): Expected written files.
+        expected_row_groups (int): Expected total number of row groups.
+        request (FixtureRequest): Object to load the required fixture.
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset.
+    """
+    # Load fixture
+    query_config = request.getfixturevalue(fixture_name)
+
+    # Write the result in row groups of at most ten rows
+    handle = fixture_postgresql_connector.execute_query_from_config(
+        query_config.model_copy(update={"local_path": str(tmp_path)}),
+        spill_config=ParquetSpillConfig(row_group_size=10, partition_columns=partition_columns),
+    )
+    expected_data = fixture_postgresql_connector.execute_query_from_config(query_config)
+
+    row_groups = sum(pq.ParquetFile(tmp_path / file).num_row_groups for file in handle.files)
+
+    assert handle.rows == len(expected_data)
+    assert sorted(handle.files) == expected_files
+    assert list(handle.columns) == list(expected_data.columns)
+    assert row_groups == expected_row_groups
+    assert sorted(handle.read()["row_id"]) == expected_data["row_id"].tolist()
+
+
+def test_execute_query_to_parquet_not_select(
+    fixture_postgresql_connector: PostgreSQLConnector,
+    fixture_postgresql_insert_query: PostgreSQLQueryConfig,
+    tmp_path: pathlib.Path,
+) -> bool:
+    """
+    Test the function postgresql_connector/postgresql_connector.execute_query_from_config
+    by checking a statement that is not a SELECT cannot be written to a ``local_path``.
+
+    Args:
+        fixture_postgresql_connector (PostgreSQLConnector): PostgreSQL Connector.
+        fixture_postgresql_insert_query (PostgreSQLQueryConfig): Query inserting rows.
+        tmp_path (pathlib.Path): Temporary directory of the Parquet dataset.
+    """
+    with pytest.raises(ValueError):
+        fixture_postgresql_connector.execute_query_from_config(
+            fixture_postgresql_insert_query.model_copy(update={"local_path": str(tmp_path)})
+        )
+
+    assert not any(tmp_path.iterdir())